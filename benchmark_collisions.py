@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark json_to_pdf text layout passes (collisions, word spacing) on dense pages.
+
+Usage:
+    python benchmark_collisions.py [--elements N ...] [--repeat N]
+
+Arguments:
+    --elements N    Text elements per generated page (default: 1000 5000 10000)
+    --repeat N      Timed runs per size (default: 3, best run is reported)
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.stirling_sdg.stirling.local_client import LocalStirlingClient
+from src.stirling_sdg.utils.logging_utils import setup_logging
+
+PAGE_WIDTH = 612
+COLUMNS = 50
+ROW_PITCH = 7.5
+
+
+def generate_page_elements(count: int, seed: int = 0) -> list:
+    """Generate a dense tabular page: tightly packed cells that overlap their neighbours."""
+    rng = random.Random(seed)
+    elements = []
+    for index in range(count):
+        row, column = divmod(index, COLUMNS)
+        elements.append({
+            "text": f"{rng.randint(0, 99999)}",
+            "x": 10 + column * 11.5 + rng.uniform(-1, 1),
+            "y": 10 + row * ROW_PITCH + rng.uniform(-1, 1),
+            "width": rng.uniform(8, 14),
+            "height": 9,
+            "fontSize": rng.choice([7, 8, 9]),
+        })
+    return elements
+
+
+def run_benchmark(sizes: list, repeat: int):
+    """Time _resolve_text_collisions for each page size and print the scaling."""
+    client = LocalStirlingClient.__new__(LocalStirlingClient)
+
+    print(f"\n{'='*70}")
+    print(f"COLLISION RESOLUTION BENCHMARK (best of {repeat})")
+    print(f"{'='*70}")
+    print(f"{'elements':>10} {'time':>10} {'us/element':>12} {'moved':>8}")
+
+    for count in sizes:
+        elements = generate_page_elements(count)
+        # Tall enough that shifted rows are not all clamped to the bottom edge
+        page_height = max(792, 2 * ROW_PITCH * count / COLUMNS)
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            resolved = client._resolve_text_collisions(elements, PAGE_WIDTH, page_height)
+            timings.append(time.perf_counter() - start)
+
+        best = min(timings)
+        # resolved keeps the (y, x) reading order of the input
+        ordered = sorted(elements, key=lambda e: (e["y"], e["x"]))
+        moved = sum(
+            1 for before, after in zip(ordered, resolved)
+            if (before["x"], before["y"]) != (after["x"], after["y"])
+        )
+        print(f"{count:>10} {best:9.3f}s {best / count * 1e6:12.1f} {moved:>8}")
+
+    print(f"\n{'='*70}")
+    print(f"WORD SPACING BENCHMARK (best of {repeat})")
+    print(f"{'='*70}")
+    print(f"{'elements':>10} {'time':>10} {'us/element':>12} {'moved':>8}")
+
+    for count in sizes:
+        elements = generate_page_elements(count)
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            spaced = client._add_word_spacing(elements, PAGE_WIDTH)
+            timings.append(time.perf_counter() - start)
+
+        best = min(timings)
+        moved = sum(1 for before, after in zip(elements, spaced) if before["x"] != after["x"])
+        print(f"{count:>10} {best:9.3f}s {best / count * 1e6:12.1f} {moved:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark text collision resolution",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--elements", type=int, nargs="+", default=[1000, 5000, 10000],
+        help="Text elements per page",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per size")
+    args = parser.parse_args()
+
+    setup_logging(log_level="WARNING")
+    run_benchmark(args.elements, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Benchmark pdf_to_json extraction engines (pdfplumber vs PyMuPDF).
+
+Usage:
+    python benchmark_extraction.py <input_pdf> [--repeat N] [--workers N]
+    python benchmark_extraction.py --generate 200 [--repeat N]
+
+Arguments:
+    input_pdf       PDF to extract (omit when using --generate)
+    --generate N    Generate a dense N-page form PDF to benchmark instead
+    --repeat N      Timed runs per engine (default: 3, best run is reported)
+    --workers N     Extraction processes (default: 1)
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.stirling_sdg.stirling.local_client import EXTRACTION_ENGINES, LocalStirlingClient
+from src.stirling_sdg.utils.logging_utils import setup_logging
+
+
+def generate_form_pdf(output_path: Path, pages: int) -> Path:
+    """Generate a dense form-like PDF (labels, values, table lines, boxes)."""
+    from reportlab.pdfgen import canvas
+
+    c = canvas.Canvas(str(output_path), pagesize=(612, 792))
+    for page in range(pages):
+        for row in range(50):
+            y = 760 - row * 14
+            c.drawString(40, y, f"Field label {row}:")
+            c.drawString(160, y, f"Value {page}-{row}")
+            c.drawString(330, y, f"Code {row * 7 + page}")
+            c.line(36, y - 3, 576, y - 3)
+        for col in range(4):
+            c.rect(36 + col * 135, 40, 135, 20)
+        c.bezier(40, 30, 140, 10, 240, 50, 340, 30)
+        c.showPage()
+    c.save()
+    return output_path
+
+
+def count_elements(pdf_json: dict) -> dict:
+    """Count elements of each kind across all pages."""
+    counts = {}
+    for key in ("textElements", "lineElements", "rectElements", "curveElements"):
+        counts[key] = sum(len(page.get(key, [])) for page in pdf_json["pages"])
+    return counts
+
+
+def run_benchmark(pdf_path: Path, repeat: int, workers: int):
+    """Time every extraction engine on pdf_path and print a comparison."""
+    client = LocalStirlingClient(cache_dir=Path(tempfile.gettempdir()))
+
+    print(f"\n{'='*70}")
+    print(f"EXTRACTION BENCHMARK: {pdf_path.name} (best of {repeat}, workers={workers})")
+    print(f"{'='*70}")
+
+    results = {}
+    for engine in EXTRACTION_ENGINES:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            pdf_json = client.pdf_to_json(pdf_path, workers=workers, engine=engine)
+            timings.append(time.perf_counter() - start)
+
+        best = min(timings)
+        pages = len(pdf_json["pages"])
+        results[engine] = best
+        counts = count_elements(pdf_json)
+        print(
+            f"{engine:<12} {best:8.3f}s  {best / pages * 1000:8.2f} ms/page  "
+            f"text={counts['textElements']} lines={counts['lineElements']} "
+            f"rects={counts['rectElements']} curves={counts['curveElements']}"
+        )
+
+    baseline = results["pdfplumber"]
+    for engine, elapsed in results.items():
+        if engine != "pdfplumber":
+            print(f"\n{engine} speedup over pdfplumber: {baseline / elapsed:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark pdf_to_json extraction engines",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("input_pdf", nargs="?", type=Path, help="PDF to extract")
+    parser.add_argument("--generate", type=int, metavar="PAGES", help="Generate an N-page PDF")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per engine")
+    parser.add_argument("--workers", type=int, default=1, help="Extraction processes")
+    args = parser.parse_args()
+
+    setup_logging(log_level="WARNING")
+
+    if args.generate:
+        pdf_path = generate_form_pdf(
+            Path(tempfile.gettempdir()) / f"benchmark_form_{args.generate}p.pdf", args.generate
+        )
+    elif args.input_pdf:
+        pdf_path = args.input_pdf
+        if not pdf_path.exists():
+            print(f"Error: File not found: {pdf_path}")
+            sys.exit(1)
+    else:
+        parser.error("Provide an input PDF or --generate PAGES")
+
+    run_benchmark(pdf_path, args.repeat, args.workers)
+
+
+if __name__ == "__main__":
+    main()
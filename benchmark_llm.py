@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Benchmark LLM synthesis throughput and retries against the local mock server.
+
+Usage:
+    python benchmark_llm.py [--requests N] [--records N] [--latency SPEC]
+                            [--rate-limit-probability P] [--rate-limit-rpm N]
+                            [--concurrency N ...]
+
+Arguments:
+    --requests N                Synthesis requests per run (default: 40)
+    --records N                 Records per batched request (default: 5)
+    --latency SPEC              Mock latency distribution (default: lognormal:0.2,0.5)
+    --rate-limit-probability P  Chance the mock answers 429 (default: 0.05)
+    --rate-limit-rpm N          Mock requests-per-minute quota (default: 0 = none)
+    --concurrency N ...         Async concurrency levels (default: 1 4 16)
+
+No network access or API token is needed: the mock runs in-process and the
+client is pointed at it through the llm_base_url setting.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.stirling_sdg.config.settings import Settings
+from src.stirling_sdg.synthesis.github_models_client import GitHubModelsClient
+from src.stirling_sdg.synthesis.mock_server import create_mock_server
+from src.stirling_sdg.utils.logging_utils import setup_logging
+
+TEMPLATE = {
+    "variable_fields": [
+        {"text": "John Smith", "fieldType": "patient_name", "dataType": "string", "pageNumber": 1},
+        {"text": "01/15/1980", "fieldType": "date_of_birth", "dataType": "date", "pageNumber": 1},
+        {"text": "44", "fieldType": "age", "dataType": "number", "pageNumber": 1},
+        {"text": "(512) 555-0100", "fieldType": "phone_number", "dataType": "string", "pageNumber": 1},
+        {"text": "MRN12345678", "fieldType": "mrn", "dataType": "string", "pageNumber": 1},
+    ]
+}
+
+
+def make_client(base_url: str, work_dir: Path, concurrency: int) -> GitHubModelsClient:
+    """Build a client that talks to the mock (no cache, short backoff)."""
+    settings = Settings(
+        groq_api_key="mock",
+        github_token="mock",
+        llm_base_url=base_url,
+        llm_cache_enabled=False,
+        llm_max_concurrency=concurrency,
+        llm_rate_limit_calls=10**6,
+        llm_retry_base_delay=0.1,
+        data_dir=work_dir,
+        input_dir=work_dir / "input",
+        output_dir=work_dir / "output",
+        cache_dir=work_dir / "cache",
+        config_dir=work_dir / "configs",
+        log_file=work_dir / "benchmark.log",
+    )
+    return GitHubModelsClient(settings)
+
+
+async def run_async(client: GitHubModelsClient, requests: int, records: int) -> tuple:
+    """Issue all requests concurrently (bounded by llm_max_concurrency)."""
+    latencies = []
+    failures = 0
+
+    async def one():
+        nonlocal failures
+        start = time.perf_counter()
+        try:
+            await client.agenerate_synthetic_data_batch(TEMPLATE, records)
+        except Exception:
+            failures += 1
+        latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return latencies, failures
+
+
+def run_benchmark(args):
+    """Run the sync client and each async concurrency level against one mock."""
+    server = create_mock_server(
+        port=0,
+        latency=args.latency,
+        rate_limit_probability=args.rate_limit_probability,
+        rate_limit_rpm=args.rate_limit_rpm,
+        seed=0,
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"\n{'='*70}")
+    print(
+        f"LLM BENCHMARK: {args.requests} requests x {args.records} records, "
+        f"latency={args.latency}, 429 p={args.rate_limit_probability}, rpm={args.rate_limit_rpm or '-'}"
+    )
+    print(f"{'='*70}")
+    print(f"{'mode':<12} {'time':>8} {'req/s':>8} {'rec/s':>8} {'p50':>8} {'p95':>8} {'429s':>6} {'failed':>7}")
+
+    runs = [("sync", 1)] + [(f"async x{c}", c) for c in args.concurrency]
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, concurrency in runs:
+            client = make_client(base_url, Path(tmp), concurrency)
+            before = server.mock.snapshot()["rate_limited"]
+
+            start = time.perf_counter()
+            if name == "sync":
+                latencies, failures = [], 0
+                for _ in range(args.requests):
+                    request_start = time.perf_counter()
+                    try:
+                        client.generate_synthetic_data_batch(TEMPLATE, args.records)
+                    except Exception:
+                        failures += 1
+                    latencies.append(time.perf_counter() - request_start)
+            else:
+                latencies, failures = asyncio.run(run_async(client, args.requests, args.records))
+            elapsed = time.perf_counter() - start
+
+            rate_limited = server.mock.snapshot()["rate_limited"] - before
+            p95 = statistics.quantiles(latencies, n=20)[18] if len(latencies) > 1 else latencies[0]
+            completed = args.requests - failures
+            print(
+                f"{name:<12} {elapsed:7.2f}s {completed / elapsed:8.1f} "
+                f"{completed * args.records / elapsed:8.1f} {statistics.median(latencies) * 1000:6.0f}ms "
+                f"{p95 * 1000:6.0f}ms {rate_limited:>6} {failures:>7}"
+            )
+
+    server.shutdown()
+    server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark LLM synthesis against the mock server",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--requests", type=int, default=40, help="Requests per run")
+    parser.add_argument("--records", type=int, default=5, help="Records per request")
+    parser.add_argument("--latency", default="lognormal:0.2,0.5", help="Mock latency distribution")
+    parser.add_argument(
+        "--rate-limit-probability", type=float, default=0.05, help="Chance of a 429 response"
+    )
+    parser.add_argument("--rate-limit-rpm", type=int, default=0, help="Mock requests-per-minute quota")
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 4, 16], help="Async concurrency levels"
+    )
+    args = parser.parse_args()
+
+    setup_logging(log_level="ERROR")
+    run_benchmark(args)
+
+
+if __name__ == "__main__":
+    main()
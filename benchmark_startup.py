@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Benchmark CLI startup time (fresh interpreter per run).
+
+Usage:
+    python benchmark_startup.py [--repeat N] [--show-modules]
+
+Arguments:
+    --repeat N        Runs per command (default: 10, median and best are reported)
+    --show-modules    Also report which heavy libraries each command imports
+
+Each command runs in a new Python process with src/ on the path, the way the
+stirling-sdg entry point is invoked by scripts that shell out to the CLI.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent / "src"
+
+COMMANDS = {
+    "import stirling_sdg": ["-c", "import stirling_sdg"],
+    "stirling-sdg --help": ["-m", "stirling_sdg", "--help"],
+    "stirling-sdg info": ["-m", "stirling_sdg", "info"],
+    "stirling-sdg list-templates": ["-m", "stirling_sdg", "list-templates"],
+}
+
+HEAVY_MODULES = ["fitz", "pdfplumber", "reportlab", "img2pdf", "PIL", "openai"]
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    return env
+
+
+def time_command(args: list, repeat: int) -> list:
+    """Run a Python command repeatedly and return wall-clock timings."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args], env=_env(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def loaded_heavy_modules(args: list) -> list:
+    """Report which heavy libraries are imported by a command."""
+    if args[0] == "-c":
+        code = args[1]
+    else:
+        code = (
+            "import runpy, sys; sys.argv = ['stirling-sdg'] + " + repr(args[2:]) + "\n"
+            "try:\n    runpy.run_module('stirling_sdg', run_name='__main__')\n"
+            "except SystemExit:\n    pass"
+        )
+    probe = code + "\nimport sys; print('HEAVY:' + ','.join(m for m in %r if m in sys.modules))" % (
+        HEAVY_MODULES
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe], env=_env(), capture_output=True, text=True
+    )
+    for line in result.stdout.splitlines():
+        if line.startswith("HEAVY:"):
+            return [m for m in line[len("HEAVY:"):].split(",") if m]
+    return []
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark CLI startup time",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per command")
+    parser.add_argument(
+        "--show-modules", action="store_true", help="Report heavy libraries imported"
+    )
+    args = parser.parse_args()
+
+    baseline = statistics.median(time_command(["-c", "pass"], args.repeat))
+
+    print(f"\n{'='*70}")
+    print(f"STARTUP BENCHMARK ({args.repeat} runs, bare interpreter: {baseline * 1000:.0f} ms)")
+    print(f"{'='*70}")
+    print(f"{'command':<30} {'median':>10} {'best':>10} {'over bare':>12}")
+
+    for name, command in COMMANDS.items():
+        timings = time_command(command, args.repeat)
+        median = statistics.median(timings)
+        print(
+            f"{name:<30} {median * 1000:8.0f}ms {min(timings) * 1000:8.0f}ms "
+            f"{(median - baseline) * 1000:10.0f}ms"
+        )
+        if args.show_modules:
+            modules = loaded_heavy_modules(command)
+            print(f"{'':<30} heavy imports: {', '.join(modules) if modules else 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,16 +8,36 @@ No Docker or external services required for PDF processing.
 
 __version__ = "0.2.0"
 
-from .config.settings import Settings
-from .stirling.client import StirlingClient
-from .stirling.local_client import LocalStirlingClient
-from .stirling.direct_edit_client import DirectEditClient
-from .detection.detector import DocumentDetector
-from .classification.classifier import ContentClassifier
-from .synthesis.generator import SyntheticDataGenerator
-from .json_editor.editor import JSONEditor
-from .pipeline.orchestrator import PipelineOrchestrator
-from .pipeline.config_manager import ConfigManager
+import importlib
+from typing import TYPE_CHECKING
+
+# Public names -> defining module. They are imported on first access
+# (PEP 562), so importing the package (e.g. for the CLI) does not load
+# PyMuPDF, pdfplumber, reportlab or openai until they are needed.
+_LAZY_ATTRIBUTES = {
+    "Settings": ".config.settings",
+    "StirlingClient": ".stirling.client",
+    "LocalStirlingClient": ".stirling.local_client",
+    "DirectEditClient": ".stirling.direct_edit_client",
+    "DocumentDetector": ".detection.detector",
+    "ContentClassifier": ".classification.classifier",
+    "SyntheticDataGenerator": ".synthesis.generator",
+    "JSONEditor": ".json_editor.editor",
+    "PipelineOrchestrator": ".pipeline.orchestrator",
+    "ConfigManager": ".pipeline.config_manager",
+}
+
+if TYPE_CHECKING:
+    from .config.settings import Settings
+    from .stirling.client import StirlingClient
+    from .stirling.local_client import LocalStirlingClient
+    from .stirling.direct_edit_client import DirectEditClient
+    from .detection.detector import DocumentDetector
+    from .classification.classifier import ContentClassifier
+    from .synthesis.generator import SyntheticDataGenerator
+    from .json_editor.editor import JSONEditor
+    from .pipeline.orchestrator import PipelineOrchestrator
+    from .pipeline.config_manager import ConfigManager
 
 __all__ = [
     "Settings",
@@ -32,3 +52,16 @@ __all__ = [
     "ConfigManager",
 ]
 
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,11 +6,13 @@ import click
 from rich.console import Console
 from rich.table import Table
 
-from .config.settings import Settings
-from .pipeline.orchestrator import PipelineOrchestrator
+from .config.settings import get_settings
 from .pipeline.config_manager import ConfigManager
 from .utils.logging_utils import setup_logging, get_logger
 
+# PipelineOrchestrator (PDF libraries, LLM client) is imported inside the
+# commands that run the pipeline, so lightweight commands start fast
+
 console = Console()
 logger = get_logger(__name__)
 
@@ -44,7 +46,18 @@ def cli(log_level):
     is_flag=True,
     help="Save classification template for reuse",
 )
-def process(input_path, output, save_template):
+@click.option(
+    "--no-llm-cache",
+    is_flag=True,
+    help="Bypass the LLM response cache",
+)
+@click.option(
+    "--report",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Write a JSON performance report (per-stage timings) to this file",
+)
+def process(input_path, output, save_template, no_llm_cache, report):
     """Process a single document to generate synthetic data PDF.
 
     \b
@@ -52,14 +65,18 @@ def process(input_path, output, save_template):
         stirling-sdg process input.pdf --output output.pdf --save-template
     """
     try:
-        settings = Settings()
+        from .pipeline.orchestrator import PipelineOrchestrator
+
+        settings = get_settings()
+        if no_llm_cache:
+            settings.llm_cache_enabled = False
         orchestrator = PipelineOrchestrator(settings)
 
         with console.status(
             f"[bold green]Processing {input_path.name}...", spinner="dots"
         ):
             result = orchestrator.process_single(
-                input_path, output, save_template=save_template
+                input_path, output, save_template=save_template, report_path=report
             )
 
         console.print(f"\n[green]✓ Success![/green] Generated: {result}")
@@ -98,16 +115,67 @@ def process(input_path, output, save_template):
     type=click.Path(exists=True, path_type=Path),
     help="Pre-saved template (skips classification)",
 )
-def batch(input_path, output_dir, num, template):
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    default=1,
+    help="Render processes (default: 1 = in-process, 0 = one per CPU core)",
+)
+@click.option(
+    "--synthesis-workers",
+    type=int,
+    default=None,
+    help="Concurrent synthesis producers (default: SYNTHESIS_WORKERS setting)",
+)
+@click.option(
+    "--queue-size",
+    type=int,
+    default=None,
+    help="Synthesis -> render queue capacity (default: PIPELINE_QUEUE_SIZE setting)",
+)
+@click.option(
+    "--static-layer",
+    is_flag=True,
+    help="Scanned documents: render static content once, overlay only variable text",
+)
+@click.option(
+    "--no-llm-cache",
+    is_flag=True,
+    help="Bypass the LLM response cache",
+)
+@click.option(
+    "--report",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Write a JSON performance report (per-stage and per-variation timings) to this file",
+)
+def batch(
+    input_path,
+    output_dir,
+    num,
+    template,
+    workers,
+    synthesis_workers,
+    queue_size,
+    static_layer,
+    no_llm_cache,
+    report,
+):
     """Generate multiple variations with template reuse.
 
     \b
     Example:
         stirling-sdg batch input.pdf --output-dir ./output --num 100
         stirling-sdg batch input.pdf -o ./output -n 50 -t template.json
+        stirling-sdg batch input.pdf -o ./output -n 10000 --workers 0
     """
     try:
-        settings = Settings()
+        from .pipeline.orchestrator import PipelineOrchestrator
+
+        settings = get_settings()
+        if no_llm_cache:
+            settings.llm_cache_enabled = False
         orchestrator = PipelineOrchestrator(settings)
 
         output_dir = Path(output_dir)
@@ -117,7 +185,15 @@ def batch(input_path, output_dir, num, template):
             f"[bold green]Generating {num} variations...", spinner="dots"
         ):
             results = orchestrator.process_batch(
-                input_path, output_dir, num_variations=num, template_path=template
+                input_path,
+                output_dir,
+                num_variations=num,
+                template_path=template,
+                workers=workers,
+                synthesis_workers=synthesis_workers,
+                queue_size=queue_size,
+                static_layer=static_layer or None,
+                report_path=report,
             )
 
         console.print(
@@ -125,6 +201,15 @@ def batch(input_path, output_dir, num, template):
         )
         console.print(f"[blue]Output directory:[/blue] {output_dir}")
 
+        latency = orchestrator.last_report.variation_latency()
+        if latency:
+            console.print(
+                f"[blue]Variation latency:[/blue] p50 {latency['p50']:.2f}s, "
+                f"p95 {latency['p95']:.2f}s, p99 {latency['p99']:.2f}s"
+            )
+        if report:
+            console.print(f"[blue]Performance report:[/blue] {report}")
+
         if len(results) < num:
             console.print(
                 f"\n[yellow]Warning:[/yellow] {num - len(results)} variations failed",
@@ -167,7 +252,7 @@ def batch_from_template(template, output_dir, num):
         stirling-sdg batch-from-template -t medical_form -o ./output -n 100
     """
     try:
-        settings = Settings()
+        settings = get_settings()
         config_manager = ConfigManager(settings)
 
         # Load the template
@@ -195,6 +280,318 @@ def batch_from_template(template, output_dir, num):
         raise click.Abort()
 
 
+@cli.command()
+@click.option("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+@click.option("--port", type=int, default=8765, help="Port to bind (default: 8765)")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Listen on a Unix socket at this path instead of TCP",
+)
+@click.option(
+    "--output-dir",
+    "-o",
+    type=click.Path(path_type=Path),
+    default=Path("./output/jobs"),
+    help="Default parent directory for job outputs (default: ./output/jobs)",
+)
+@click.option(
+    "--jobs",
+    type=int,
+    default=1,
+    help="Jobs run at the same time on the shared pipeline; later jobs queue. "
+    "Concurrent jobs share LLM quota and CPU (default: 1)",
+)
+@click.option(
+    "--document-cache",
+    type=int,
+    default=32,
+    help="Prepared documents (template + converted JSON) kept between jobs (default: 32)",
+)
+@click.option(
+    "--render-workers",
+    type=int,
+    default=0,
+    help="Processes of the render pool kept warm for batch jobs with workers != 1 "
+    "(default: 0 = one per CPU core)",
+)
+def serve(host, port, socket_path, output_dir, jobs, document_cache, render_workers):
+    """Run a local job server with a warm pipeline.
+
+    Settings, LLM clients, templates and converted documents stay loaded
+    between jobs. Submit jobs with POST /jobs, poll GET /jobs/<id>, stream
+    results from GET /jobs/<id>/events and download outputs from
+    GET /jobs/<id>/files/<name>.
+
+    \b
+    Example:
+        stirling-sdg serve --port 8765
+        curl -X POST localhost:8765/jobs \\
+            -d '{"input_path": "form.pdf", "num_variations": 20}'
+    """
+    try:
+        from .pipeline.orchestrator import PipelineOrchestrator
+        from .pipeline.server import serve as run_server
+
+        orchestrator = PipelineOrchestrator(get_settings(), document_cache_size=document_cache)
+        address = socket_path if socket_path else f"http://{host}:{port}"
+        console.print(f"[green]Job server listening on[/green] {address} (Ctrl+C to stop)")
+
+        run_server(
+            orchestrator,
+            Path(output_dir),
+            host=host,
+            port=port,
+            socket_path=socket_path,
+            max_concurrent_jobs=jobs,
+            render_workers=render_workers,
+        )
+
+    except Exception as e:
+        console.print(f"\n[red]✗ Error:[/red] {e}", style="bold red")
+        logger.exception("Job server failed")
+        raise click.Abort()
+
+
+@cli.command()
+@click.option(
+    "--pages", type=int, multiple=True, default=(1, 10), help="Page counts (repeatable; default: 1, 10)"
+)
+@click.option(
+    "--words",
+    type=int,
+    multiple=True,
+    default=(200, 1000),
+    help="Words per page (repeatable; default: 200, 1000)",
+)
+@click.option(
+    "--vector-density",
+    type=int,
+    multiple=True,
+    default=(0, 200),
+    help="Vector drawing operations per page (repeatable; default: 0, 200)",
+)
+@click.option(
+    "--kind",
+    type=click.Choice(["digital", "scanned", "both"]),
+    default="digital",
+    help="Generate digital and/or scanned documents (default: digital)",
+)
+@click.option(
+    "--stage",
+    "stages",
+    multiple=True,
+    help="Stage to run (repeatable; default: all)",
+)
+@click.option("--warmup", type=int, default=1, help="Untimed runs per stage (default: 1)")
+@click.option("--repeat", type=int, default=5, help="Timed runs per stage (default: 5)")
+@click.option(
+    "--corpus-dir",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Directory for generated documents, reused between runs (default: <cache_dir>/bench)",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Write results as JSON to this file",
+)
+@click.option(
+    "--compare",
+    "baseline_path",
+    type=click.Path(exists=True, path_type=Path),
+    default=None,
+    help="Compare against results JSON from an earlier run",
+)
+@click.option(
+    "--threshold",
+    type=float,
+    default=0.1,
+    help="Relative change treated as noise when comparing (default: 0.1)",
+)
+def bench(
+    pages,
+    words,
+    vector_density,
+    kind,
+    stages,
+    warmup,
+    repeat,
+    corpus_dir,
+    output,
+    baseline_path,
+    threshold,
+):
+    """Benchmark pipeline stages on a generated corpus.
+
+    \b
+    Example:
+        stirling-sdg bench -o baseline.json
+        stirling-sdg bench --pages 50 --words 2000 --stage pdf_to_json
+        stirling-sdg bench -o current.json --compare baseline.json
+    """
+    try:
+        from .bench.corpus import generate_corpus
+        from .bench.runner import STAGES, compare_results, load_results, run_benchmarks, save_results
+
+        unknown = [name for name in stages if name not in STAGES]
+        if unknown:
+            raise click.BadParameter(
+                f"{', '.join(unknown)} (available: {', '.join(STAGES)})", param_hint="--stage"
+            )
+
+        settings = get_settings()
+        corpus_dir = corpus_dir or settings.cache_dir / "bench"
+        scanned = {"digital": (False,), "scanned": (True,), "both": (False, True)}[kind]
+
+        with console.status("[bold green]Generating corpus...", spinner="dots"):
+            cases = generate_corpus(corpus_dir, pages, words, vector_density, scanned)
+
+        table = Table(title=f"Stage benchmark (median of {repeat}, {warmup} warmup)")
+        table.add_column("Document", style="cyan", no_wrap=True)
+        table.add_column("Stage", style="green", no_wrap=True)
+        table.add_column("Median", justify="right")
+        table.add_column("Min", justify="right")
+        table.add_column("Text elements", justify="right")
+
+        with console.status("[bold green]Running benchmarks...", spinner="dots"):
+            results = run_benchmarks(
+                cases, corpus_dir / "work", stages=list(stages) or None, warmup=warmup, repeat=repeat
+            )
+
+        for result in results["results"]:
+            table.add_row(
+                result["case"],
+                result["stage"],
+                f"{result['median'] * 1000:.2f} ms",
+                f"{result['min'] * 1000:.2f} ms",
+                str(result["size"]["text_elements"]),
+            )
+        console.print(table)
+
+        if output:
+            save_results(results, output)
+            console.print(f"[blue]Results:[/blue] {output}")
+
+        if baseline_path:
+            baseline = load_results(baseline_path)
+            comparison = Table(
+                title=f"Compared with {baseline_path.name} ({baseline.get('commit') or 'unknown commit'})"
+            )
+            comparison.add_column("Document", style="cyan", no_wrap=True)
+            comparison.add_column("Stage", style="green", no_wrap=True)
+            comparison.add_column("Baseline", justify="right")
+            comparison.add_column("Current", justify="right")
+            comparison.add_column("Change", justify="right")
+
+            colors = {"regression": "red", "improvement": "green", "unchanged": "white"}
+            rows = compare_results(baseline, results, threshold=threshold)
+            for row in rows:
+                color = colors[row["status"]]
+                comparison.add_row(
+                    row["case"],
+                    row["stage"],
+                    f"{row['baseline'] * 1000:.2f} ms",
+                    f"{row['current'] * 1000:.2f} ms",
+                    f"[{color}]{(row['ratio'] - 1) * 100:+.1f}%[/{color}]",
+                )
+            console.print(comparison)
+
+            regressions = sum(1 for row in rows if row["status"] == "regression")
+            if regressions:
+                console.print(
+                    f"\n[yellow]Warning:[/yellow] {regressions} stage(s) slower than baseline "
+                    f"by more than {threshold:.0%}",
+                    style="yellow",
+                )
+
+    except click.BadParameter:
+        raise
+    except Exception as e:
+        console.print(f"\n[red]✗ Error:[/red] {e}", style="bold red")
+        logger.exception("Benchmark failed")
+        raise click.Abort()
+
+
+@cli.command()
+@click.option("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+@click.option("--port", type=int, default=8766, help="Port to bind (default: 8766)")
+@click.option(
+    "--latency",
+    default="0",
+    help="Request latency in seconds or a distribution: fixed:S, uniform:LOW,HIGH, "
+    "normal:MEAN,STDEV, lognormal:MEDIAN,SIGMA, exponential:MEAN (default: 0)",
+)
+@click.option(
+    "--token-latency",
+    type=float,
+    default=0.0,
+    help="Extra seconds per completion token (default: 0)",
+)
+@click.option(
+    "--rate-limit-probability",
+    type=float,
+    default=0.0,
+    help="Chance of answering a request with 429 (default: 0)",
+)
+@click.option(
+    "--rate-limit-rpm",
+    type=int,
+    default=0,
+    help="Requests per minute before answering 429 (default: 0 = unlimited)",
+)
+@click.option("--seed", type=int, default=None, help="Random seed")
+def mock_llm(host, port, latency, token_latency, rate_limit_probability, rate_limit_rpm, seed):
+    """Run a local OpenAI-compatible mock of the LLM API.
+
+    Answers classification and synthesis prompts with valid JSON, so the
+    pipeline, throughput and retry behavior can be exercised offline.
+
+    \b
+    Example:
+        stirling-sdg mock-llm --latency lognormal:0.8,0.4 --rate-limit-rpm 50
+        LLM_BASE_URL=http://127.0.0.1:8766 stirling-sdg batch input.pdf -o out -n 100
+    """
+    try:
+        from .synthesis.mock_server import create_mock_server
+
+        server = create_mock_server(
+            host,
+            port,
+            latency=latency,
+            token_latency=token_latency,
+            rate_limit_probability=rate_limit_probability,
+            rate_limit_rpm=rate_limit_rpm,
+            seed=seed,
+        )
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--latency")
+    except Exception as e:
+        console.print(f"\n[red]✗ Error:[/red] {e}", style="bold red")
+        logger.exception("Mock LLM server failed")
+        raise click.Abort()
+
+    console.print(
+        f"[green]Mock LLM listening on[/green] http://{host}:{server.server_address[1]} "
+        f"(set LLM_BASE_URL to use it; Ctrl+C to stop)"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        stats = server.mock.snapshot()
+        console.print(
+            f"\n[blue]Requests:[/blue] {stats['requests']} "
+            f"({stats['completed']} completed, {stats['rate_limited']} rate limited)"
+        )
+
+
 @cli.command()
 def init_config():
     """Initialize default pipeline configuration.
@@ -202,7 +599,7 @@ def init_config():
     Creates a default pipeline config in configs/pipeline_templates/default.yaml
     """
     try:
-        settings = Settings()
+        settings = get_settings()
         config_manager = ConfigManager(settings)
 
         config = config_manager.create_default_pipeline()
@@ -227,7 +624,7 @@ def init_config():
 def list_templates():
     """List available classification templates."""
     try:
-        settings = Settings()
+        settings = get_settings()
         config_manager = ConfigManager(settings)
 
         templates = config_manager.list_templates()
@@ -257,7 +654,7 @@ def list_templates():
 def info():
     """Display current configuration and system info."""
     try:
-        settings = Settings()
+        settings = get_settings()
 
         table = Table(title="Stirling PDF SDG Configuration", show_header=True)
         table.add_column("Setting", style="cyan")
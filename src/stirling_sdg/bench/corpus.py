@@ -0,0 +1,215 @@
+"""Synthetic benchmark corpora.
+
+Generates form-like PDFs whose size is controlled by a few parameters
+(pages, words per page, vector density, digital vs scanned), together with
+a template whose variable fields exist in the generated text, so every
+pipeline stage can be timed on the same documents. Generation is
+deterministic for a given seed.
+"""
+
+import itertools
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+from ..utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 792
+MARGIN = 36
+CELLS_PER_ROW = 3
+WORDS_PER_CELL = 3
+SCAN_DPI = 100
+
+VOCABULARY = (
+    "account address amount balance billing claim client code date department "
+    "description due employer patient policy provider reference service status "
+    "total member number invoice payment period plan program record signature"
+).split()
+
+
+def case_name(pages: int, words_per_page: int, vector_density: int, scanned: bool) -> str:
+    """Build the identifier of a corpus document (stable across runs)."""
+    kind = "scanned" if scanned else "digital"
+    return f"{kind}-p{pages}-w{words_per_page}-v{vector_density}"
+
+
+def _layout(words_per_page: int) -> tuple:
+    """Compute rows, row pitch and font size that fit the words on one page."""
+    cells = max(1, -(-words_per_page // WORDS_PER_CELL))
+    rows = max(1, -(-cells // CELLS_PER_ROW))
+    pitch = min(14.0, (PAGE_HEIGHT - 2 * MARGIN) / rows)
+    font_size = max(2.0, min(10.0, pitch * 0.8))
+    return rows, pitch, font_size
+
+
+def generate_document(
+    output_path: Path,
+    pages: int,
+    words_per_page: int,
+    vector_density: int = 0,
+    scanned: bool = False,
+    max_fields: int = 10,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Generate one form-like PDF and a template for it.
+
+    Each row starts with a unique value cell ("F<page>-<row>") followed by
+    label cells of vocabulary words. Variable fields of the template point
+    at value cells spread over the document.
+
+    Args:
+        output_path: Where to write the PDF
+        pages: Number of pages
+        words_per_page: Approximate number of words per page
+        vector_density: Vector drawing operations (lines, rectangles,
+            curves) per page
+        scanned: If True, rasterize the pages so the PDF has no text layer
+        max_fields: Maximum number of variable fields in the template
+        seed: Random seed
+
+    Returns:
+        Template dict (type plus variable_fields)
+    """
+    from reportlab.pdfgen import canvas
+
+    rng = random.Random(seed)
+    rows, pitch, font_size = _layout(words_per_page)
+    cell_width = (PAGE_WIDTH - 2 * MARGIN) / CELLS_PER_ROW
+
+    c = canvas.Canvas(str(output_path), pagesize=(PAGE_WIDTH, PAGE_HEIGHT))
+    value_cells = []
+    for page in range(pages):
+        c.setFont("Helvetica", font_size)
+        remaining = words_per_page
+        for row in range(rows):
+            if remaining <= 0:
+                break
+            y = PAGE_HEIGHT - MARGIN - (row + 1) * pitch
+            for column in range(CELLS_PER_ROW):
+                if remaining <= 0:
+                    break
+                count = min(WORDS_PER_CELL, remaining)
+                if column == 0:
+                    text = " ".join([f"F{page + 1}-{row + 1}"] + rng.sample(VOCABULARY, count - 1))
+                    value_cells.append((page + 1, text))
+                else:
+                    text = " ".join(rng.sample(VOCABULARY, count))
+                c.drawString(MARGIN + column * cell_width, y, text)
+                remaining -= count
+
+        c.setLineWidth(0.5)
+        for _ in range(vector_density):
+            x0, y0 = rng.uniform(MARGIN, PAGE_WIDTH - MARGIN), rng.uniform(MARGIN, PAGE_HEIGHT - MARGIN)
+            kind = rng.random()
+            if kind < 0.5:
+                c.line(x0, y0, x0 + rng.uniform(10, 200), y0)
+            elif kind < 0.85:
+                c.rect(x0, y0, rng.uniform(10, 120), rng.uniform(8, 40))
+            else:
+                c.bezier(x0, y0, x0 + 20, y0 + 30, x0 + 60, y0 - 30, x0 + 80, y0)
+        c.showPage()
+    c.save()
+
+    if scanned:
+        _rasterize(output_path)
+
+    step = max(1, len(value_cells) // max_fields) if value_cells else 1
+    fields = [
+        {
+            "text": text,
+            "fieldType": f"field_{index}",
+            "dataType": "string",
+            "pageNumber": page_number,
+        }
+        for index, (page_number, text) in enumerate(value_cells[::step][:max_fields])
+    ]
+    return {"type": "reconstruction" if scanned else "direct_edit", "variable_fields": fields}
+
+
+def _rasterize(pdf_path: Path) -> None:
+    """Replace a PDF with image-only pages, as a scanner would produce."""
+    import fitz
+
+    source = fitz.open(pdf_path)
+    scanned = fitz.open()
+    for page in source:
+        pixmap = page.get_pixmap(dpi=SCAN_DPI, colorspace=fitz.csGRAY)
+        new_page = scanned.new_page(width=page.rect.width, height=page.rect.height)
+        new_page.insert_image(new_page.rect, pixmap=pixmap)
+    source.close()
+    scanned.save(pdf_path, garbage=3, deflate=True)
+    scanned.close()
+
+
+def generate_corpus(
+    output_dir: Path,
+    pages: Iterable[int] = (1, 10),
+    words_per_page: Iterable[int] = (200, 1000),
+    vector_density: Iterable[int] = (0, 200),
+    scanned: Iterable[bool] = (False,),
+    max_fields: int = 10,
+    seed: int = 0,
+) -> List[Dict[str, Any]]:
+    """Generate one document per combination of parameters.
+
+    Documents (and their templates, as <name>_template.json) are reused if
+    they already exist in output_dir, so repeated runs compare the same
+    inputs.
+
+    Args:
+        output_dir: Directory for the corpus
+        pages: Page counts
+        words_per_page: Words per page
+        vector_density: Vector drawing operations per page
+        scanned: Digital (False) and/or scanned (True)
+        max_fields: Maximum variable fields per template
+        seed: Random seed
+
+    Returns:
+        List of cases with name, path, template and params
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    cases = []
+    for page_count, words, density, is_scanned in itertools.product(
+        pages, words_per_page, vector_density, scanned
+    ):
+        name = case_name(page_count, words, density, is_scanned)
+        pdf_path = output_dir / f"{name}.pdf"
+        template_path = output_dir / f"{name}_template.json"
+
+        if pdf_path.exists() and template_path.exists():
+            with open(template_path, "r") as f:
+                template = json.load(f)
+        else:
+            logger.info(f"Generating benchmark document {name}")
+            template = generate_document(
+                pdf_path,
+                page_count,
+                words,
+                vector_density=density,
+                scanned=is_scanned,
+                max_fields=max_fields,
+                seed=seed,
+            )
+            with open(template_path, "w") as f:
+                json.dump(template, f, indent=2)
+
+        cases.append({
+            "name": name,
+            "path": pdf_path,
+            "template": template,
+            "params": {
+                "pages": page_count,
+                "words_per_page": words,
+                "vector_density": density,
+                "scanned": is_scanned,
+            },
+        })
+
+    return cases
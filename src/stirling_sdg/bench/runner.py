@@ -0,0 +1,346 @@
+"""Stage-level benchmark runner.
+
+Each stage is set up once per corpus document (untimed), warmed up, then
+timed for a number of repetitions. Results are plain JSON so runs from two
+commits can be compared with compare_results().
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from ..utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+RESULTS_SCHEMA = 1
+
+
+def time_call(
+    run: Callable[[Any], Any],
+    warmup: int = 1,
+    repeat: int = 5,
+    setup: Callable[[], Any] | None = None,
+    teardown: Callable[[Any], None] | None = None,
+) -> Dict[str, Any]:
+    """Time a callable with warmup runs and repetitions.
+
+    Args:
+        run: Function to time; receives the value returned by setup
+        warmup: Untimed runs before measuring
+        repeat: Timed runs
+        setup: Optional untimed function called before every run
+        teardown: Optional untimed function called with the setup value
+            after every run
+
+    Returns:
+        Dict with min, median, mean, stdev and runs (seconds)
+    """
+    timings = []
+    for iteration in range(warmup + repeat):
+        value = setup() if setup is not None else None
+        start = time.perf_counter()
+        run(value)
+        elapsed = time.perf_counter() - start
+        if teardown is not None:
+            teardown(value)
+        if iteration >= warmup:
+            timings.append(elapsed)
+
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.mean(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "runs": timings,
+    }
+
+
+def _synthetic_data(template: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        field["fieldType"]: f"Synthetic value {index}"
+        for index, field in enumerate(template.get("variable_fields", []))
+    }
+
+
+class BenchmarkContext:
+    """Shared per-document state for stages (clients, extracted JSON)."""
+
+    def __init__(self, case: Dict[str, Any], work_dir: Path):
+        """Initialize context.
+
+        Args:
+            case: Corpus case (see generate_corpus())
+            work_dir: Directory for stage outputs
+        """
+        self.case = case
+        self.work_dir = Path(work_dir)
+        self._client = None
+        self._pdf_json = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            from ..stirling.local_client import LocalStirlingClient
+
+            self._client = LocalStirlingClient(
+                cache_dir=self.work_dir / "cache", ocr_cache_enabled=False
+            )
+        return self._client
+
+    @property
+    def pdf_json(self) -> Dict[str, Any]:
+        if self._pdf_json is None:
+            self._pdf_json = self.client.pdf_to_json(self.case["path"])
+        return self._pdf_json
+
+
+def _stage_detect(ctx: BenchmarkContext) -> Dict[str, Any]:
+    from ..detection.detector import DocumentDetector
+
+    detector = DocumentDetector()
+    return {"run": lambda _: detector.detect(ctx.case["path"])}
+
+
+def _stage_pdf_to_json(ctx: BenchmarkContext) -> Dict[str, Any]:
+    return {"run": lambda _: ctx.client.pdf_to_json(ctx.case["path"])}
+
+
+def _stage_json_to_pdf(ctx: BenchmarkContext) -> Dict[str, Any]:
+    pdf_json = ctx.pdf_json
+    output_path = ctx.work_dir / f"{ctx.case['name']}_rebuilt.pdf"
+    return {"run": lambda _: ctx.client.json_to_pdf(pdf_json, output_path)}
+
+
+def _stage_resolve_collisions(ctx: BenchmarkContext) -> Dict[str, Any]:
+    pages = ctx.pdf_json["pages"]
+
+    def run(_):
+        for page in pages:
+            ctx.client._resolve_text_collisions(
+                page.get("textElements", []), page.get("width", 612), page.get("height", 792)
+            )
+
+    return {"run": run}
+
+
+def _stage_word_spacing(ctx: BenchmarkContext) -> Dict[str, Any]:
+    pages = ctx.pdf_json["pages"]
+
+    def run(_):
+        for page in pages:
+            ctx.client._add_word_spacing(page.get("textElements", []), page.get("width", 612))
+
+    return {"run": run}
+
+
+def _stage_replace_text(ctx: BenchmarkContext) -> Dict[str, Any]:
+    from ..json_editor.editor import JSONEditor
+
+    pdf_json = ctx.pdf_json
+    template = ctx.case["template"]
+    data = _synthetic_data(template)
+    # Fields are located on every run (no precomputed locate_fields()), so
+    # this is the cost of a one-off replacement
+    return {
+        "setup": JSONEditor,
+        "run": lambda editor: editor.replace_text(pdf_json, template, data),
+    }
+
+
+def _stage_apply_template(ctx: BenchmarkContext) -> Dict[str, Any]:
+    from ..stirling.direct_edit_client import DirectEditClient
+
+    source = DirectEditClient(ctx.case["path"])
+    template = ctx.case["template"]
+    data = _synthetic_data(template)
+    return {
+        "setup": source.clone,
+        "run": lambda client: client.apply_template(template, data),
+        "teardown": lambda client: client.close(),
+        "cleanup": source.close,
+    }
+
+
+# Stage name -> (factory returning run/setup/teardown/cleanup callables,
+# whether the stage needs a text layer)
+STAGES: Dict[str, tuple] = {
+    "detect": (_stage_detect, False),
+    "pdf_to_json": (_stage_pdf_to_json, False),
+    "json_to_pdf": (_stage_json_to_pdf, False),
+    "resolve_collisions": (_stage_resolve_collisions, True),
+    "word_spacing": (_stage_word_spacing, True),
+    "replace_text": (_stage_replace_text, True),
+    "apply_template": (_stage_apply_template, True),
+}
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def _document_size(ctx: BenchmarkContext) -> Dict[str, int]:
+    pages = ctx.pdf_json["pages"]
+    return {
+        "pages": len(pages),
+        "text_elements": sum(len(p.get("textElements", [])) for p in pages),
+        "vector_elements": sum(
+            len(p.get(key, []))
+            for p in pages
+            for key in ("lineElements", "rectElements", "curveElements")
+        ),
+    }
+
+
+def run_benchmarks(
+    cases: List[Dict[str, Any]],
+    work_dir: Path,
+    stages: List[str] | None = None,
+    warmup: int = 1,
+    repeat: int = 5,
+    on_result: Callable[[Dict[str, Any]], None] | None = None,
+) -> Dict[str, Any]:
+    """Time stages on every corpus document.
+
+    Stages that need a text layer are skipped for scanned documents.
+
+    Args:
+        cases: Corpus cases (see generate_corpus())
+        work_dir: Directory for stage outputs and caches
+        stages: Stage names to run (default: all of STAGES)
+        warmup: Untimed runs per stage and document
+        repeat: Timed runs per stage and document
+        on_result: Optional callback for each result as it is measured
+
+    Returns:
+        Results dict (metadata plus a results list)
+
+    Raises:
+        ValueError: If a stage name is unknown
+    """
+    from .. import __version__
+
+    stages = list(stages or STAGES)
+    unknown = [name for name in stages if name not in STAGES]
+    if unknown:
+        raise ValueError(f"Unknown stages: {', '.join(unknown)} (available: {', '.join(STAGES)})")
+
+    work_dir = Path(work_dir)
+    work_dir.mkdir(parents=True, exist_ok=True)
+
+    results = []
+    for case in cases:
+        ctx = BenchmarkContext(case, work_dir)
+        size = _document_size(ctx)
+        for stage in stages:
+            factory, needs_text = STAGES[stage]
+            if needs_text and case["params"].get("scanned"):
+                continue
+
+            logger.info(f"Benchmarking {stage} on {case['name']}")
+            callables = factory(ctx)
+            try:
+                timing = time_call(
+                    callables["run"],
+                    warmup=warmup,
+                    repeat=repeat,
+                    setup=callables.get("setup"),
+                    teardown=callables.get("teardown"),
+                )
+            finally:
+                if "cleanup" in callables:
+                    callables["cleanup"]()
+
+            result = {
+                "case": case["name"],
+                "stage": stage,
+                "params": case["params"],
+                "size": size,
+                **timing,
+            }
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+
+    return {
+        "schema": RESULTS_SCHEMA,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "version": __version__,
+        "commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "warmup": warmup,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def save_results(results: Dict[str, Any], path: Path) -> None:
+    """Write benchmark results as JSON."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    """Read benchmark results written by save_results()."""
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def compare_results(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.1
+) -> List[Dict[str, Any]]:
+    """Compare median timings of two runs.
+
+    Args:
+        baseline: Results of the reference run
+        current: Results of the new run
+        threshold: Relative change treated as noise (0.1 = 10%)
+
+    Returns:
+        One row per (case, stage) present in both runs, with baseline and
+        current medians, ratio (current / baseline) and status
+        ("regression", "improvement" or "unchanged")
+    """
+    reference = {(r["case"], r["stage"]): r for r in baseline.get("results", [])}
+    rows = []
+    for result in current.get("results", []):
+        before = reference.get((result["case"], result["stage"]))
+        if before is None:
+            continue
+
+        ratio = result["median"] / before["median"] if before["median"] > 0 else float("inf")
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold):
+            status = "improvement"
+        else:
+            status = "unchanged"
+
+        rows.append({
+            "case": result["case"],
+            "stage": result["stage"],
+            "baseline": before["median"],
+            "current": result["median"],
+            "ratio": ratio,
+            "status": status,
+        })
+    return rows
@@ -2,7 +2,7 @@
 
 from typing import Any, Dict
 
-from ..config.settings import Settings
+from ..config.settings import Settings, get_settings
 from ..synthesis.github_models_client import GitHubModelsClient
 from ..utils.logging_utils import get_logger
 
@@ -19,7 +19,7 @@ class ContentClassifier:
             settings: Application settings (loads from env if not provided)
         """
         if settings is None:
-            settings = Settings()
+            settings = get_settings()
 
         self.settings = settings
         self.github_client = GitHubModelsClient(settings)
@@ -28,7 +28,9 @@ class ContentClassifier:
         """Classify which text elements are variable fields.
 
         Args:
-            pdf_json: JSON structure from Stirling PDF
+            pdf_json: JSON structure from Stirling PDF. "pages" may also be an
+                iterator of page dicts (e.g. LocalStirlingClient.iter_pages_json),
+                which is consumed page by page.
 
         Returns:
             Template with variable_fields list
@@ -51,17 +53,32 @@ class ContentClassifier:
                 }
             }
         """
-        total_pages = len(pdf_json.get("pages", []))
-        total_elements = sum(
-            len(page.get("textElements", [])) for page in pdf_json.get("pages", [])
-        )
-        logger.info(
-            f"Starting content classification: {total_pages} pages, {total_elements} text elements"
-        )
+        pages = pdf_json.get("pages", [])
+        counts = {"pages": 0, "elements": 0}
+
+        if isinstance(pages, list):
+            logger.info(
+                f"Starting content classification: {len(pages)} pages, "
+                f"{sum(len(page.get('textElements', [])) for page in pages)} text elements"
+            )
+        else:
+            logger.info("Starting content classification (streaming pages)")
+
+        def count_pages(pages):
+            # Tally pages as the simplification consumes them, so a page
+            # iterator is only walked once
+            for page in pages:
+                counts["pages"] += 1
+                counts["elements"] += len(page.get("textElements", []))
+                yield page
 
         # Use GitHub Models client to classify
         logger.info(f"Sending PDF JSON to LLM for classification (model: {self.settings.github_model})")
-        result = self.github_client.classify_content(pdf_json)
+        result = self.github_client.classify_content(
+            {**pdf_json, "pages": count_pages(pages)}
+        )
+        total_pages = counts["pages"]
+        total_elements = counts["elements"]
 
         # Add metadata
         variable_fields = result.get("variable_fields", [])
@@ -77,7 +94,7 @@ class ContentClassifier:
         logger.info(
             f"Classification complete: {len(variable_fields)} variable fields "
             f"out of {total_elements} total elements "
-            f"({len(variable_fields)/total_elements*100:.1f}%), "
+            f"({len(variable_fields)/max(total_elements, 1)*100:.1f}%), "
             f"{headers_excluded} headers excluded"
         )
 
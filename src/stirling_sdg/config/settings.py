@@ -1,5 +1,6 @@
 """Configuration settings using Pydantic."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 
@@ -38,6 +39,10 @@ class Settings(BaseSettings):
     github_model: str = Field(
         default="openai/gpt-4o", description="GitHub Models model to use"
     )
+    llm_base_url: str = Field(
+        default="https://models.github.ai/inference",
+        description="OpenAI-compatible chat completions endpoint (e.g. a local mock-llm server)",
+    )
     classification_temperature: float = Field(
         default=0.3, description="Temperature for classification LLM calls"
     )
@@ -50,6 +55,25 @@ class Settings(BaseSettings):
     max_tokens_synthesis: int = Field(
         default=500, description="Max tokens for synthesis"
     )
+    llm_rate_limit_calls: int = Field(
+        default=50, description="Max LLM requests per rate limit period"
+    )
+    llm_rate_limit_period: int = Field(
+        default=60, description="LLM rate limit period in seconds"
+    )
+    llm_max_concurrency: int = Field(
+        default=8, description="Max in-flight requests for the async LLM client"
+    )
+    llm_retry_base_delay: float = Field(
+        default=10.0,
+        description="Backoff after a rate-limited LLM request in seconds (doubles per retry)",
+    )
+    llm_cache_enabled: bool = Field(
+        default=True, description="Cache classification LLM responses on disk"
+    )
+    llm_cache_max_mb: int = Field(
+        default=256, description="Max size of the LLM response cache in MB"
+    )
 
     # OCR Settings
     ocr_languages: str = Field(
@@ -58,10 +82,39 @@ class Settings(BaseSettings):
     ocr_render_type: str = Field(
         default="hocr", description="OCR render type (hocr or sandwich)"
     )
+    ocr_cache_enabled: bool = Field(
+        default=True, description="Cache OCR and image conversion results on disk"
+    )
+    ocr_cache_max_mb: int = Field(
+        default=1024, description="Max size of the OCR cache in MB"
+    )
 
     # Processing
     pdf_dpi: int = Field(default=300, description="DPI for PDF/image processing")
     batch_size: int = Field(default=10, description="Batch processing size")
+    synthesis_workers: int = Field(
+        default=2, description="Concurrent synthesis producers in batch mode"
+    )
+    pipeline_queue_size: int = Field(
+        default=32, description="Capacity of the synthesis -> render queue in batch mode"
+    )
+    extraction_workers: int = Field(
+        default=1, description="Processes for page-parallel PDF to JSON extraction"
+    )
+    extraction_engine: str = Field(
+        default="pdfplumber", description="PDF to JSON extraction engine (pdfplumber or pymupdf)"
+    )
+    static_layer: bool = Field(
+        default=False,
+        description="Batch reconstruction renders static content once and overlays variable text",
+    )
+    auto_template_match: bool = Field(
+        default=True,
+        description="Reuse a saved template when the input's layout fingerprint matches",
+    )
+    template_match_threshold: float = Field(
+        default=0.9, description="Minimum fingerprint similarity for template reuse"
+    )
 
     # Paths
     data_dir: Path = Field(default=Path("./data"), description="Data directory")
@@ -84,6 +137,12 @@ class Settings(BaseSettings):
         default=Path("./logs/stirling_sdg.log"), description="Log file path"
     )
 
+    # Metrics
+    metrics_textfile: Path | None = Field(
+        default=None,
+        description="Prometheus textfile-collector file, rewritten after every pipeline run",
+    )
+
     def __init__(self, **kwargs):
         """Initialize settings and create directories."""
         super().__init__(**kwargs)
@@ -107,3 +166,17 @@ class Settings(BaseSettings):
     def ocr_languages_list(self) -> List[str]:
         """Get OCR languages as a list."""
         return [lang.strip() for lang in self.ocr_languages.split(",")]
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide Settings instance.
+
+    The environment and .env are read (and directories created) once per
+    process; components that are not handed explicit settings share this
+    instance. Call get_settings.cache_clear() to reload.
+
+    Returns:
+        Shared Settings instance
+    """
+    return Settings()
@@ -0,0 +1,186 @@
+"""Layout fingerprints for recognizing filled instances of the same form.
+
+A fingerprint captures the static skeleton of a document:
+- page sizes
+- label words (alphabetic tokens per page, minus the template's variable text)
+- line/rectangle geometry, quantized to a small grid
+
+Two fingerprints are compared with an F2 score per component (recall of the
+stored skeleton weighs more than precision, since a new instance adds its own
+variable values on top of the shared labels).
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+from ..utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+FINGERPRINT_VERSION = 1
+
+# Geometry coordinates are rounded to this grid (points)
+GEOMETRY_GRID = 2.0
+
+# Page sizes must agree within this tolerance (points)
+PAGE_SIZE_TOLERANCE = 2.0
+
+# Component weights in the combined similarity score
+LABEL_WEIGHT = 0.7
+GEOMETRY_WEIGHT = 0.3
+
+_TOKEN_RE = re.compile(r"[a-z]{2,}")
+
+
+def _tokens(text: str) -> List[str]:
+    """Split text into lowercase alphabetic label tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _segment_key(page_number: int, kind: str, x0: float, y0: float, x1: float, y1: float) -> str:
+    """Quantized, direction-independent key for a line or rectangle."""
+    a = (round(x0 / GEOMETRY_GRID), round(y0 / GEOMETRY_GRID))
+    b = (round(x1 / GEOMETRY_GRID), round(y1 / GEOMETRY_GRID))
+    a, b = min(a, b), max(a, b)
+    return f"{page_number}:{kind}:{a[0]}:{a[1]}:{b[0]}:{b[1]}"
+
+
+def compute_fingerprint(
+    pdf_json: Dict[str, Any], exclude_texts: Iterable[str] = ()
+) -> Dict[str, Any]:
+    """Compute a layout fingerprint from PDF JSON.
+
+    Args:
+        pdf_json: PDF JSON with pages of textElements and optional
+            lineElements/rectElements and width/height
+        exclude_texts: Variable field texts to leave out of the label set
+
+    Returns:
+        Fingerprint dict (JSON-serializable)
+    """
+    excluded = set()
+    for text in exclude_texts:
+        excluded.update(_tokens(text))
+
+    pages = []
+    labels = set()
+    geometry = set()
+
+    for index, page in enumerate(pdf_json.get("pages", []), start=1):
+        page_number = page.get("pageNumber") or page.get("number") or index
+        pages.append([round(page.get("width", 0), 1), round(page.get("height", 0), 1)])
+
+        for elem in page.get("textElements", []):
+            for token in _tokens(elem.get("text", "")):
+                if token not in excluded:
+                    labels.add(f"{page_number}:{token}")
+
+        for line in page.get("lineElements", []):
+            geometry.add(
+                _segment_key(
+                    page_number, "L",
+                    line.get("x0", 0), line.get("y0", 0), line.get("x1", 0), line.get("y1", 0),
+                )
+            )
+        for rect in page.get("rectElements", []):
+            geometry.add(
+                _segment_key(
+                    page_number, "R",
+                    rect.get("x0", 0), rect.get("y0", 0), rect.get("x1", 0), rect.get("y1", 0),
+                )
+            )
+
+    return {
+        "version": FINGERPRINT_VERSION,
+        "pages": pages,
+        "labels": sorted(labels),
+        "geometry": sorted(geometry),
+    }
+
+
+def fingerprint_pdf(pdf_path: Path, exclude_texts: Iterable[str] = ()) -> Dict[str, Any]:
+    """Compute a layout fingerprint directly from a PDF file using PyMuPDF.
+
+    This is a single cheap pass (words and drawings per page) that needs no
+    document type detection, OCR or LLM call. Scanned PDFs yield no label
+    words, so they will not match text-bearing fingerprints.
+
+    Args:
+        pdf_path: Path to PDF
+        exclude_texts: Variable field texts to leave out of the label set
+
+    Returns:
+        Fingerprint dict (JSON-serializable)
+    """
+    import fitz
+
+    pages = []
+    with fitz.open(pdf_path) as doc:
+        for page_num, page in enumerate(doc, start=1):
+            text_elements = [{"text": w[4]} for w in page.get_text("words")]
+
+            line_elements = []
+            rect_elements = []
+            for drawing in page.get_drawings():
+                for item in drawing.get("items", []):
+                    if item[0] == "l":
+                        p1, p2 = item[1], item[2]
+                        line_elements.append({"x0": p1.x, "y0": p1.y, "x1": p2.x, "y1": p2.y})
+                    elif item[0] == "re":
+                        r = item[1]
+                        rect_elements.append({"x0": r.x0, "y0": r.y0, "x1": r.x1, "y1": r.y1})
+
+            pages.append({
+                "pageNumber": page_num,
+                "width": page.rect.width,
+                "height": page.rect.height,
+                "textElements": text_elements,
+                "lineElements": line_elements,
+                "rectElements": rect_elements,
+            })
+
+    return compute_fingerprint({"pages": pages}, exclude_texts=exclude_texts)
+
+
+def _f2(stored: set, candidate: set) -> float:
+    """F2 score of candidate against stored (recall weighted over precision)."""
+    overlap = len(stored & candidate)
+    if not overlap:
+        return 0.0
+    recall = overlap / len(stored)
+    precision = overlap / len(candidate)
+    return 5 * precision * recall / (4 * precision + recall)
+
+
+def similarity(stored: Dict[str, Any], candidate: Dict[str, Any]) -> float:
+    """Compare a stored template fingerprint with a candidate document's.
+
+    Args:
+        stored: Fingerprint saved with a template
+        candidate: Fingerprint of the document being processed
+
+    Returns:
+        Score in [0, 1]; 0 if versions, page count or page sizes differ
+    """
+    if stored.get("version") != candidate.get("version"):
+        return 0.0
+
+    stored_pages = stored.get("pages", [])
+    candidate_pages = candidate.get("pages", [])
+    if len(stored_pages) != len(candidate_pages):
+        return 0.0
+    for (sw, sh), (cw, ch) in zip(stored_pages, candidate_pages):
+        if abs(sw - cw) > PAGE_SIZE_TOLERANCE or abs(sh - ch) > PAGE_SIZE_TOLERANCE:
+            return 0.0
+
+    weighted = []
+    for key, weight in (("labels", LABEL_WEIGHT), ("geometry", GEOMETRY_WEIGHT)):
+        stored_set = set(stored.get(key, []))
+        if not stored_set:
+            continue
+        weighted.append((weight, _f2(stored_set, set(candidate.get(key, [])))))
+
+    if not weighted:
+        return 0.0
+    return sum(w * score for w, score in weighted) / sum(w for w, _ in weighted)
@@ -1,31 +1,39 @@
 """JSON editor for replacing text values in Stirling PDF JSON."""
 
-import copy
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 from ..utils.logging_utils import get_logger
+from .text_index import TextIndex, normalize_text
 
 logger = get_logger(__name__)
 
 
 class JSONEditor:
-    """Edits text values in Stirling PDF JSON structure."""
+    """Edits text values in Stirling PDF JSON structure (stateless, thread-safe)."""
 
     def replace_text(
         self,
         pdf_json: Dict[str, Any],
         template: Dict[str, Any],
         synthetic_data: Dict[str, Any],
+        located: List[Tuple[int, int, Dict[str, Any]]] | None = None,
     ) -> Dict[str, Any]:
         """Replace variable text elements with synthetic data.
 
+        Callers that replace text in the same document repeatedly (one call
+        per variation) should locate the fields once with locate_fields() and
+        pass the result, so each call only applies the values.
+
         Args:
             pdf_json: Original PDF JSON from Stirling
             template: Classification result with variable_fields
             synthetic_data: Dict mapping field_type to synthetic value
+            located: locate_fields(pdf_json, template), if already computed
 
         Returns:
-            Modified JSON with synthetic text
+            Modified JSON with synthetic text. The result is copy-on-write: it
+            shares every page and element that was not changed with pdf_json,
+            so neither should be mutated afterwards (json_to_pdf only reads).
 
         Example:
             pdf_json = {"pages": [{"textElements": [{"text": "John"}]}]}
@@ -36,72 +44,98 @@ class JSONEditor:
         variable_fields = template.get("variable_fields", [])
         logger.info(f"Starting text replacement: {len(variable_fields)} variable fields to replace")
 
-        # Deep copy to avoid mutating original
-        modified_json = copy.deepcopy(pdf_json)
+        if located is None:
+            located = self.locate_fields(pdf_json, template)
 
-        replacements_made = 0
+        # Copy-on-write: only the pages list, the textElements lists of pages
+        # with replacements and the replaced elements are copied; everything
+        # else is shared with pdf_json
+        modified_json = dict(pdf_json)
+        if "pages" in pdf_json:
+            modified_json["pages"] = list(pdf_json["pages"])
+        copied_pages: Dict[int, List[Dict[str, Any]]] = {}
 
-        # Group variable fields by page for efficiency
-        elements_by_page = {}
-        for elem in variable_fields:
-            page_num = elem.get("pageNumber", 1)
-            # Safety check: ensure pageNumber is not None
-            if page_num is None:
-                logger.warning(f"pageNumber is None for element: {elem.get('text', 'UNKNOWN')}, defaulting to 1")
-                page_num = 1
-            if page_num not in elements_by_page:
-                elements_by_page[page_num] = []
-            elements_by_page[page_num].append(elem)
+        replacements_made = 0
 
-        logger.info(f"Fields grouped across {len(elements_by_page)} pages")
+        for page_index, elem_index, field in located:
+            field_type = field.get("fieldType")
+            synthetic_value = synthetic_data.get(field_type)
 
-        # Process each page
-        for page_num, page_elements in elements_by_page.items():
-            logger.debug(f"Processing page {page_num} with {len(page_elements)} variable fields")
-            # Find the corresponding page in JSON
-            page_index = page_num - 1  # Pages are 1-indexed in template
-            if page_index >= len(modified_json.get("pages", [])):
-                logger.warning(f"Page {page_num} not found in PDF JSON")
+            if synthetic_value is None:
+                logger.warning(
+                    f"No synthetic value for field_type: {field_type}"
+                )
                 continue
 
-            page = modified_json["pages"][page_index]
-            text_elements = page.get("textElements", [])
-
-            # Replace text for each variable element
-            for var_elem in page_elements:
-                original_text = var_elem.get("text", "")
-                field_type = var_elem.get("fieldType")
-                synthetic_value = synthetic_data.get(field_type)
-
-                if synthetic_value is None:
-                    logger.warning(
-                        f"No synthetic value for field_type: {field_type}"
-                    )
-                    continue
-
-                # Find and replace the text element
-                # Strategy: find exact text match on this page
-                replaced = False
-                for text_elem in text_elements:
-                    if text_elem.get("text", "").strip() == original_text.strip():
-                        # Replace the text
-                        old_text = text_elem["text"]
-                        text_elem["text"] = str(synthetic_value)
-                        replacements_made += 1
-                        replaced = True
-                        logger.debug(
-                            f"Replaced '{old_text}' → '{synthetic_value}' "
-                            f"(page {page_num}, field: {field_type})"
-                        )
-                        break  # Only replace first match
-
-                if not replaced:
-                    logger.warning(
-                        f"Could not find text '{original_text}' on page {page_num}"
-                    )
+            text_elements = copied_pages.get(page_index)
+            if text_elements is None:
+                page = modified_json["pages"][page_index]
+                text_elements = list(page.get("textElements", []))
+                modified_json["pages"][page_index] = {**page, "textElements": text_elements}
+                copied_pages[page_index] = text_elements
+
+            # Replace the text
+            text_elem = text_elements[elem_index]
+            text_elements[elem_index] = {**text_elem, "text": str(synthetic_value)}
+            replacements_made += 1
+            logger.debug(
+                f"Replaced '{text_elem.get('text', '')}' → '{synthetic_value}' "
+                f"(page {page_index + 1}, field: {field_type})"
+            )
 
         logger.info(
             f"Text replacement complete: {replacements_made} replacements made"
         )
 
         return modified_json
+
+    @staticmethod
+    def locate_fields(
+        pdf_json: Dict[str, Any], template: Dict[str, Any]
+    ) -> List[Tuple[int, int, Dict[str, Any]]]:
+        """Find the text element each variable field refers to.
+
+        A field matches an element on its page with the same text (ignoring
+        surrounding whitespace). When several fields on a page share a text,
+        the k-th such field refers to the k-th occurrence, independent of
+        which fields later get a value.
+
+        Args:
+            pdf_json: Original PDF JSON
+            template: Classification result with variable_fields
+
+        Returns:
+            List of (page index, element index, field) for every located field
+        """
+        index = TextIndex(pdf_json)
+        # (page index, normalized text) -> occurrences already claimed
+        claimed: Dict[Tuple[int, str], int] = {}
+        located = []
+
+        for field in template.get("variable_fields", []):
+            page_num = field.get("pageNumber", 1)
+            # Safety check: ensure pageNumber is not None
+            if page_num is None:
+                logger.warning(f"pageNumber is None for element: {field.get('text', 'UNKNOWN')}, defaulting to 1")
+                page_num = 1
+            page_index = page_num - 1  # Pages are 1-indexed in template
+            if not 0 <= page_index < len(index):
+                logger.warning(f"Page {page_num} not found in PDF JSON")
+                continue
+
+            original_text = normalize_text(field.get("text", ""))
+            positions = index.positions(page_index, original_text)
+            occurrence = claimed.get((page_index, original_text), 0)
+            if occurrence >= len(positions):
+                logger.warning(
+                    f"Could not find text '{field.get('text', '')}' on page {page_num}"
+                )
+                continue
+
+            claimed[(page_index, original_text)] = occurrence + 1
+            located.append((page_index, positions[occurrence], field))
+
+        logger.debug(
+            f"Located {len(located)}/{len(template.get('variable_fields', []))} variable fields"
+        )
+        return located
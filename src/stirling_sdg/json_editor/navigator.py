@@ -6,6 +6,22 @@ from typing import Any, Dict, List
 class JSONNavigator:
     """Helper utilities for traversing PDF JSON structure."""
 
+    @staticmethod
+    def page_number(page: Dict[str, Any], position: int) -> int:
+        """Get the 1-indexed number of a page.
+
+        The extractors emit "pageNumber"; "number" is accepted for older JSON,
+        and the page's position is used if neither is present.
+
+        Args:
+            page: Page dict from PDF JSON
+            position: 0-based position of the page in pdf_json["pages"]
+
+        Returns:
+            Page number
+        """
+        return page.get("pageNumber") or page.get("number") or position + 1
+
     @staticmethod
     def find_element_by_text(
         pdf_json: Dict[str, Any], text: str, page_number: int | None = None
@@ -22,17 +38,20 @@ class JSONNavigator:
         """
         matches = []
 
-        pages = pdf_json.get("pages", [])
-        for page in pages:
-            current_page_num = page.get("number", 0)
-
-            # Skip if page_number specified and doesn't match
-            if page_number is not None and current_page_num != page_number:
-                continue
-
+        if page_number is not None:
+            page = JSONNavigator.get_page(pdf_json, page_number)
+            pages = [(page_number, page)] if page is not None else []
+        else:
+            pages = [
+                (JSONNavigator.page_number(page, position), page)
+                for position, page in enumerate(pdf_json.get("pages", []))
+            ]
+
+        needle = text.strip().lower()
+        for current_page_num, page in pages:
             # Search text elements
             for elem in page.get("textElements", []):
-                if text.strip().lower() in elem.get("text", "").strip().lower():
+                if needle in elem.get("text", "").strip().lower():
                     matches.append(
                         {
                             "pageNumber": current_page_num,
@@ -54,8 +73,15 @@ class JSONNavigator:
             Page dict or None if not found
         """
         pages = pdf_json.get("pages", [])
-        for page in pages:
-            if page.get("number") == page_number:
+
+        # Pages are normally stored in order, so check the expected position first
+        position = page_number - 1
+        if 0 <= position < len(pages):
+            if JSONNavigator.page_number(pages[position], position) == page_number:
+                return pages[position]
+
+        for position, page in enumerate(pages):
+            if JSONNavigator.page_number(page, position) == page_number:
                 return page
         return None
 
@@ -0,0 +1,46 @@
+"""Text-to-element index over PDF JSON."""
+
+from typing import Any, Dict, List
+
+
+def normalize_text(text: str) -> str:
+    """Normalize element text for matching (surrounding whitespace is ignored)."""
+    return text.strip()
+
+
+class TextIndex:
+    """Maps page index -> normalized text -> element indices, in page order.
+
+    Built once per PDF JSON so that locating a text is a dict lookup instead of
+    a scan over the page's textElements.
+    """
+
+    def __init__(self, pdf_json: Dict[str, Any]):
+        """Build index.
+
+        Args:
+            pdf_json: PDF JSON with pages of textElements
+        """
+        self._pages: List[Dict[str, List[int]]] = []
+        for page in pdf_json.get("pages", []):
+            positions: Dict[str, List[int]] = {}
+            for elem_index, elem in enumerate(page.get("textElements", [])):
+                positions.setdefault(normalize_text(elem.get("text", "")), []).append(elem_index)
+            self._pages.append(positions)
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def positions(self, page_index: int, text: str) -> List[int]:
+        """Get the indices of elements on a page whose text matches.
+
+        Args:
+            page_index: 0-based page position
+            text: Text to look up (normalized before lookup)
+
+        Returns:
+            Element indices in textElements order (empty if none or no such page)
+        """
+        if not 0 <= page_index < len(self._pages):
+            return []
+        return self._pages[page_index].get(normalize_text(text), [])
@@ -6,7 +6,7 @@ from typing import Any, Dict
 
 import yaml
 
-from ..config.settings import Settings
+from ..config.settings import Settings, get_settings
 from ..utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -22,7 +22,7 @@ class ConfigManager:
             settings: Application settings (loads from env if not provided)
         """
         if settings is None:
-            settings = Settings()
+            settings = get_settings()
 
         self.settings = settings
         self.pipeline_dir = settings.config_dir / "pipeline_templates"
@@ -1,16 +1,31 @@
 """Pipeline orchestrator for coordinating the complete workflow."""
 
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import List
+from typing import Callable, List, Tuple
 
-from ..config.settings import Settings
+from ..config.settings import Settings, get_settings
 from ..stirling.client import StirlingClient
 from ..stirling.direct_edit_client import DirectEditClient
+from ..stirling.static_layer import StaticLayer
 from ..detection.detector import DocumentDetector
+from ..detection.fingerprint import compute_fingerprint, fingerprint_pdf
 from ..classification.classifier import ContentClassifier
 from ..synthesis.generator import SyntheticDataGenerator
 from ..json_editor.editor import JSONEditor
+from .stages import RenderPool, StagedBatchRunner
+from .template_index import (
+    TemplateIndex,
+    rebind_direct_edit_template,
+    rebind_reconstruction_template,
+)
+from .workers import VariationRenderer
+from ..utils.disk_cache import file_digest
 from ..utils.logging_utils import get_logger
+from ..utils.metrics import OUTPUT_BYTES, VARIATIONS, write_textfile
+from ..utils.timing import RunReport, file_size, span
 
 logger = get_logger(__name__)
 
@@ -18,40 +33,68 @@ logger = get_logger(__name__)
 class PipelineOrchestrator:
     """Orchestrates the end-to-end synthetic data generation workflow."""
 
-    def __init__(self, settings: Settings | None = None):
+    def __init__(self, settings: Settings | None = None, document_cache_size: int = 0):
         """Initialize orchestrator with all components.
 
         Args:
             settings: Application settings (loads from env if not provided)
+            document_cache_size: Number of prepared documents (template, type
+                and extracted JSON) to keep in memory, keyed by path, mtime and
+                size; repeated jobs on the same file then skip detection,
+                OCR, extraction and classification. 0 disables the cache
+                (one-shot CLI use); long-running servers enable it.
         """
         if settings is None:
-            settings = Settings()
+            settings = get_settings()
 
         self.settings = settings
 
         # Initialize all components
         self.detector = DocumentDetector()
-        self.stirling = StirlingClient(cache_dir=settings.cache_dir)
+        self.stirling = StirlingClient(
+            cache_dir=settings.cache_dir,
+            extraction_workers=settings.extraction_workers,
+            extraction_engine=settings.extraction_engine,
+            ocr_cache_enabled=settings.ocr_cache_enabled,
+            ocr_cache_max_mb=settings.ocr_cache_max_mb,
+        )
         self.classifier = ContentClassifier(settings)
         self.generator = SyntheticDataGenerator(settings)
         self.json_editor = JSONEditor()
+        self.template_index = TemplateIndex(settings.config_dir / "templates")
+
+        self.document_cache_size = document_cache_size
+        self._documents: OrderedDict = OrderedDict()
+        self._documents_lock = threading.Lock()
+
+        # Performance report of the most recent process_single/process_batch call
+        self.last_report: RunReport | None = None
 
         logger.info("PipelineOrchestrator initialized")
 
     def process_single(
-        self, input_path: Path, output_path: Path, save_template: bool = False
+        self,
+        input_path: Path,
+        output_path: Path,
+        save_template: bool = False,
+        report_path: Path | None = None,
     ) -> Path:
         """Process a single document through the complete pipeline.
 
+        Timings of every step are collected in self.last_report.
+
         Args:
             input_path: Path to input PDF or image
             output_path: Path for output PDF
             save_template: If True, save classification template for reuse
+            report_path: Optional path for the JSON performance report
 
         Returns:
             Path to generated PDF
 
         Workflow:
+            0. If the input's layout fingerprint matches a saved template,
+               reuse it (skips detection and classification)
             For native PDFs (digital_pdf):
                 1. Use DirectEditClient for fast, layout-preserving edits
             For scanned PDFs/images:
@@ -73,158 +116,94 @@ class PipelineOrchestrator:
         logger.info(f"Processing single document: {input_path.name}")
         logger.info(f"Output will be saved to: {output_path}")
 
-        # Step 1: Detect document type
-        doc_type = self.detector.detect(input_path)
-        logger.info(f"Document type: {doc_type}")
+        report = RunReport("single", input_path, output=str(output_path))
+        try:
+            with report.activate():
+                template, doc_type, pdf_json = self._prepare_template(input_path, save_template)
 
-        # Route based on document type
-        if doc_type == "digital_pdf":
-            # Use direct editing path for native PDFs (faster, preserves layout)
-            return self._process_native_pdf(input_path, output_path, save_template)
-        else:
-            # Use OCR + reconstruction path for scanned/images
-            return self._process_scanned_pdf(input_path, output_path, doc_type, save_template)
+                # Route based on template type
+                if template.get("type") == "direct_edit":
+                    # Use direct editing path for native PDFs (faster, preserves layout)
+                    result = self._process_native_pdf(input_path, output_path, template)
+                else:
+                    # Use OCR + reconstruction path for scanned/images
+                    result = self._process_scanned_pdf(pdf_json, output_path, template)
+            VARIATIONS.inc(mode="single", outcome="rendered")
+            OUTPUT_BYTES.inc(file_size(result))
+            return result
+        except Exception:
+            VARIATIONS.inc(mode="single", outcome="failed")
+            raise
+        finally:
+            self._finish_report(report, report_path)
 
     def _process_native_pdf(
-        self, input_path: Path, output_path: Path, save_template: bool = False
+        self, input_path: Path, output_path: Path, template: dict
     ) -> Path:
         """Process native PDF using direct editing (fast, preserves layout).
 
         Args:
             input_path: Path to native PDF
             output_path: Path for output PDF
-            save_template: If True, save template for reuse
+            template: direct_edit template for this document
 
         Returns:
             Path to generated PDF
         """
         logger.info("Using direct editing path for native PDF")
 
-        # Step 1: Extract text elements with styles
-        with DirectEditClient(input_path) as client:
-            text_elements = client.extract_text_elements()
-
-            # Build a pseudo-JSON for classification
-            # Group elements by page
-            pages_data = {}
-            for elem in text_elements:
-                page_num = elem["page"] + 1  # 1-indexed for classifier
-                if page_num not in pages_data:
-                    pages_data[page_num] = []
-                pages_data[page_num].append({
-                    "text": elem["text"],
-                    "x": elem["rect"][0],
-                    "y": elem["rect"][1],
-                    "width": elem["rect"][2] - elem["rect"][0],
-                    "height": elem["rect"][3] - elem["rect"][1],
-                    "fontSize": elem["size"],
-                    "fontName": elem["font"],
-                })
-
-            pdf_json = {
-                "pages": [
-                    {"pageNumber": pn, "textElements": elems}
-                    for pn, elems in sorted(pages_data.items())
-                ]
-            }
-
-            # Step 2: Classify variable fields
-            logger.info("Classifying variable fields...")
-            template = self.classifier.classify(pdf_json)
-
-            # Enrich template with direct-edit metadata
-            template["type"] = "direct_edit"
-            template["source_file"] = str(input_path)
-
-            # Add positional info from extracted elements for direct replacement
-            for field in template.get("variable_fields", []):
-                field_text = field.get("text", "")
-                # Find matching element to get exact position and style
-                for elem in text_elements:
-                    if elem["text"] == field_text:
-                        field["rect"] = elem["rect"]
-                        field["font"] = elem["font"]
-                        field["size"] = elem["size"]
-                        field["color"] = elem["color"]
-                        field["page"] = elem["page"]
-                        break
-
-            # Save template if requested
-            if save_template:
-                template_path = (
-                    self.settings.config_dir
-                    / "templates"
-                    / f"{input_path.stem}_template.json"
-                )
-                self._save_template(template, template_path)
-                logger.info(f"Template saved to: {template_path}")
-
-            # Step 3: Generate synthetic data
-            logger.info("Generating synthetic data...")
+        # Generate synthetic data
+        logger.info("Generating synthetic data...")
+        with span("synthesis"):
             synthetic_data = self.generator.generate(template)
 
-            # Step 4: Apply replacements directly
+        with DirectEditClient(input_path) as client:
+            # Apply replacements directly
             logger.info("Applying direct replacements...")
-            count = client.apply_template(template, synthetic_data)
+            with span("replacement"):
+                count = client.apply_plan(template["replacement_plan"], synthetic_data)
             logger.info(f"Made {count} replacements")
 
-            # Step 5: Save output
-            result = client.save(output_path)
+            # Save output
+            with span("save") as save_span:
+                result = client.save(output_path)
+                save_span.bytes_out = file_size(result)
             logger.info(f"Successfully generated: {result}")
             return result
 
     def _process_scanned_pdf(
-        self, input_path: Path, output_path: Path, doc_type: str, save_template: bool = False
+        self, pdf_json: dict, output_path: Path, template: dict
     ) -> Path:
         """Process scanned PDF/image using OCR + JSON reconstruction.
 
         Args:
-            input_path: Path to scanned PDF or image
+            pdf_json: Extracted JSON of the searchable PDF
             output_path: Path for output PDF
-            doc_type: Document type from detector
-            save_template: If True, save template for reuse
+            template: reconstruction template for this document
 
         Returns:
             Path to generated PDF
         """
         logger.info("Using OCR + reconstruction path for scanned document")
 
-        # Step 1: Ensure searchable PDF
-        searchable_pdf = self._ensure_searchable(input_path, doc_type)
-
-        # Step 2: PDF → JSON
-        logger.info("Extracting PDF to JSON...")
-        pdf_json = self.stirling.pdf_to_json(searchable_pdf)
-
-        # Step 3: Classify variable fields
-        logger.info("Classifying variable fields...")
-        template = self.classifier.classify(pdf_json)
-        template["type"] = "reconstruction"
-
-        # Save template if requested
-        if save_template:
-            template_path = (
-                self.settings.config_dir
-                / "templates"
-                / f"{input_path.stem}_template.json"
-            )
-            self._save_template(template, template_path)
-            logger.info(f"Template saved to: {template_path}")
-
-        # Step 4: Generate synthetic data
+        # Generate synthetic data
         logger.info("Generating synthetic data...")
-        synthetic_data = self.generator.generate(template)
+        with span("synthesis"):
+            synthetic_data = self.generator.generate(template)
 
-        # Step 5: Replace text in JSON
+        # Replace text in JSON
         logger.info("Replacing text in JSON...")
-        modified_json = self.json_editor.replace_text(
-            pdf_json, template, synthetic_data
-        )
+        with span("replacement"):
+            modified_json = self.json_editor.replace_text(
+                pdf_json, template, synthetic_data
+            )
 
-        # Step 6: JSON → PDF
+        # JSON → PDF
         logger.info("Reconstructing PDF from JSON...")
         try:
-            result = self.stirling.json_to_pdf(modified_json, output_path)
+            with span("render") as render_span:
+                result = self.stirling.json_to_pdf(modified_json, output_path)
+                render_span.bytes_out = file_size(result)
             logger.info(f"Successfully generated: {result}")
             return result
         except Exception as e:
@@ -238,151 +217,450 @@ class PipelineOrchestrator:
             logger.info(f"Modified JSON saved to: {fallback_path}")
             raise
 
+    def _prepare_template(
+        self, input_path: Path, save_template: bool = False
+    ) -> Tuple[dict, str, dict | None]:
+        """Get the template for a document, using the prepared-document cache.
+
+        Cached results are shared between jobs and must be treated as
+        read-only.
+
+        Args:
+            input_path: Path to input PDF or image
+            save_template: If True, save and index a newly classified template
+
+        Returns:
+            Tuple of (template, doc_type, pdf_json); pdf_json is None for
+            direct_edit templates
+        """
+        if self.document_cache_size <= 0:
+            return self._prepare_document(input_path, save_template)
+
+        stat = input_path.stat()
+        key = (str(input_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        with self._documents_lock:
+            prepared = self._documents.get(key)
+            if prepared is not None:
+                self._documents.move_to_end(key)
+        if prepared is not None:
+            logger.info(f"Reusing prepared document: {input_path.name}")
+            return prepared
+
+        prepared = self._prepare_document(input_path, save_template)
+        with self._documents_lock:
+            self._documents[key] = prepared
+            while len(self._documents) > self.document_cache_size:
+                self._documents.popitem(last=False)
+        return prepared
+
+    def _prepare_document(
+        self, input_path: Path, save_template: bool = False
+    ) -> Tuple[dict, str, dict | None]:
+        """Get the template for a document, reusing a saved one when possible.
+
+        The layout fingerprint is checked first (before detection), and for
+        scanned documents again after OCR extraction. A matched template is
+        re-bound to this document's field values; if that fails, or nothing
+        matches, the document is classified as usual.
+
+        Args:
+            input_path: Path to input PDF or image
+            save_template: If True, save and index a newly classified template
+
+        Returns:
+            Tuple of (template, doc_type, pdf_json); pdf_json is None for
+            direct_edit templates
+        """
+        matched = None
+        if self.settings.auto_template_match and input_path.suffix.lower() == ".pdf":
+            with span("template_match", bytes_in=file_size(input_path)):
+                matched = self._match_template(fingerprint_pdf(input_path))
+
+        if matched is not None:
+            doc_type = matched[1]
+        else:
+            with span("detect", bytes_in=file_size(input_path)):
+                doc_type = self.detector.detect(input_path)
+        logger.info(f"Document type: {doc_type}")
+
+        if doc_type == "digital_pdf":
+            with DirectEditClient(input_path) as client:
+                with span("extraction", bytes_in=file_size(input_path)):
+                    text_elements = client.extract_text_elements()
+
+                template = None
+                if matched is not None:
+                    template = rebind_direct_edit_template(matched[0], text_elements)
+
+                classified = template is None
+                if classified:
+                    logger.info("Classifying variable fields...")
+                    with span("classification"):
+                        template = self.classifier.classify(
+                            self._build_classification_json(text_elements)
+                        )
+                    template["type"] = "direct_edit"
+
+                    # Add positional info from extracted elements for direct replacement
+                    for field in template.get("variable_fields", []):
+                        field_text = field.get("text", "")
+                        # Find matching element to get exact position and style
+                        for elem in text_elements:
+                            if elem["text"] == field_text:
+                                field["rect"] = elem["rect"]
+                                field["font"] = elem["font"]
+                                field["size"] = elem["size"]
+                                field["color"] = elem["color"]
+                                field["page"] = elem["page"]
+                                break
+
+                # Locate every occurrence once; variations only execute the plan
+                with span("replacement_plan"):
+                    template["replacement_plan"] = client.compile_plan(template)
+
+            template["source_file"] = str(input_path.resolve())
+            template["source_digest"] = file_digest(input_path)
+            if classified and save_template:
+                self._register_template(
+                    input_path,
+                    template,
+                    doc_type,
+                    fingerprint_pdf(input_path, exclude_texts=self._field_texts(template)),
+                )
+
+            return template, doc_type, None
+
+        # Scanned PDF / image: OCR, then extract
+        searchable_pdf = self._ensure_searchable(input_path, doc_type)
+        logger.info("Extracting PDF to JSON...")
+        pdf_json = self._extract(searchable_pdf)
+
+        if matched is None and self.settings.auto_template_match:
+            matched = self._match_template(compute_fingerprint(pdf_json))
+
+        template = None
+        if matched is not None:
+            template = rebind_reconstruction_template(matched[0], pdf_json)
+
+        if template is None:
+            logger.info("Classifying variable fields...")
+            with span("classification"):
+                template = self.classifier.classify(pdf_json)
+            template["type"] = "reconstruction"
+
+            # Record field positions so the template can be re-bound to other
+            # instances of the same form
+            for field in template.get("variable_fields", []):
+                field_text = field.get("text", "").strip()
+                for page in pdf_json.get("pages", []):
+                    if page.get("pageNumber") != field.get("pageNumber", 1):
+                        continue
+                    for elem in page.get("textElements", []):
+                        if elem.get("text", "").strip() == field_text:
+                            field["bbox"] = [
+                                elem["x"],
+                                elem["y"],
+                                elem["x"] + elem["width"],
+                                elem["y"] + elem["height"],
+                            ]
+                            break
+
+            if save_template:
+                self._register_template(
+                    input_path,
+                    template,
+                    doc_type,
+                    compute_fingerprint(pdf_json, exclude_texts=self._field_texts(template)),
+                )
+
+        return template, doc_type, pdf_json
+
+    def _match_template(self, fingerprint: dict) -> Tuple[dict, str] | None:
+        """Look up a saved template by layout fingerprint.
+
+        Args:
+            fingerprint: Fingerprint of the document being processed
+
+        Returns:
+            Tuple of (stored template, doc_type) or None
+        """
+        match = self.template_index.match(
+            fingerprint, self.settings.template_match_threshold
+        )
+        if match is None:
+            return None
+
+        name, doc_type, _ = match
+        return self._load_template(self.template_index.template_path(name)), doc_type
+
+    def _register_template(
+        self, input_path: Path, template: dict, doc_type: str, fingerprint: dict
+    ):
+        """Save a newly classified template and index its fingerprint.
+
+        Args:
+            input_path: Document the template was created from
+            template: Classification template
+            doc_type: Document type from detector
+            fingerprint: Layout fingerprint of the document (minus variable text)
+        """
+        template_path = self.template_index.template_path(input_path.stem)
+        self._save_template(template, template_path)
+        logger.info(f"Template saved to: {template_path}")
+        self.template_index.add(input_path.stem, fingerprint, doc_type)
+
+    @staticmethod
+    def _field_texts(template: dict) -> List[str]:
+        """Get the original texts of a template's variable fields."""
+        return [field.get("text", "") for field in template.get("variable_fields", [])]
+
+    @staticmethod
+    def _build_classification_json(text_elements: List[dict]) -> dict:
+        """Build a pseudo PDF JSON from direct-edit text elements for classification.
+
+        Args:
+            text_elements: DirectEditClient.extract_text_elements() output
+
+        Returns:
+            PDF JSON with textElements grouped by (1-indexed) page
+        """
+        pages_data = {}
+        for elem in text_elements:
+            page_num = elem["page"] + 1  # 1-indexed for classifier
+            if page_num not in pages_data:
+                pages_data[page_num] = []
+            pages_data[page_num].append({
+                "text": elem["text"],
+                "x": elem["rect"][0],
+                "y": elem["rect"][1],
+                "width": elem["rect"][2] - elem["rect"][0],
+                "height": elem["rect"][3] - elem["rect"][1],
+                "fontSize": elem["size"],
+                "fontName": elem["font"],
+            })
+
+        return {
+            "pages": [
+                {"pageNumber": pn, "textElements": elems}
+                for pn, elems in sorted(pages_data.items())
+            ]
+        }
+
     def process_batch(
         self,
         input_path: Path,
         output_dir: Path,
         num_variations: int = 10,
         template_path: Path | None = None,
+        workers: int = 1,
+        synthesis_workers: int | None = None,
+        queue_size: int | None = None,
+        static_layer: bool | None = None,
+        on_result: Callable[[int, Path | None, str | None], None] | None = None,
+        report_path: Path | None = None,
+        render_pool: RenderPool | None = None,
     ) -> List[Path]:
         """Generate multiple variations with template reuse for efficiency.
 
+        Timings of every step, and p50/p95/p99 per-variation latency, are
+        collected in self.last_report.
+
         Args:
             input_path: Path to input PDF or image
             output_dir: Directory for output PDFs
             num_variations: Number of variations to generate
             template_path: Optional pre-saved template (skips classification)
+            workers: Number of render processes (1 = render in this process,
+                0 = one per CPU core). Render processes are not forked from
+                the caller, so scripts using more than one need an
+                `if __name__ == "__main__":` guard
+            synthesis_workers: Concurrent synthesis producers
+                (default: settings.synthesis_workers)
+            queue_size: Capacity of the synthesis -> render queue
+                (default: settings.pipeline_queue_size)
+            static_layer: Render the static content of reconstructed pages once
+                and overlay only variable text per variation
+                (default: settings.static_layer)
+            on_result: Called as each variation finishes with
+                (index, output path, None) or (index, None, error message)
+            report_path: Optional path for the JSON performance report
+            render_pool: Warm render pool to use when workers is not 1, instead
+                of starting render processes for this batch
 
         Returns:
-            List of paths to generated PDFs
+            List of paths to generated PDFs, in variation order
 
         Efficiency:
-            - Detects and classifies ONCE
-            - Generates N different synthetic datasets
+            - Detects and classifies ONCE (or not at all when the layout
+              fingerprint matches a saved template)
+            - Generates N different synthetic datasets, several per LLM request
             - Creates N output PDFs using appropriate method
             - Native PDFs use direct editing (fast)
             - Scanned PDFs use JSON reconstruction
+            - Synthesis, rendering and output run as bounded-queue stages
+              (see StagedBatchRunner), so LLM calls and rendering overlap
         """
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        if workers == 1:
+            render_pool = None
+        elif render_pool is not None:
+            workers = render_pool.max_workers
+
         logger.info(
             f"Starting batch processing: {num_variations} variations of {input_path.name}"
         )
 
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        report = RunReport(
+            "batch",
+            input_path,
+            output_dir=str(output_dir),
+            num_variations=num_variations,
+            workers=workers,
+        )
+        try:
+            with report.activate():
+                results = self._process_batch(
+                    input_path,
+                    output_dir,
+                    num_variations,
+                    template_path,
+                    workers,
+                    synthesis_workers,
+                    queue_size,
+                    static_layer,
+                    on_result,
+                    report,
+                    render_pool,
+                )
+        finally:
+            self._finish_report(report, report_path)
+
+        latency = report.variation_latency()
+        if latency:
+            logger.info(
+                f"Variation latency: p50={latency['p50']:.2f}s p95={latency['p95']:.2f}s "
+                f"p99={latency['p99']:.2f}s"
+            )
+        return results
+
+    def _process_batch(
+        self,
+        input_path: Path,
+        output_dir: Path,
+        num_variations: int,
+        template_path: Path | None,
+        workers: int,
+        synthesis_workers: int | None,
+        queue_size: int | None,
+        static_layer: bool | None,
+        on_result: Callable[[int, Path | None, str | None], None] | None,
+        report: RunReport,
+        render_pool: RenderPool | None = None,
+    ) -> List[Path]:
+        """Run a batch (see process_batch) with report active."""
         # Phase 1: Template extraction (do ONCE)
-        doc_type = self.detector.detect(input_path)
-        
+        pdf_json = None
         if template_path and template_path.exists():
             logger.info(f"Loading template from: {template_path}")
             template = self._load_template(template_path)
+            with span("detect", bytes_in=file_size(input_path)):
+                doc_type = self.detector.detect(input_path)
         else:
             logger.info("Extracting template from input document...")
-            
-            if doc_type == "digital_pdf":
-                # Extract template using direct edit method
-                with DirectEditClient(input_path) as client:
-                    text_elements = client.extract_text_elements()
-                    pages_data = {}
-                    for elem in text_elements:
-                        page_num = elem["page"] + 1
-                        if page_num not in pages_data:
-                            pages_data[page_num] = []
-                        pages_data[page_num].append({
-                            "text": elem["text"],
-                            "x": elem["rect"][0],
-                            "y": elem["rect"][1],
-                            "width": elem["rect"][2] - elem["rect"][0],
-                            "height": elem["rect"][3] - elem["rect"][1],
-                            "fontSize": elem["size"],
-                            "fontName": elem["font"],
-                        })
-                    pdf_json = {
-                        "pages": [
-                            {"pageNumber": pn, "textElements": elems}
-                            for pn, elems in sorted(pages_data.items())
-                        ]
-                    }
-                    template = self.classifier.classify(pdf_json)
-                    template["type"] = "direct_edit"
-                    template["source_file"] = str(input_path)
-                    
-                    # Enrich with positional info
-                    for field in template.get("variable_fields", []):
-                        field_text = field.get("text", "")
-                        for elem in text_elements:
-                            if elem["text"] == field_text:
-                                field["rect"] = elem["rect"]
-                                field["font"] = elem["font"]
-                                field["size"] = elem["size"]
-                                field["color"] = elem["color"]
-                                field["page"] = elem["page"]
-                                break
-            else:
-                # Extract template using OCR/reconstruction method
-                searchable_pdf = self._ensure_searchable(input_path, doc_type)
-                pdf_json = self.stirling.pdf_to_json(searchable_pdf)
-                template = self.classifier.classify(pdf_json)
-                template["type"] = "reconstruction"
-
-            # Save template for future use
-            auto_template_path = (
-                self.settings.config_dir
-                / "templates"
-                / f"{input_path.stem}_template.json"
+            template, doc_type, pdf_json = self._prepare_template(
+                input_path, save_template=True
             )
-            self._save_template(template, auto_template_path)
-            logger.info(f"Template saved to: {auto_template_path}")
 
         # Phase 2: Generate N variations
         logger.info(
             f"Template ready (type: {template.get('type', 'unknown')}). Generating {num_variations} variations..."
         )
-        results = []
-        
+
         # Determine processing method based on template type
         is_direct_edit = template.get("type") == "direct_edit"
-        
-        if not is_direct_edit:
+
+        if is_direct_edit and not self._plan_is_current(template, input_path):
+            # Saved plans hold rects located in the template's source document;
+            # reused on another document they would redact the wrong extents.
+            # Copy first: the template may be shared through the document cache
+            with DirectEditClient(input_path) as client, span("replacement_plan"):
+                plan = client.compile_plan(template)
+            template = {
+                **template,
+                "replacement_plan": plan,
+                "source_file": str(input_path.resolve()),
+                "source_digest": file_digest(input_path),
+            }
+
+        if not is_direct_edit and pdf_json is None:
             # Need pdf_json for reconstruction path
             if doc_type == "digital_pdf":
-                pdf_json = self.stirling.pdf_to_json(input_path)
+                pdf_json = self._extract(input_path)
             else:
                 searchable_pdf = self._ensure_searchable(input_path, doc_type)
-                pdf_json = self.stirling.pdf_to_json(searchable_pdf)
-
-        for i in range(num_variations):
-            try:
-                # Generate unique synthetic data
-                synthetic_data = self.generator.generate(template)
-
-                output_path = output_dir / f"variation_{i + 1:04d}.pdf"
-                
-                if is_direct_edit:
-                    # Use direct editing for native PDFs
-                    with DirectEditClient(input_path) as client:
-                        client.apply_template(template, synthetic_data)
-                        client.save(output_path)
-                    results.append(output_path)
-                else:
-                    # Use JSON reconstruction for scanned PDFs
-                    modified_json = self.json_editor.replace_text(
-                        pdf_json, template, synthetic_data
-                    )
-                    result = self.stirling.json_to_pdf(modified_json, output_path)
-                    results.append(result)
-
-                if (i + 1) % 10 == 0 or (i + 1) == num_variations:
-                    logger.info(f"Progress: {i + 1}/{num_variations} variations generated")
+                pdf_json = self._extract(searchable_pdf)
+
+        # Read the source once; every variation is opened from memory
+        source_bytes = input_path.read_bytes() if is_direct_edit else None
+
+        if static_layer is None:
+            static_layer = self.settings.static_layer
+        layer = None
+        if static_layer and not is_direct_edit:
+            with span("static_layer"):
+                layer = StaticLayer.build(self.stirling, pdf_json, template)
+            # Workers only need the layer, not the full JSON
+            pdf_json = None
+
+        renderer_args = (
+            template, input_path, pdf_json, self.settings.cache_dir, source_bytes, layer
+        )
+        renderer = None
+        if workers == 1:
+            renderer = VariationRenderer(
+                template,
+                input_path,
+                pdf_json=pdf_json,
+                stirling=self.stirling,
+                source_bytes=source_bytes,
+                static_layer=layer,
+            )
 
-            except Exception as e:
-                logger.error(f"Failed to generate variation {i + 1}: {e}")
-                continue
+        runner = StagedBatchRunner(
+            self.generator,
+            template,
+            renderer_args,
+            render_workers=workers,
+            synthesis_workers=synthesis_workers or self.settings.synthesis_workers,
+            queue_size=queue_size or self.settings.pipeline_queue_size,
+            renderer=renderer,
+            on_result=on_result,
+            report=report,
+            render_pool=render_pool,
+        )
+        results = runner.run(output_dir, num_variations)
 
         logger.info(
             f"Batch processing complete: {len(results)}/{num_variations} successful"
         )
         return results
 
+    @staticmethod
+    def _plan_is_current(template: dict, input_path: Path) -> bool:
+        """Check that a template's replacement plan was compiled from this document.
+
+        Plans without a source digest (saved before digests were recorded, or
+        from templates made for another file) are treated as stale.
+        """
+        return (
+            "replacement_plan" in template
+            and template.get("source_file") == str(input_path.resolve())
+            and template.get("source_digest") == file_digest(input_path)
+        )
+
     def _ensure_searchable(self, input_path: Path, doc_type: str) -> Path:
         """Convert to searchable PDF if needed.
 
@@ -399,24 +677,55 @@ class PipelineOrchestrator:
 
         elif doc_type == "image":
             logger.info("Converting image to PDF...")
-            pdf_path = self.stirling.convert_image_to_pdf(input_path)
+            with span("image_conversion", bytes_in=file_size(input_path)) as conversion_span:
+                pdf_path = self.stirling.convert_image_to_pdf(input_path)
+                conversion_span.bytes_out = file_size(pdf_path)
             logger.info("Applying OCR to converted PDF...")
-            return self.stirling.ocr_pdf(
-                pdf_path, languages=self.settings.ocr_languages_list
-            )
+            return self._ocr(pdf_path)
 
         elif doc_type == "scanned_pdf":
             logger.info("Applying OCR to scanned PDF...")
-            return self.stirling.ocr_pdf(
-                input_path, languages=self.settings.ocr_languages_list
-            )
+            return self._ocr(input_path)
 
         else:
             # Unknown type, try OCR anyway
             logger.warning(f"Unknown document type: {doc_type}, attempting OCR")
-            return self.stirling.ocr_pdf(
-                input_path, languages=self.settings.ocr_languages_list
+            return self._ocr(input_path)
+
+    def _ocr(self, pdf_path: Path) -> Path:
+        """OCR a PDF (timed as the "ocr" span)."""
+        with span("ocr", bytes_in=file_size(pdf_path)) as ocr_span:
+            result = self.stirling.ocr_pdf(
+                pdf_path, languages=self.settings.ocr_languages_list
             )
+            ocr_span.bytes_out = file_size(result)
+        return result
+
+    def _extract(self, pdf_path: Path) -> dict:
+        """Extract a PDF to JSON (timed as the "extraction" span)."""
+        with span("extraction", bytes_in=file_size(pdf_path)):
+            return self.stirling.pdf_to_json(pdf_path)
+
+    def _finish_report(self, report: RunReport, report_path: Path | None) -> None:
+        """Close a run report, keep it as last_report and optionally save it.
+
+        Also refreshes the Prometheus textfile (settings.metrics_textfile).
+        """
+        report.finish()
+        self.last_report = report
+        if report_path is not None:
+            try:
+                report.save(report_path)
+                logger.info(f"Performance report saved to: {report_path}")
+            except OSError as e:
+                logger.warning(f"Could not write performance report {report_path}: {e}")
+
+        metrics_path = self.settings.metrics_textfile
+        if metrics_path is not None:
+            try:
+                write_textfile(metrics_path)
+            except OSError as e:
+                logger.warning(f"Could not write metrics file {metrics_path}: {e}")
 
     def _save_template(self, template: dict, template_path: Path):
         """Save classification template to file.
@@ -0,0 +1,467 @@
+"""Long-running job server around a warm PipelineOrchestrator.
+
+A one-shot CLI call pays for interpreter startup, imports, settings and
+dependency probing and LLM client construction before doing any work. The
+server pays those once: it keeps one orchestrator (with its HTTP connection
+pools, template index and prepared-document cache) alive and runs jobs
+submitted over a small local HTTP API, on TCP or a Unix socket:
+
+    POST /jobs                    submit a job (JSON body, see JobManager.submit)
+    GET  /jobs                    list jobs
+    GET  /jobs/<id>               job status
+    GET  /jobs/<id>/events        stream results as newline-delimited JSON
+    GET  /jobs/<id>/files/<name>  fetch an output PDF (or run_report.json)
+    GET  /health                  liveness check
+    GET  /metrics                 Prometheus metrics (see utils.metrics)
+
+Batch jobs with more than one render worker share one warm RenderPool
+(started on first use), so its processes, and the renderers of recent
+batches, persist between jobs. Its workers come from a forkserver rather than
+being forked from the multi-threaded server (see pipeline.stages).
+
+Jobs share one orchestrator. Its caches, template index and LLM rate limiter
+are thread-safe, but concurrent jobs also share LLM quota and CPU, and
+PipelineOrchestrator.last_report holds whichever job finished last. Run one
+job at a time (the default) unless the machine and quota have room to spare.
+"""
+
+import json
+import os
+import socketserver
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List
+from urllib.parse import unquote, urlparse
+
+from .orchestrator import PipelineOrchestrator
+from .stages import RenderPool
+from ..utils.logging_utils import get_logger
+from ..utils.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, REGISTRY
+
+logger = get_logger(__name__)
+
+JOB_KINDS = ("batch", "process")
+
+
+class Job:
+    """State of one submitted job."""
+
+    def __init__(self, kind: str, params: Dict[str, Any], output_dir: Path):
+        """Initialize job.
+
+        Args:
+            kind: "batch" or "process"
+            params: Validated submit parameters
+            output_dir: Directory the job writes its outputs to
+        """
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.params = params
+        self.output_dir = output_dir
+        self.status = "queued"
+        self.error: str | None = None
+        self.outputs: List[Path] = []
+        self.failed = 0
+        self.created_at = time.time()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        # Result events, appended as variations finish; streamed by /events
+        self.events: List[Dict[str, Any]] = []
+        self.changed = threading.Condition()
+
+    @property
+    def report_path(self) -> Path:
+        """Performance report written when the job finishes."""
+        return self.output_dir / "run_report.json"
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("succeeded", "failed")
+
+    def add_event(self, event: Dict[str, Any]) -> None:
+        """Record an event and wake up streaming readers."""
+        with self.changed:
+            self.events.append(event)
+            self.changed.notify_all()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize the job for API responses."""
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "params": self.params,
+            "output_dir": str(self.output_dir),
+            "outputs": [path.name for path in self.outputs],
+            "completed": len(self.outputs),
+            "failed": self.failed,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobManager:
+    """Queues jobs and runs them on a shared orchestrator."""
+
+    def __init__(
+        self,
+        orchestrator: PipelineOrchestrator,
+        output_root: Path,
+        max_concurrent_jobs: int = 1,
+        render_workers: int = 0,
+    ):
+        """Initialize job manager.
+
+        Args:
+            orchestrator: Warm orchestrator shared by all jobs
+            output_root: Default parent directory for job outputs
+            max_concurrent_jobs: Jobs run at the same time on the shared
+                orchestrator; later jobs queue (see the module docstring)
+            render_workers: Processes of the render pool shared by batch jobs
+                (0 = one per CPU core)
+        """
+        self.orchestrator = orchestrator
+        self.output_root = Path(output_root)
+        self.render_workers = render_workers
+        self.jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._render_pool: RenderPool | None = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(max_concurrent_jobs, 1), thread_name_prefix="job"
+        )
+
+    def submit(self, request: Dict[str, Any]) -> Job:
+        """Validate and queue a job.
+
+        Args:
+            request: Job description with keys
+                kind: "batch" (default) or "process"
+                input_path: Source PDF or image on the server's filesystem
+                num_variations: Variations to generate (batch, default 10)
+                template_path: Optional saved template (batch)
+                workers: 1 (the default) renders in the job thread; any other
+                    value renders on the shared render pool (batch)
+                static_layer: Static-layer rendering for reconstruction (batch)
+                output_dir: Output directory (default: <output_root>/<job id>)
+
+        Returns:
+            Queued job
+
+        Raises:
+            ValueError: If the request is invalid
+        """
+        kind = request.get("kind", "batch")
+        if kind not in JOB_KINDS:
+            raise ValueError(f"Unknown job kind '{kind}' (expected one of {JOB_KINDS})")
+
+        if not request.get("input_path"):
+            raise ValueError("input_path is required")
+        input_path = Path(request["input_path"]).expanduser()
+        if not input_path.is_file():
+            raise ValueError(f"Input file not found: {input_path}")
+
+        params: Dict[str, Any] = {"input_path": str(input_path)}
+        if kind == "batch":
+            params["num_variations"] = int(request.get("num_variations", 10))
+            params["workers"] = int(request.get("workers", 1))
+            if params["num_variations"] < 1:
+                raise ValueError("num_variations must be at least 1")
+            if request.get("template_path"):
+                params["template_path"] = str(Path(request["template_path"]).expanduser())
+            if request.get("static_layer") is not None:
+                params["static_layer"] = bool(request["static_layer"])
+
+        job = Job(kind, params, self.output_root)
+        if request.get("output_dir"):
+            job.output_dir = Path(request["output_dir"]).expanduser()
+        else:
+            job.output_dir = self.output_root / job.id
+
+        with self._lock:
+            self.jobs[job.id] = job
+        self._executor.submit(self._run, job)
+        logger.info(f"Job {job.id} queued: {kind} {input_path.name}")
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        """Look up a job by id."""
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        """Get all jobs, oldest first."""
+        with self._lock:
+            return sorted(self.jobs.values(), key=lambda job: job.created_at)
+
+    def shutdown(self) -> None:
+        """Stop accepting work, wait for running jobs and stop the render pool."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            render_pool, self._render_pool = self._render_pool, None
+        if render_pool is not None:
+            render_pool.shutdown()
+
+    @property
+    def render_pool(self) -> RenderPool:
+        """Render pool shared by batch jobs, started on first use."""
+        with self._lock:
+            if self._render_pool is None:
+                self._render_pool = RenderPool(self.render_workers)
+            return self._render_pool
+
+    def _run(self, job: Job) -> None:
+        """Execute a job on the shared orchestrator."""
+        job.status = "running"
+        job.started_at = time.time()
+        logger.info(f"Job {job.id} started")
+
+        def on_result(index: int, path: Path | None, error: str | None) -> None:
+            if path is not None:
+                job.outputs.append(path)
+                job.add_event({"event": "result", "index": index + 1, "name": path.name})
+            else:
+                job.failed += 1
+                job.add_event({"event": "error", "index": index + 1, "error": error})
+
+        try:
+            input_path = Path(job.params["input_path"])
+            if job.kind == "batch":
+                template_path = job.params.get("template_path")
+                workers = job.params["workers"]
+                self.orchestrator.process_batch(
+                    input_path,
+                    job.output_dir,
+                    num_variations=job.params["num_variations"],
+                    template_path=Path(template_path) if template_path else None,
+                    workers=workers,
+                    static_layer=job.params.get("static_layer"),
+                    on_result=on_result,
+                    report_path=job.report_path,
+                    render_pool=self.render_pool if workers != 1 else None,
+                )
+            else:
+                output_path = job.output_dir / f"{input_path.stem}_synthetic.pdf"
+                result = self.orchestrator.process_single(
+                    input_path, output_path, report_path=job.report_path
+                )
+                on_result(0, result, None)
+
+            job.status = "succeeded" if job.outputs else "failed"
+            if not job.outputs:
+                job.error = "No outputs were generated"
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {e}")
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished_at = time.time()
+            job.add_event({"event": "status", **job.to_dict()})
+            logger.info(
+                f"Job {job.id} {job.status}: {len(job.outputs)} outputs, {job.failed} failed "
+                f"({job.finished_at - job.started_at:.1f}s)"
+            )
+
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler for the job API (manager is set on the server)."""
+
+    server_version = "stirling-sdg"
+
+    @property
+    def manager(self) -> JobManager:
+        return self.server.job_manager
+
+    def address_string(self) -> str:
+        # Unix socket clients have no (host, port) address
+        if isinstance(self.client_address, tuple) and self.client_address:
+            return str(self.client_address[0])
+        return "unix"
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _path_parts(self) -> List[str]:
+        return [unquote(part) for part in urlparse(self.path).path.split("/") if part]
+
+    def do_POST(self):
+        parts = self._path_parts()
+        if parts != ["jobs"]:
+            self._send_json(404, {"error": "Not found"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(request, dict):
+                raise ValueError("Request body must be a JSON object")
+            job = self.manager.submit(request)
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+
+        self._send_json(202, job.to_dict())
+
+    def do_GET(self):
+        parts = self._path_parts()
+
+        if parts == ["health"]:
+            self._send_json(200, {"status": "ok"})
+            return
+        if parts == ["metrics"]:
+            body = REGISTRY.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", METRICS_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if parts == ["jobs"]:
+            self._send_json(200, {"jobs": [job.to_dict() for job in self.manager.list()]})
+            return
+        if len(parts) < 2 or parts[0] != "jobs":
+            self._send_json(404, {"error": "Not found"})
+            return
+
+        job = self.manager.get(parts[1])
+        if job is None:
+            self._send_json(404, {"error": f"Unknown job: {parts[1]}"})
+        elif len(parts) == 2:
+            self._send_json(200, job.to_dict())
+        elif parts[2:] == ["events"]:
+            self._stream_events(job)
+        elif len(parts) == 4 and parts[2] == "files":
+            self._send_file(job, parts[3])
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+    def _stream_events(self, job: Job) -> None:
+        """Send job events as newline-delimited JSON until the job finishes."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        sent = 0
+        while True:
+            with job.changed:
+                while sent == len(job.events) and not job.finished:
+                    job.changed.wait(timeout=30)
+                events = job.events[sent:]
+                done = job.finished and sent + len(events) == len(job.events)
+            for event in events:
+                self.wfile.write(json.dumps(event).encode("utf-8") + b"\n")
+            self.wfile.flush()
+            sent += len(events)
+            if done:
+                return
+
+    def _send_file(self, job: Job, name: str) -> None:
+        """Send one of the job's output PDFs (or its performance report)."""
+        if name == job.report_path.name and job.finished:
+            path = job.report_path
+        else:
+            path = next((p for p in list(job.outputs) if p.name == name), None)
+        if path is None or not path.is_file():
+            self._send_json(404, {"error": f"No output named {name}"})
+            return
+
+        self.send_response(200)
+        self.send_header(
+            "Content-Type", "application/json" if path.suffix == ".json" else "application/pdf"
+        )
+        self.send_header("Content-Length", str(path.stat().st_size))
+        self.end_headers()
+        with open(path, "rb") as f:
+            while chunk := f.read(1024 * 1024):
+                self.wfile.write(chunk)
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP server on a Unix domain socket, one thread per connection."""
+
+    daemon_threads = True
+
+
+def create_server(
+    manager: JobManager,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: Path | None = None,
+) -> socketserver.BaseServer:
+    """Create the job API server.
+
+    Args:
+        manager: Job manager serving the requests
+        host: Interface to bind (TCP)
+        port: Port to bind (TCP; 0 picks a free port)
+        socket_path: Bind a Unix socket at this path instead of TCP
+
+    Returns:
+        Server ready for serve_forever()
+    """
+    if socket_path is not None:
+        socket_path = Path(socket_path)
+        if socket_path.exists():
+            socket_path.unlink()
+        server = ThreadingUnixHTTPServer(str(socket_path), JobRequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), JobRequestHandler)
+        server.daemon_threads = True
+
+    server.job_manager = manager
+    return server
+
+
+def serve(
+    orchestrator: PipelineOrchestrator,
+    output_root: Path,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: Path | None = None,
+    max_concurrent_jobs: int = 1,
+    render_workers: int = 0,
+) -> None:
+    """Run the job API until interrupted.
+
+    Args:
+        orchestrator: Warm orchestrator shared by all jobs
+        output_root: Default parent directory for job outputs
+        host: Interface to bind (TCP)
+        port: Port to bind (TCP)
+        socket_path: Bind a Unix socket at this path instead of TCP
+        max_concurrent_jobs: Jobs run at the same time
+        render_workers: Processes of the shared render pool (0 = one per CPU core)
+    """
+    manager = JobManager(
+        orchestrator,
+        output_root,
+        max_concurrent_jobs=max_concurrent_jobs,
+        render_workers=render_workers,
+    )
+    server = create_server(manager, host=host, port=port, socket_path=socket_path)
+    address = socket_path if socket_path is not None else f"http://{host}:{server.server_address[1]}"
+    logger.info(f"Job server listening on {address}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Shutting down job server")
+    finally:
+        server.server_close()
+        manager.shutdown()
+        if socket_path is not None and Path(socket_path).exists():
+            os.unlink(socket_path)
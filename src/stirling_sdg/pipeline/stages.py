@@ -0,0 +1,444 @@
+"""Staged producer/consumer execution for batch generation.
+
+A batch runs as three stages connected by queues:
+
+    synthesis producers ──(bounded queue)──> render workers ──> output writer
+
+- Synthesis producers are threads that claim chunks of variation indices and
+  fetch several synthetic records per LLM request. They block on the bounded
+  render queue when rendering falls behind, so LLM quota is not spent on data
+  that cannot be rendered yet.
+- Render workers are a process pool (or one in-process renderer when
+  render_workers is 1). The number of in-flight renders is capped so the pool
+  queue cannot grow without bound either. Workers are started from a
+  forkserver (see utils.process_pool), never forked directly: the pool is
+  created while producer threads and HTTP clients are running.
+  A long-running caller can instead pass a RenderPool, whose workers stay up
+  between batches.
+- The output writer publishes each rendered file under its final
+  variation_NNNN.pdf name (atomic rename from a .part file), logs progress and
+  records results by variation index.
+
+With a RunReport, synthesis requests are recorded as spans, and each
+variation's render phases and end-to-end latency (from the start of its
+synthesis request to the published file) are added by the output writer. The
+writer also counts rendered/failed variations and output bytes in the
+Prometheus metrics (see utils.metrics).
+"""
+
+import multiprocessing
+import os
+import pickle
+import queue
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import CancelledError, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from ..synthesis.generator import SyntheticDataGenerator
+from ..utils.exceptions import SynthesisError
+from ..utils.logging_utils import get_logger
+from ..utils.metrics import OUTPUT_BYTES, VARIATIONS
+from ..utils.process_pool import pool_context
+from ..utils.timing import RunReport, file_size, span
+from .workers import (
+    VariationRenderer,
+    create_renderer,
+    init_worker,
+    render_bound,
+    render_variation,
+)
+
+logger = get_logger(__name__)
+
+# Queue sentinel marking the end of a stage's output
+_DONE = object()
+
+# How often a producer blocked on a full render queue checks whether the
+# render stage has gone away
+_PUT_POLL_SECONDS = 0.5
+
+
+def _render_context() -> multiprocessing.context.BaseContext:
+    """Get the multiprocessing context for render pools (see utils.process_pool)."""
+    return pool_context(init_worker.__module__)
+
+
+class RenderPool:
+    """Render process pool whose workers are kept warm across batches.
+
+    A per-batch pool passes the renderer arguments to every worker as
+    initializer arguments. Here a batch binds them instead: bind() spools them
+    to a file, and each worker builds the batch's renderer from it on its
+    first task (see workers.render_bound). The pool is thread-safe, so
+    concurrent batches can share it.
+    """
+
+    def __init__(self, max_workers: int):
+        """Initialize render pool.
+
+        Args:
+            max_workers: Render processes (0 = one per CPU core)
+        """
+        self.max_workers = max_workers if max_workers > 0 else (os.cpu_count() or 1)
+        self._spool_dir = Path(tempfile.mkdtemp(prefix="stirling-sdg-render-"))
+        self._lock = threading.Lock()
+        self._executor = self._create_executor()
+        logger.info(f"Render pool started with {self.max_workers} workers")
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.max_workers, mp_context=_render_context())
+
+    def bind(self, renderer_args: tuple) -> str:
+        """Make a batch's renderer arguments available to the workers.
+
+        Args:
+            renderer_args: Arguments for workers.create_renderer
+
+        Returns:
+            Spool path identifying the batch in submit() and unbind()
+        """
+        spool_path = self._spool_dir / f"{uuid.uuid4().hex}.pickle"
+        with open(spool_path, "wb") as f:
+            pickle.dump(renderer_args, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return str(spool_path)
+
+    def unbind(self, spool_path: str) -> None:
+        """Release a batch bound with bind() once its renders have finished."""
+        Path(spool_path).unlink(missing_ok=True)
+
+    def submit(self, spool_path: str, synthetic_data: Dict[str, Any], output_path: Path) -> Future:
+        """Queue one variation of a bound batch.
+
+        A pool broken by a crashed worker is replaced with fresh workers, so
+        one failed render does not take down later jobs.
+
+        Returns:
+            Future of (path to generated PDF, phase timings)
+        """
+        with self._lock:
+            executor = self._executor
+        try:
+            return executor.submit(render_bound, spool_path, synthetic_data, output_path)
+        except BrokenProcessPool:
+            with self._lock:
+                if self._executor is executor:
+                    logger.warning("Render pool worker died; starting new workers")
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    self._executor = self._create_executor()
+                executor = self._executor
+            return executor.submit(render_bound, spool_path, synthetic_data, output_path)
+
+    def shutdown(self) -> None:
+        """Stop the workers and remove spooled renderer arguments."""
+        with self._lock:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        shutil.rmtree(self._spool_dir, ignore_errors=True)
+
+
+class StagedBatchRunner:
+    """Runs batch generation as synthesis, render and write stages."""
+
+    def __init__(
+        self,
+        generator: SyntheticDataGenerator,
+        template: Dict[str, Any],
+        renderer_args: tuple,
+        render_workers: int = 1,
+        synthesis_workers: int = 1,
+        queue_size: int = 32,
+        renderer: VariationRenderer | None = None,
+        on_result: Callable[[int, Path | None, str | None], None] | None = None,
+        report: RunReport | None = None,
+        render_pool: RenderPool | None = None,
+    ):
+        """Initialize runner.
+
+        Args:
+            generator: Synthetic data generator (shared by all producers)
+            template: Classification template
+            renderer_args: Arguments for workers.create_renderer in each render process
+            render_workers: Render processes (1 = render in this process);
+                ignored with a render_pool
+            synthesis_workers: Concurrent synthesis producer threads
+            queue_size: Capacity of the synthesis -> render queue
+            renderer: In-process renderer used when render_workers is 1
+            on_result: Called from the output stage as each variation finishes,
+                with (index, output path, None) or (index, None, error message)
+            report: Optional run report for synthesis spans and per-variation timings
+            render_pool: Warm pool to render on instead of starting one for
+                this batch (left running afterwards)
+        """
+        self.generator = generator
+        self.template = template
+        self.renderer_args = renderer_args
+        self.render_pool = render_pool
+        if render_pool is not None:
+            render_workers = render_pool.max_workers
+        self.render_workers = max(render_workers, 1)
+        self.synthesis_workers = max(synthesis_workers, 1)
+        self.queue_size = max(queue_size, 1)
+        self.renderer = renderer
+        self.on_result = on_result
+        self.report = report
+
+    def run(self, output_dir: Path, num_variations: int) -> List[Path]:
+        """Generate num_variations outputs in output_dir.
+
+        Args:
+            output_dir: Directory for output PDFs
+            num_variations: Number of variations to generate
+
+        Returns:
+            List of paths to generated PDFs, in variation order
+        """
+        field_types = set(
+            field["fieldType"] for field in self.template.get("variable_fields", [])
+        )
+        per_request = self.generator.github_client.records_per_request(len(field_types))
+        logger.info(
+            f"Staged batch: {self.synthesis_workers} synthesis producers "
+            f"({per_request} records/request), {self.render_workers} render workers, "
+            f"queue size {self.queue_size}"
+        )
+
+        render_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        write_queue: queue.Queue = queue.Queue()
+        results: Dict[int, Path] = {}
+
+        self._next_index = 0
+        self._claim_lock = threading.Lock()
+        self._stop = threading.Event()
+        # Set once the render stage stops consuming render_queue
+        self._dispatch_done = threading.Event()
+
+        producers = [
+            threading.Thread(
+                target=self._produce,
+                args=(render_queue, num_variations, per_request),
+                name=f"synthesis-{n}",
+                daemon=True,
+            )
+            for n in range(self.synthesis_workers)
+        ]
+        writer = threading.Thread(
+            target=self._write,
+            args=(write_queue, output_dir, num_variations, results),
+            name="output-writer",
+            daemon=True,
+        )
+
+        writer.start()
+        for producer in producers:
+            producer.start()
+
+        # Caps renders in flight; each slot is released after its result was queued
+        self._in_flight = threading.BoundedSemaphore(self.render_workers * 2)
+        executor = None
+        spool_path = None
+        if self.render_pool is not None:
+            spool_path = self.render_pool.bind(self.renderer_args)
+
+            def submit(synthetic_data: Dict[str, Any], part_path: Path) -> Future:
+                return self.render_pool.submit(spool_path, synthetic_data, part_path)
+
+        else:
+            executor = self._create_executor()
+            if self.render_workers == 1:
+                submit = partial(executor.submit, self.renderer.render_timed)
+            else:
+                submit = partial(executor.submit, render_variation)
+
+        try:
+            self._dispatch(submit, render_queue, write_queue, output_dir)
+        finally:
+            self._stop.set()
+            # Producers blocked on a full queue (the render stage failed) give up
+            self._dispatch_done.set()
+            if executor is not None:
+                executor.shutdown(wait=True)
+            else:
+                # The shared pool keeps running: wait until every render
+                # this batch submitted has been handed to the writer
+                for _ in range(self.render_workers * 2):
+                    self._in_flight.acquire()
+                self.render_pool.unbind(spool_path)
+            write_queue.put(_DONE)
+            writer.join()
+
+        return [results[i] for i in sorted(results)]
+
+    def _create_executor(self) -> Executor:
+        """Create the render stage executor."""
+        if self.render_workers == 1:
+            if self.renderer is None:
+                self.renderer = create_renderer(*self.renderer_args)
+            return ThreadPoolExecutor(max_workers=1, thread_name_prefix="render")
+
+        return ProcessPoolExecutor(
+            max_workers=self.render_workers,
+            mp_context=_render_context(),
+            initializer=init_worker,
+            initargs=self.renderer_args,
+        )
+
+    def _produce(self, render_queue: queue.Queue, count: int, per_request: int) -> None:
+        """Synthesis stage: claim index chunks, fetch records, feed the render queue."""
+        try:
+            while not self._stop.is_set():
+                with self._claim_lock:
+                    start = self._next_index
+                    if start >= count:
+                        break
+                    size = min(per_request, count - start)
+                    self._next_index += size
+
+                started = time.perf_counter()
+                try:
+                    with span("synthesis", report=self.report, records=size):
+                        records = self.generator.generate_batch(self.template, size)
+                except SynthesisError as e:
+                    logger.error(f"Synthetic data generation stopped: {e}")
+                    self._stop.set()
+                    break
+
+                for offset, record in enumerate(records):
+                    # Blocks while the render stage is behind (backpressure)
+                    if not self._put(render_queue, (start + offset, record, started)):
+                        return
+        except Exception as e:
+            logger.error(f"Synthesis producer failed: {e}")
+        finally:
+            self._put(render_queue, _DONE)
+
+    def _put(self, render_queue: queue.Queue, item: Any) -> bool:
+        """Put an item on the render queue, unless the render stage has stopped.
+
+        Returns:
+            True if the item was queued, False if the render stage is gone
+        """
+        while not self._dispatch_done.is_set():
+            try:
+                render_queue.put(item, timeout=_PUT_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _dispatch(
+        self,
+        submit: Callable[[Dict[str, Any], Path], Future],
+        render_queue: queue.Queue,
+        write_queue: queue.Queue,
+        output_dir: Path,
+    ) -> None:
+        """Render stage: hand queued records to the render workers with bounded in-flight work."""
+        in_flight = self._in_flight
+        pending: List[Future] = []
+        producers_left = self.synthesis_workers
+
+        while producers_left:
+            item = render_queue.get()
+            if item is _DONE:
+                producers_left -= 1
+                continue
+
+            index, synthetic_data, started = item
+            part_path = output_dir / f"variation_{index + 1:04d}.pdf.part"
+
+            in_flight.acquire()
+            try:
+                future = submit(synthetic_data, part_path)
+            except BaseException:
+                in_flight.release()
+                raise
+
+            def on_done(
+                f: Future, index: int = index, part_path: Path = part_path, started: float = started
+            ):
+                try:
+                    # A pool replaced after a worker crash cancels queued renders
+                    error = CancelledError() if f.cancelled() else f.exception()
+                    timings = f.result()[1] if error is None else {}
+                    write_queue.put((index, part_path, error, started, timings))
+                finally:
+                    in_flight.release()
+
+            future.add_done_callback(on_done)
+            pending.append(future)
+
+        wait_futures(pending)
+
+    def _write(
+        self,
+        write_queue: queue.Queue,
+        output_dir: Path,
+        count: int,
+        results: Dict[int, Path],
+    ) -> None:
+        """Output stage: publish rendered files under their final names."""
+        done = 0
+        while True:
+            item = write_queue.get()
+            if item is _DONE:
+                return
+
+            index, part_path, error, started, timings = item
+            done += 1
+            output_path = None
+            if error is not None:
+                logger.error(f"Failed to generate variation {index + 1}: {error}")
+                part_path.unlink(missing_ok=True)
+            else:
+                output_path = output_dir / f"variation_{index + 1:04d}.pdf"
+                try:
+                    os.replace(part_path, output_path)
+                    results[index] = output_path
+                except OSError as e:
+                    logger.error(f"Failed to write variation {index + 1}: {e}")
+                    output_path, error = None, e
+
+            bytes_out = file_size(output_path)
+            VARIATIONS.inc(mode="batch", outcome="failed" if output_path is None else "rendered")
+            OUTPUT_BYTES.inc(bytes_out)
+            if self.report is not None:
+                self._record(index, output_path, started, timings, bytes_out)
+
+            if self.on_result is not None:
+                try:
+                    self.on_result(index, output_path, None if error is None else str(error))
+                except Exception as e:
+                    logger.warning(f"Result callback failed for variation {index + 1}: {e}")
+
+            if done % 10 == 0 or done == count:
+                logger.info(f"Progress: {done}/{count} variations processed")
+
+    def _record(
+        self,
+        index: int,
+        output_path: Path | None,
+        started: float,
+        timings: dict,
+        bytes_out: int,
+    ) -> None:
+        """Add one variation's render phases and latency to the report."""
+        self.report.add_variation(
+            index,
+            latency=time.perf_counter() - started,
+            ok=output_path is not None,
+            render_wall=sum(wall for wall, _ in timings.values()),
+            bytes_out=bytes_out,
+        )
+        self.report.record_phases(
+            timings,
+            document=f"variation_{index + 1:04d}.pdf",
+            bytes_out=bytes_out,
+            variation=index + 1,
+        )
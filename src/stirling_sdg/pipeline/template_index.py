@@ -0,0 +1,242 @@
+"""Fingerprint index for reusing saved templates on new instances of a form.
+
+The index lives next to the templates (configs/templates/fingerprints.json)
+and maps each template name to the layout fingerprint of the document it was
+created from. A stored template records the field values of *that* document,
+so a matched template is re-bound to the new document by position before use
+(see rebind_direct_edit_template / rebind_reconstruction_template).
+"""
+
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from ..detection.fingerprint import similarity
+from ..utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+INDEX_FILENAME = "fingerprints.json"
+
+# A matched template is only used if at least this fraction of its variable
+# fields can be located in the new document
+MIN_REBOUND_FRACTION = 0.8
+
+# Positional tolerance (points) when locating a field in a new document
+POSITION_TOLERANCE = 3.0
+
+
+class TemplateIndex:
+    """Index of template fingerprints under a template directory."""
+
+    def __init__(self, template_dir: Path):
+        """Initialize index.
+
+        Args:
+            template_dir: Directory holding *_template.json files
+        """
+        self.template_dir = Path(template_dir)
+        self.index_path = self.template_dir / INDEX_FILENAME
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._mtime: float | None = None
+        self._lock = threading.Lock()
+
+    def _reload(self) -> None:
+        """Re-read the index file if it changed on disk."""
+        try:
+            mtime = self.index_path.stat().st_mtime
+        except OSError:
+            self._entries = {}
+            self._mtime = None
+            return
+
+        if mtime == self._mtime:
+            return
+
+        try:
+            with open(self.index_path, "r") as f:
+                self._entries = json.load(f).get("templates", {})
+            self._mtime = mtime
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read template index {self.index_path}: {e}")
+            self._entries = {}
+
+    def add(self, name: str, fingerprint: Dict[str, Any], doc_type: str) -> None:
+        """Register (or replace) a template's fingerprint.
+
+        Args:
+            name: Template name (file is {name}_template.json)
+            fingerprint: Layout fingerprint of the template's source document
+            doc_type: Document type the template was created for
+        """
+        with self._lock:
+            self._reload()
+            self._entries[name] = {"doc_type": doc_type, "fingerprint": fingerprint}
+
+            self.template_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.template_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"templates": self._entries}, f)
+            os.replace(tmp_name, self.index_path)
+            self._mtime = self.index_path.stat().st_mtime
+
+        logger.info(f"Registered fingerprint for template '{name}'")
+
+    def match(
+        self, fingerprint: Dict[str, Any], threshold: float
+    ) -> Tuple[str, str, float] | None:
+        """Find the best matching template for a document fingerprint.
+
+        Args:
+            fingerprint: Fingerprint of the document being processed
+            threshold: Minimum similarity for a confident match
+
+        Returns:
+            (template name, doc_type, score) or None if nothing matches
+        """
+        with self._lock:
+            self._reload()
+            entries = dict(self._entries)
+
+        best = None
+        for name, entry in entries.items():
+            score = similarity(entry["fingerprint"], fingerprint)
+            if score >= threshold and (best is None or score > best[2]):
+                best = (name, entry.get("doc_type", "digital_pdf"), score)
+
+        if best is not None:
+            if not self.template_path(best[0]).exists():
+                logger.warning(f"Template '{best[0]}' is indexed but its file is missing")
+                return None
+            logger.info(f"Fingerprint matched template '{best[0]}' (score {best[2]:.3f})")
+        return best
+
+    def template_path(self, name: str) -> Path:
+        """Get the template file path for an indexed name."""
+        return self.template_dir / f"{name}_template.json"
+
+
+def _close(a: float, b: float) -> bool:
+    return abs(a - b) <= POSITION_TOLERANCE
+
+
+def _rebind(
+    template: Dict[str, Any],
+    candidates: List[Tuple[int, List[float], Dict[str, Any]]],
+    field_position,
+    bind,
+) -> Dict[str, Any] | None:
+    """Shared re-binding loop.
+
+    A field is located by its top-left corner and bottom edge; the width is
+    free because the new value can be longer or shorter than the stored one.
+    """
+    fields = template.get("variable_fields", [])
+    if not fields:
+        return None
+
+    rebound = []
+    for field in fields:
+        position = field_position(field)
+        if position is None:
+            continue
+        page, (x0, y0, _, y1) = position
+        for cand_page, (cx0, cy0, _, cy1), elem in candidates:
+            if cand_page == page and _close(cx0, x0) and _close(cy0, y0) and _close(cy1, y1):
+                rebound.append(bind(field, elem))
+                break
+
+    if len(rebound) < MIN_REBOUND_FRACTION * len(fields):
+        logger.info(
+            f"Only {len(rebound)}/{len(fields)} template fields located in document; "
+            f"not reusing template"
+        )
+        return None
+
+    result = dict(template)
+    result["variable_fields"] = rebound
+    # Compiled against the original document; must be rebuilt for this one
+    result.pop("replacement_plan", None)
+    return result
+
+
+def rebind_direct_edit_template(
+    template: Dict[str, Any], text_elements: List[Dict[str, Any]]
+) -> Dict[str, Any] | None:
+    """Point a stored direct-edit template at a new document's text.
+
+    Args:
+        template: Stored direct_edit template (fields carry page/rect)
+        text_elements: DirectEditClient.extract_text_elements() of the new document
+
+    Returns:
+        Template whose field texts/styles come from the new document,
+        or None if too few fields could be located
+    """
+    candidates = [(elem["page"], elem["rect"], elem) for elem in text_elements]
+
+    def field_position(field):
+        if "rect" not in field or "page" not in field:
+            return None
+        return field["page"], field["rect"]
+
+    def bind(field, elem):
+        return {
+            **field,
+            "text": elem["text"],
+            "rect": elem["rect"],
+            "font": elem["font"],
+            "size": elem["size"],
+            "color": elem["color"],
+            "page": elem["page"],
+        }
+
+    return _rebind(template, candidates, field_position, bind)
+
+
+def rebind_reconstruction_template(
+    template: Dict[str, Any], pdf_json: Dict[str, Any]
+) -> Dict[str, Any] | None:
+    """Point a stored reconstruction template at a new document's text.
+
+    Args:
+        template: Stored reconstruction template (fields carry pageNumber/bbox)
+        pdf_json: Extracted PDF JSON of the new document
+
+    Returns:
+        Template whose field texts come from the new document,
+        or None if too few fields could be located
+    """
+    candidates = []
+    for page in pdf_json.get("pages", []):
+        page_number = page.get("pageNumber", 1)
+        for elem in page.get("textElements", []):
+            bbox = [
+                elem.get("x", 0),
+                elem.get("y", 0),
+                elem.get("x", 0) + elem.get("width", 0),
+                elem.get("y", 0) + elem.get("height", 0),
+            ]
+            candidates.append((page_number, bbox, elem))
+
+    def field_position(field):
+        if "bbox" not in field:
+            return None
+        return field.get("pageNumber", 1), field["bbox"]
+
+    def bind(field, elem):
+        return {
+            **field,
+            "text": elem["text"],
+            "bbox": [
+                elem.get("x", 0),
+                elem.get("y", 0),
+                elem.get("x", 0) + elem.get("width", 0),
+                elem.get("y", 0) + elem.get("height", 0),
+            ],
+        }
+
+    return _rebind(template, candidates, field_position, bind)
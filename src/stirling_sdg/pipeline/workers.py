@@ -0,0 +1,201 @@
+"""Variation rendering workers for batch processing.
+
+A VariationRenderer holds everything needed to turn one synthetic dataset into
+one output PDF. Batch processing either uses a renderer in-process (serial mode)
+or creates one per worker process through the pool initializer below, so the
+per-variation task only has to ship the synthetic data and the output path.
+The source PDF is read once (by the parent) and every variation is opened
+from that in-memory copy instead of re-reading the file. Likewise, with a
+StaticLayer the reconstruction path only overlays variable text on content
+the parent rendered once.
+
+Rendering phases (replacement, render, save) are timed in the worker and
+returned with each result, so the parent can report them per variation.
+
+Workers of a shared RenderPool (see pipeline.stages) outlive any one batch:
+there the renderer arguments are read from a spool file by render_bound() on
+a worker's first task of the batch, and the renderers of the last few batches
+are kept.
+"""
+
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+from ..stirling.client import StirlingClient
+from ..stirling.direct_edit_client import DirectEditClient
+from ..stirling.static_layer import StaticLayer
+from ..json_editor.editor import JSONEditor
+from ..utils.logging_utils import get_logger
+from ..utils.timing import PhaseTimings, phase
+
+logger = get_logger(__name__)
+
+
+class VariationRenderer:
+    """Renders variations of a single document from a fixed template."""
+
+    def __init__(
+        self,
+        template: Dict[str, Any],
+        input_path: Path,
+        pdf_json: Dict[str, Any] | None = None,
+        cache_dir: Path | None = None,
+        stirling: Any | None = None,
+        source_bytes: bytes | None = None,
+        static_layer: StaticLayer | None = None,
+    ):
+        """Initialize renderer.
+
+        Args:
+            template: Classification template (direct_edit or reconstruction)
+            input_path: Source document (used by the direct-edit path)
+            pdf_json: Extracted PDF JSON (required by the reconstruction path)
+            cache_dir: Cache directory for a newly created StirlingClient
+            stirling: Existing StirlingClient to reuse instead of creating one
+            source_bytes: Contents of input_path, if already loaded (direct-edit
+                path; read from input_path otherwise)
+            static_layer: Pre-rendered static content (reconstruction path);
+                variations then only overlay variable text
+        """
+        self.template = template
+        self.input_path = input_path
+        self.pdf_json = pdf_json
+        self.is_direct_edit = template.get("type") == "direct_edit"
+        self.static_layer = static_layer
+
+        self.source_bytes = None
+        self.stirling = None
+        self.json_editor = None
+        self.located = None
+        if self.is_direct_edit:
+            self.source_bytes = source_bytes or Path(input_path).read_bytes()
+        elif static_layer is None:
+            if pdf_json is None:
+                raise ValueError("pdf_json is required for reconstruction templates")
+            self.stirling = stirling or StirlingClient(cache_dir=cache_dir)
+            self.json_editor = JSONEditor()
+            # Every variation replaces the same elements; locate them once
+            self.located = JSONEditor.locate_fields(pdf_json, template)
+
+    def render(
+        self,
+        synthetic_data: Dict[str, Any],
+        output_path: Path,
+        timings: PhaseTimings | None = None,
+    ) -> Path:
+        """Render one variation.
+
+        Args:
+            synthetic_data: Dict mapping field_type to synthetic value
+            output_path: Path for output PDF
+            timings: Optional dict that receives (wall, cpu) per phase
+
+        Returns:
+            Path to generated PDF
+        """
+        if self.is_direct_edit:
+            # Use direct editing for native PDFs
+            with DirectEditClient.from_bytes(self.source_bytes, self.input_path) as client:
+                with phase(timings, "replacement"):
+                    plan = self.template.get("replacement_plan")
+                    if plan is not None:
+                        client.apply_plan(plan, synthetic_data)
+                    else:
+                        client.apply_template(self.template, synthetic_data)
+                with phase(timings, "save"):
+                    return client.save(output_path)
+
+        if self.static_layer is not None:
+            # Overlay variable text on the pre-rendered static content
+            with phase(timings, "render"):
+                return self.static_layer.render(synthetic_data, output_path)
+
+        # Use JSON reconstruction for scanned PDFs
+        with phase(timings, "replacement"):
+            modified_json = self.json_editor.replace_text(
+                self.pdf_json, self.template, synthetic_data, located=self.located
+            )
+        with phase(timings, "render"):
+            return self.stirling.json_to_pdf(modified_json, output_path)
+
+    def render_timed(
+        self, synthetic_data: Dict[str, Any], output_path: Path
+    ) -> Tuple[Path, PhaseTimings]:
+        """Render one variation and return its phase timings."""
+        timings: PhaseTimings = {}
+        return self.render(synthetic_data, output_path, timings), timings
+
+
+# Per-process renderer, set up once by init_worker()
+_renderer: VariationRenderer | None = None
+
+# Renderers of recently bound batches in a shared pool worker, by spool path
+_bound: "OrderedDict[str, VariationRenderer]" = OrderedDict()
+
+# Bound renderers kept per worker (at least the number of concurrent jobs)
+_BOUND_RENDERERS = 4
+
+
+def create_renderer(
+    template: Dict[str, Any],
+    input_path: Path,
+    pdf_json: Dict[str, Any] | None,
+    cache_dir: Path | None,
+    source_bytes: bytes | None = None,
+    static_layer: StaticLayer | None = None,
+) -> VariationRenderer:
+    """Build a renderer from batch renderer arguments (see StagedBatchRunner)."""
+    return VariationRenderer(
+        template,
+        input_path,
+        pdf_json=pdf_json,
+        cache_dir=cache_dir,
+        source_bytes=source_bytes,
+        static_layer=static_layer,
+    )
+
+
+def init_worker(*renderer_args) -> None:
+    """Process pool initializer: build this worker's renderer once."""
+    global _renderer
+    _renderer = create_renderer(*renderer_args)
+
+
+def render_variation(
+    synthetic_data: Dict[str, Any], output_path: Path
+) -> Tuple[Path, PhaseTimings]:
+    """Process pool task: render one variation with this worker's renderer.
+
+    Returns:
+        Tuple of (path to generated PDF, phase timings)
+    """
+    if _renderer is None:
+        raise RuntimeError("Worker not initialized. Use init_worker as pool initializer.")
+    return _renderer.render_timed(synthetic_data, output_path)
+
+
+def render_bound(
+    spool_path: str, synthetic_data: Dict[str, Any], output_path: Path
+) -> Tuple[Path, PhaseTimings]:
+    """Shared render pool task: render one variation of a bound batch.
+
+    Args:
+        spool_path: File holding the batch's pickled renderer arguments
+        synthetic_data: Dict mapping field_type to synthetic value
+        output_path: Path for output PDF
+
+    Returns:
+        Tuple of (path to generated PDF, phase timings)
+    """
+    renderer = _bound.get(spool_path)
+    if renderer is None:
+        with open(spool_path, "rb") as f:
+            renderer = create_renderer(*pickle.load(f))
+        _bound[spool_path] = renderer
+        while len(_bound) > _BOUND_RENDERERS:
+            _bound.popitem(last=False)
+    else:
+        _bound.move_to_end(spool_path)
+    return renderer.render_timed(synthetic_data, output_path)
@@ -7,10 +7,13 @@ for backward compatibility with Stirling PDF Docker containers.
 """
 
 from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict
 
 from ..utils.logging_utils import get_logger
 
+if TYPE_CHECKING:
+    from .local_client import LocalStirlingClient as StirlingClient
+
 logger = get_logger(__name__)
 
 
@@ -20,6 +23,10 @@ def get_stirling_client(
     timeout: int = 300,
     api_key: str | None = None,
     cache_dir: Path | None = None,
+    extraction_workers: int = 1,
+    extraction_engine: str = "pdfplumber",
+    ocr_cache_enabled: bool = True,
+    ocr_cache_max_mb: int = 1024,
 ):
     """Factory function to get the appropriate Stirling client.
 
@@ -30,13 +37,24 @@ def get_stirling_client(
         timeout: Request timeout in seconds (only used if use_local=False)
         api_key: Optional API key for authentication (only used if use_local=False)
         cache_dir: Directory for cached files (only used if use_local=True)
+        extraction_workers: Processes for pdf_to_json (only used if use_local=True)
+        extraction_engine: pdf_to_json engine, "pdfplumber" or "pymupdf"
+                           (only used if use_local=True)
+        ocr_cache_enabled: Cache OCR/image conversion results (only used if use_local=True)
+        ocr_cache_max_mb: Max OCR cache size in MB (only used if use_local=True)
 
     Returns:
         StirlingClient instance (either LocalStirlingClient or StirlingHTTPClient)
     """
     if use_local:
         from .local_client import LocalStirlingClient
-        return LocalStirlingClient(cache_dir=cache_dir)
+        return LocalStirlingClient(
+            cache_dir=cache_dir,
+            extraction_workers=extraction_workers,
+            extraction_engine=extraction_engine,
+            ocr_cache_enabled=ocr_cache_enabled,
+            ocr_cache_max_mb=ocr_cache_max_mb,
+        )
     else:
         from .http_client import StirlingHTTPClient
         return StirlingHTTPClient(
@@ -46,7 +64,13 @@ def get_stirling_client(
         )
 
 
-# Default export: LocalStirlingClient as StirlingClient for backward compatibility
-from .local_client import LocalStirlingClient as StirlingClient
-
 __all__ = ["StirlingClient", "get_stirling_client"]
+
+
+def __getattr__(name: str):
+    # Default export: LocalStirlingClient as StirlingClient for backward
+    # compatibility, imported on first use (PEP 562)
+    if name == "StirlingClient":
+        from .local_client import LocalStirlingClient
+        return LocalStirlingClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -37,6 +37,7 @@ class DirectEditClient:
         """
         self.doc: Optional[fitz.Document] = None
         self.pdf_path: Optional[Path] = None
+        self.source_bytes: Optional[bytes] = None
         
         if pdf_path:
             self.open(pdf_path)
@@ -55,17 +56,65 @@ class DirectEditClient:
         try:
             self.pdf_path = Path(pdf_path)
             self.doc = fitz.open(str(self.pdf_path))
+            self.source_bytes = None
             logger.info(f"Opened PDF: {self.pdf_path.name} ({len(self.doc)} pages)")
         except Exception as e:
             logger.error(f"Failed to open PDF: {e}")
             raise StirlingAPIError(f"Failed to open PDF: {e}") from e
 
+    @classmethod
+    def from_bytes(cls, data: bytes, pdf_path: Optional[Path] = None) -> "DirectEditClient":
+        """Open a PDF from an in-memory copy of its file contents.
+
+        Args:
+            data: PDF file contents
+            pdf_path: Original path (used for naming and default save location)
+
+        Returns:
+            DirectEditClient with the document open
+
+        Raises:
+            StirlingAPIError: If the data cannot be opened as a PDF
+        """
+        client = cls()
+        try:
+            client.doc = fitz.open(stream=data, filetype="pdf")
+        except Exception as e:
+            logger.error(f"Failed to open PDF from memory: {e}")
+            raise StirlingAPIError(f"Failed to open PDF from memory: {e}") from e
+
+        client.pdf_path = Path(pdf_path) if pdf_path else None
+        client.source_bytes = data
+        logger.debug(f"Opened PDF from memory ({len(data)} bytes, {len(client.doc)} pages)")
+        return client
+
+    def clone(self) -> "DirectEditClient":
+        """Open an independent in-memory copy of the source document.
+
+        The copy starts from the document as originally opened, not from
+        any edits made since. The source file is read at most once; later
+        clones reuse the bytes held in memory.
+
+        Returns:
+            New DirectEditClient (caller is responsible for closing it)
+
+        Raises:
+            StirlingAPIError: If no document is open
+        """
+        if not self.doc:
+            raise StirlingAPIError("No document open. Call open() first.")
+
+        if self.source_bytes is None:
+            self.source_bytes = self.pdf_path.read_bytes()
+        return DirectEditClient.from_bytes(self.source_bytes, self.pdf_path)
+
     def close(self) -> None:
         """Close the current document."""
         if self.doc:
             self.doc.close()
             self.doc = None
             self.pdf_path = None
+            self.source_bytes = None
             logger.debug("Document closed")
 
     def extract_text_elements(self) -> List[Dict[str, Any]]:
@@ -226,27 +275,7 @@ class DirectEditClient:
                 color = (0.0, 0.0, 0.0)
 
                 if match_style:
-                    text_dict = page.get_text("dict", clip=rect)
-                    try:
-                        for block in text_dict.get("blocks", []):
-                            for line in block.get("lines", []):
-                                for span in line.get("spans", []):
-                                    if span.get("text", "").strip():
-                                        font_size = span.get("size", font_size)
-                                        c_int = span.get("color", 0)
-                                        r = ((c_int >> 16) & 255) / 255
-                                        g = ((c_int >> 8) & 255) / 255
-                                        b = (c_int & 255) / 255
-                                        color = (r, g, b)
-                                        break
-                                else:
-                                    continue
-                                break
-                            else:
-                                continue
-                            break
-                    except Exception as e:
-                        logger.warning(f"Could not extract style: {e}")
+                    font_size, color = self._span_style(page, rect)
 
                 # Redact old text
                 page.add_redact_annot(rect)
@@ -266,16 +295,74 @@ class DirectEditClient:
         logger.info(f"Replaced {replacements} occurrences of '{search_text}' with '{replace_text}'")
         return replacements
 
+    @staticmethod
+    def _span_style(page: fitz.Page, rect: fitz.Rect) -> Tuple[float, Tuple[float, float, float]]:
+        """Get font size and color of the first non-empty span inside rect.
+
+        Args:
+            page: Page containing the text
+            rect: Area to inspect
+
+        Returns:
+            Tuple of (font size, RGB color in 0-1 range); defaults if not found
+        """
+        font_size = 12.0
+        color = (0.0, 0.0, 0.0)
+
+        text_dict = page.get_text("dict", clip=rect)
+        try:
+            for block in text_dict.get("blocks", []):
+                for line in block.get("lines", []):
+                    for span in line.get("spans", []):
+                        if span.get("text", "").strip():
+                            font_size = span.get("size", font_size)
+                            c_int = span.get("color", 0)
+                            r = ((c_int >> 16) & 255) / 255
+                            g = ((c_int >> 8) & 255) / 255
+                            b = (c_int & 255) / 255
+                            return font_size, (r, g, b)
+        except Exception as e:
+            logger.warning(f"Could not extract style: {e}")
+
+        return font_size, color
+
+    @staticmethod
+    def _format_replacement(replacement: Any) -> str:
+        """Convert a synthetic value to replacement text.
+
+        Args:
+            replacement: Synthetic value (string, dict or other scalar)
+
+        Returns:
+            Replacement text
+        """
+        # Handle dict values (e.g., date ranges from LLM)
+        if isinstance(replacement, dict):
+            # Try to format as "start - end" for date ranges
+            if "start_date" in replacement and "end_date" in replacement:
+                return f"{replacement['start_date']} - {replacement['end_date']}"
+            if "start" in replacement and "end" in replacement:
+                return f"{replacement['start']} - {replacement['end']}"
+            # Fallback: join all values
+            return " ".join(str(v) for v in replacement.values())
+        if not isinstance(replacement, str):
+            return str(replacement)
+        return replacement
+
     def apply_template(
         self,
         template: Dict[str, Any],
-        synthetic_data: Dict[str, Any]
+        synthetic_data: Dict[str, Any],
+        batched: bool = True,
     ) -> int:
         """Apply multiple replacements from a template.
 
         Args:
             template: Template with variable_fields list
             synthetic_data: Dict mapping field_type to replacement value (string or dict)
+            batched: If True, compile a replacement plan and rewrite each
+                touched page once (see compile_plan). If False, run
+                find_and_replace per field.
 
         Returns:
             Total number of replacements made
@@ -286,10 +373,9 @@ class DirectEditClient:
         if not self.doc:
             raise StirlingAPIError("No document open. Call open() first.")
 
-        variable_fields = template.get("variable_fields", [])
-        total_replacements = 0
+        variable_fields = []
 
-        for field in variable_fields:
+        for field in template.get("variable_fields", []):
             field_type = field.get("fieldType") or field.get("field_type")
             original_text = field.get("text") or field.get("original_text")
 
@@ -301,25 +387,144 @@ class DirectEditClient:
                 logger.warning(f"No synthetic data for field type '{field_type}'")
                 continue
 
-            # Handle dict values (e.g., date ranges from LLM)
-            if isinstance(replacement, dict):
-                # Try to format as "start - end" for date ranges
-                if "start_date" in replacement and "end_date" in replacement:
-                    replacement = f"{replacement['start_date']} - {replacement['end_date']}"
-                elif "start" in replacement and "end" in replacement:
-                    replacement = f"{replacement['start']} - {replacement['end']}"
-                else:
-                    # Fallback: join all values
-                    replacement = " ".join(str(v) for v in replacement.values())
-            elif not isinstance(replacement, str):
-                replacement = str(replacement)
-
-            count = self.find_and_replace(original_text, replacement)
-            total_replacements += count
+            variable_fields.append(field)
+
+        if batched:
+            plan = self.compile_plan({"variable_fields": variable_fields})
+            total_replacements = self.apply_plan(plan, synthetic_data)
+        else:
+            total_replacements = 0
+            for field in variable_fields:
+                field_type = field.get("fieldType") or field.get("field_type")
+                original_text = field.get("text") or field.get("original_text")
+                replacement = self._format_replacement(synthetic_data[field_type])
+                total_replacements += self.find_and_replace(original_text, replacement)
 
         logger.info(f"Applied template: {total_replacements} total replacements")
         return total_replacements
 
+    def compile_plan(self, template: Dict[str, Any]) -> Dict[str, Any]:
+        """Locate every occurrence of the template's fields once.
+
+        The resulting plan lists, per page, each occurrence's rect, insertion
+        baseline and style, so rendering a variation only has to execute it
+        (see apply_plan) instead of searching the document again. Fields whose
+        text does not occur in a page's text are not searched on that page.
+        Where occurrences of different fields overlap, the earlier field wins,
+        as it would when replacing field by field.
+
+        Args:
+            template: Template with variable_fields list
+
+        Returns:
+            JSON-serializable plan: {"pages": {page index: [occurrence, ...]}}
+            where each occurrence has field_type, rect, baseline, size, color
+
+        Raises:
+            StirlingAPIError: If no document is open
+        """
+        if not self.doc:
+            raise StirlingAPIError("No document open. Call open() first.")
+
+        needles = []
+        for field in template.get("variable_fields", []):
+            field_type = field.get("fieldType") or field.get("field_type")
+            original_text = field.get("text") or field.get("original_text")
+            if field_type and original_text:
+                needles.append(("".join(original_text.split()).lower(), original_text, field_type))
+
+        pages = {}
+        total = 0
+        for page_num, page in enumerate(self.doc):
+            # Cheap prefilter: search_for is case-insensitive and ignores line breaks
+            page_text = "".join(page.get_text().split()).lower()
+
+            rects = []
+            occurrences = []
+            for needle, original_text, field_type in needles:
+                if needle not in page_text:
+                    continue
+                for rect in page.search_for(original_text):
+                    if any(rect.intersects(other) for other in rects):
+                        continue
+                    font_size, color = self._span_style(page, rect)
+                    rects.append(rect)
+                    occurrences.append({
+                        "field_type": field_type,
+                        "rect": [rect.x0, rect.y0, rect.x1, rect.y1],
+                        # Insert new text at bottom-left of rect (baseline position)
+                        "baseline": [rect.x0, rect.y1],
+                        "size": font_size,
+                        "color": list(color),
+                    })
+
+            if occurrences:
+                pages[str(page_num)] = occurrences
+                total += len(occurrences)
+
+        logger.info(f"Compiled replacement plan: {total} occurrences on {len(pages)} pages")
+        return {"pages": pages}
+
+    def apply_plan(self, plan: Dict[str, Any], synthetic_data: Dict[str, Any]) -> int:
+        """Execute a replacement plan from compile_plan().
+
+        Each touched page gets all its redaction annotations, a single
+        apply_redactions() call that leaves images and line art alone, and
+        then the replacement text.
+
+        Args:
+            plan: Plan compiled for this document
+            synthetic_data: Dict mapping field_type to replacement value (string or dict)
+
+        Returns:
+            Number of replacements made
+
+        Raises:
+            StirlingAPIError: If no document is open
+        """
+        if not self.doc:
+            raise StirlingAPIError("No document open. Call open() first.")
+
+        total = 0
+        missing = set()
+
+        for page_key, occurrences in plan.get("pages", {}).items():
+            page = self.doc[int(page_key)]
+
+            inserts = []
+            for occurrence in occurrences:
+                replacement = synthetic_data.get(occurrence["field_type"])
+                if not replacement:
+                    missing.add(occurrence["field_type"])
+                    continue
+                page.add_redact_annot(fitz.Rect(occurrence["rect"]))
+                inserts.append((occurrence, self._format_replacement(replacement)))
+
+            if not inserts:
+                continue
+
+            page.apply_redactions(
+                images=fitz.PDF_REDACT_IMAGE_NONE,
+                graphics=fitz.PDF_REDACT_LINE_ART_NONE,
+            )
+
+            for occurrence, replacement in inserts:
+                page.insert_text(
+                    point=fitz.Point(occurrence["baseline"]),
+                    text=replacement,
+                    fontsize=occurrence["size"],
+                    fontname="helv",
+                    color=tuple(occurrence["color"]),
+                )
+
+            logger.debug(f"Page {int(page_key) + 1}: {len(inserts)} replacement(s) in one redaction pass")
+            total += len(inserts)
+
+        for field_type in sorted(missing):
+            logger.warning(f"No synthetic data for field type '{field_type}'")
+
+        return total
+
     def save(self, output_path: Optional[Path] = None) -> Path:
         """Save the modified PDF.
 
@@ -202,9 +202,9 @@ class StirlingHTTPClient:
             )
 
         # Save to cache
-        from ..config.settings import Settings
+        from ..config.settings import get_settings
 
-        settings = Settings()
+        settings = get_settings()
         output_path = settings.cache_dir / f"ocr_{input_path.stem}.pdf"
         with open(output_path, "wb") as f:
             f.write(response_content)
@@ -248,9 +248,9 @@ class StirlingHTTPClient:
             )
 
         # Save to cache
-        from ..config.settings import Settings
+        from ..config.settings import get_settings
 
-        settings = Settings()
+        settings = get_settings()
         output_path = settings.cache_dir / f"converted_{image_path.stem}.pdf"
         with open(output_path, "wb") as f:
             f.write(response_content)
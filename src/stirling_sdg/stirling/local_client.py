@@ -3,34 +3,126 @@
 This module implements the same interface as StirlingClient but uses local
 Python libraries instead of making HTTP calls to a Stirling PDF Docker container.
 
-Libraries used:
+Libraries used (imported on first use):
 - pdfplumber: PDF text/layout extraction
+- pymupdf: fast PDF text/layout extraction
 - reportlab: PDF generation from JSON
 - ocrmypdf: OCR for scanned PDFs (requires tesseract)
 - img2pdf: Image to PDF conversion
 - PIL: Image handling
 """
 
+import bisect
+import io
+import itertools
 import json
-import subprocess
+import re
 import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator
 
-import img2pdf
-import pdfplumber
-from PIL import Image
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.units import inch
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.pdfgen import canvas
+# The PDF/image libraries (pymupdf, pdfplumber, reportlab, img2pdf, PIL) are
+# imported in the methods that use them, so importing this module is cheap
+if TYPE_CHECKING:
+    import fitz
+    from reportlab.pdfgen import canvas
 
+from ..utils.dependencies import probe_dependency
+from ..utils.disk_cache import DiskCache, file_digest
 from ..utils.exceptions import StirlingAPIError
 from ..utils.logging_utils import get_logger
+from ..utils.metrics import OCR_CACHE_HITS, OCR_SECONDS, PAGES_EXTRACTED
+from ..utils.process_pool import pool_context
 
 logger = get_logger(__name__)
 
+EXTRACTION_ENGINES = ("pdfplumber", "pymupdf")
+
+# Documents with fewer pages are always extracted serially
+PARALLEL_EXTRACTION_MIN_PAGES = 8
+
+_CID_PATTERN = re.compile(r'\(cid:\d+\)')
+
+# ocrmypdf options besides language/ocr_type; part of the OCR cache key
+OCR_OPTIONS = {"deskew": True, "optimize": 1}
+
+
+
+class _SpatialGrid:
+    """Uniform grid of placed text boxes for neighbourhood queries."""
+
+    CELL_SIZE = 64.0
+
+    def __init__(self):
+        self._cells: Dict[tuple, list] = {}
+
+    def _span(self, start: float, end: float) -> range:
+        return range(int(start // self.CELL_SIZE), int(end // self.CELL_SIZE) + 1)
+
+    def add(self, box: tuple) -> None:
+        """Insert an (x, y, w, h, font_size) box into every cell it covers."""
+        x, y, w, h = box[0], box[1], max(box[2], 0), max(box[3], 0)
+        for cy in self._span(y, y + h):
+            for cx in self._span(x, x + w):
+                self._cells.setdefault((cx, cy), []).append(box)
+
+    def query(self, x: float, y: float, w: float, h: float, reach: float) -> Iterator[tuple]:
+        """Yield boxes stored in cells within reach of an (x, y, w, h) box.
+
+        A box spanning several cells may be yielded more than once.
+        """
+        w, h = max(w, 0), max(h, 0)
+        for cy in self._span(y - reach, y + h + reach):
+            for cx in self._span(x - reach, x + w + reach):
+                yield from self._cells.get((cx, cy), ())
+
+
+class _ShiftChain:
+    """Cascading downward shifts of _resolve_text_collisions, applied lazily.
+
+    Every shift moves all not-yet-placed elements down and clamps them to the
+    page: y -> max(min(y + shift, page_height - height - margin), 0). The
+    composition of such shifts is kept as a total offset plus the tightest
+    accumulated bound, which gives the same result as applying them one by
+    one as long as the lower clamp never engages (y >= 0 and the element fits
+    above every bound). Other elements replay the recorded shifts.
+    """
+
+    def __init__(self, page_height: float):
+        self.page_height = page_height
+        self._shifts: list = []
+        self._offset = 0.0
+        self._bound = float("inf")
+        self._min_limit = float("inf")
+
+    def __bool__(self) -> bool:
+        return bool(self._shifts)
+
+    def push(self, shift: float, margin: float) -> None:
+        """Record a shift that applies to the current and all later elements."""
+        limit = self.page_height - margin
+        self._shifts.append((shift, limit))
+        self._offset += shift
+        self._bound = min(self._bound + shift, limit)
+        self._min_limit = min(self._min_limit, limit)
+
+    def apply(self, y: float, height: float) -> float:
+        """Position of an element after all recorded shifts."""
+        if not self._shifts:
+            return y
+        if y >= 0 and height <= self._min_limit:
+            return min(y + self._offset, self._bound - height)
+        for shift, limit in self._shifts:
+            y = max(min(y + shift, limit - height), 0)
+        return y
+
+    def apply_last(self, y: float, height: float) -> float:
+        """Position of an element after the most recent shift only."""
+        shift, limit = self._shifts[-1]
+        return max(min(y + shift, limit - height), 0)
+
 
 class LocalStirlingClient:
     """Local client for PDF processing - replaces Stirling PDF Docker.
@@ -39,45 +131,61 @@ class LocalStirlingClient:
     local Python libraries instead of HTTP calls to a Docker container.
     """
 
-    def __init__(self, cache_dir: Path | None = None):
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        extraction_workers: int = 1,
+        extraction_engine: str = "pdfplumber",
+        ocr_cache_enabled: bool = True,
+        ocr_cache_max_mb: int = 1024,
+    ):
         """Initialize local PDF client.
 
         Args:
             cache_dir: Directory for temporary/cached files
+            extraction_workers: Default number of processes for pdf_to_json
+            extraction_engine: Default pdf_to_json engine ("pdfplumber" or "pymupdf")
+            ocr_cache_enabled: Reuse OCR/image conversion results for identical inputs
+            ocr_cache_max_mb: Max size of the OCR cache in MB
         """
         if cache_dir is None:
-            from ..config.settings import Settings
-            settings = Settings()
-            self.cache_dir = settings.cache_dir
+            from ..config.settings import get_settings
+            self.cache_dir = get_settings().cache_dir
         else:
             self.cache_dir = cache_dir
         
+        self.extraction_workers = extraction_workers
+        self.extraction_engine = extraction_engine
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # OCR and image conversion outputs, keyed by input content and options
+        self.ocr_cache = DiskCache(
+            self.cache_dir / "ocr",
+            max_bytes=ocr_cache_max_mb * 1024 * 1024,
+            enabled=ocr_cache_enabled,
+            suffix=".pdf",
+        )
         self._check_dependencies()
         logger.info("LocalStirlingClient initialized (no Docker required)")
 
     def _check_dependencies(self):
-        """Check if required external dependencies are available."""
+        """Check if required external dependencies are available.
+
+        Probe results are cached per process and in cache_dir, keyed by the
+        binary's mtime, so this does not spawn a subprocess per client.
+        """
         # Check for tesseract (required by ocrmypdf)
-        try:
-            result = subprocess.run(
-                ["tesseract", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                version_line = result.stdout.split('\n')[0]
-                logger.info(f"Tesseract found: {version_line}")
-            else:
-                logger.warning("Tesseract check returned non-zero, OCR may not work")
-        except FileNotFoundError:
+        tesseract = probe_dependency("tesseract", cache_dir=self.cache_dir)
+        if tesseract["available"]:
+            logger.info(f"Tesseract found: {tesseract['version']}")
+        elif tesseract["path"] is None:
             logger.warning(
                 "Tesseract not found. OCR will not work. "
                 "Install with: brew install tesseract (macOS) or apt-get install tesseract-ocr (Linux)"
             )
-        except Exception as e:
-            logger.warning(f"Could not verify tesseract installation: {e}")
+        else:
+            logger.warning(
+                f"Tesseract check failed ({tesseract['error']}), OCR may not work"
+            )
 
     def ocr_pdf(
         self,
@@ -87,6 +195,9 @@ class LocalStirlingClient:
     ) -> Path:
         """Apply OCR to PDF using ocrmypdf.
 
+        Results are cached by input content, languages, ocr_type and ocrmypdf
+        options, so re-running the same scan reuses the earlier OCR output.
+
         Args:
             input_path: Path to input PDF
             languages: List of OCR languages (default: ["eng"])
@@ -103,29 +214,46 @@ class LocalStirlingClient:
 
         file_size = input_path.stat().st_size
         lang_str = "+".join(languages)
-        logger.info(
-            f"Applying OCR to {input_path.name} ({file_size / 1024:.1f} KB, languages: {lang_str})"
-        )
-
-        output_path = self.cache_dir / f"ocr_{input_path.stem}.pdf"
 
         try:
             import ocrmypdf
 
+            cache_key = DiskCache.make_key({
+                "operation": "ocr",
+                "content": file_digest(input_path),
+                "languages": lang_str,
+                "ocr_type": ocr_type,
+                "options": OCR_OPTIONS,
+                "ocrmypdf": getattr(ocrmypdf, "__version__", None),
+            })
+            cached = self.ocr_cache.get_path(cache_key)
+            if cached is not None:
+                logger.info(f"OCR cache hit for {input_path.name}: {cached}")
+                OCR_CACHE_HITS.inc()
+                return cached
+
+            logger.info(
+                f"Applying OCR to {input_path.name} ({file_size / 1024:.1f} KB, languages: {lang_str})"
+            )
+
             # Map ocr_type to ocrmypdf options
             skip_text = ocr_type == "skip-text"
             force_ocr = ocr_type == "force-ocr"
 
-            ocrmypdf.ocr(
-                input_path,
-                output_path,
-                language=lang_str,
-                skip_text=skip_text,
-                force_ocr=force_ocr,
-                deskew=True,
-                optimize=1,
-                progress_bar=False,
-            )
+            def run_ocr(output_path: Path) -> None:
+                started = time.perf_counter()
+                ocrmypdf.ocr(
+                    input_path,
+                    output_path,
+                    language=lang_str,
+                    skip_text=skip_text,
+                    force_ocr=force_ocr,
+                    progress_bar=False,
+                    **OCR_OPTIONS,
+                )
+                OCR_SECONDS.observe(time.perf_counter() - started)
+
+            output_path = self._cached_output(cache_key, f"ocr_{input_path.stem}.pdf", run_ocr)
 
             logger.info(f"OCR completed: {output_path}")
             return output_path
@@ -137,6 +265,8 @@ class LocalStirlingClient:
     def convert_image_to_pdf(self, image_path: Path) -> Path:
         """Convert image to PDF using img2pdf.
 
+        Results are cached by image content.
+
         Args:
             image_path: Path to input image
 
@@ -147,28 +277,38 @@ class LocalStirlingClient:
             StirlingAPIError: If conversion fails
         """
         file_size = image_path.stat().st_size
-        logger.info(f"Converting image to PDF: {image_path.name} ({file_size / 1024:.1f} KB)")
-
-        output_path = self.cache_dir / f"converted_{image_path.stem}.pdf"
 
         try:
+            import img2pdf
+            from PIL import Image
+
+            cache_key = DiskCache.make_key({
+                "operation": "image_to_pdf",
+                "content": file_digest(image_path),
+            })
+            cached = self.ocr_cache.get_path(cache_key)
+            if cached is not None:
+                logger.info(f"Image conversion cache hit for {image_path.name}: {cached}")
+                return cached
+
+            logger.info(f"Converting image to PDF: {image_path.name} ({file_size / 1024:.1f} KB)")
+
             # Open image to check format and potentially convert
             with Image.open(image_path) as img:
                 # img2pdf doesn't support all formats, convert to PNG if needed
                 if img.format not in ['JPEG', 'PNG', 'TIFF']:
-                    # Convert to PNG
-                    temp_png = self.cache_dir / f"temp_{image_path.stem}.png"
-                    img.save(temp_png, 'PNG')
-                    image_to_convert = temp_png
+                    png = io.BytesIO()
+                    img.save(png, 'PNG')
+                    image_bytes = png.getvalue()
                 else:
-                    image_to_convert = image_path
+                    image_bytes = image_path.read_bytes()
 
             # Convert to PDF
-            with open(image_to_convert, "rb") as img_file:
-                pdf_bytes = img2pdf.convert(img_file)
+            pdf_bytes = img2pdf.convert(image_bytes)
 
-            with open(output_path, "wb") as pdf_file:
-                pdf_file.write(pdf_bytes)
+            output_path = self._cached_output(
+                cache_key, f"converted_{image_path.stem}.pdf", lambda path: path.write_bytes(pdf_bytes)
+            )
 
             logger.info(f"Image conversion completed: {output_path}")
             return output_path
@@ -177,114 +317,77 @@ class LocalStirlingClient:
             logger.error(f"Image to PDF conversion failed: {e}")
             raise StirlingAPIError(f"Image to PDF conversion failed: {e}") from e
 
+    def _cached_output(self, cache_key: str, fallback_name: str, write) -> Path:
+        """Write an output into the OCR cache, or to cache_dir if caching is off.
+
+        Args:
+            cache_key: Key from DiskCache.make_key()
+            fallback_name: File name under cache_dir when the cache is disabled
+                or the entry could not be stored
+            write: Function that writes the output to a given path
+
+        Returns:
+            Path to the written output
+        """
+        output_path = self.ocr_cache.put_file(cache_key, write)
+        if output_path is None:
+            output_path = self.cache_dir / fallback_name
+            write(output_path)
+        return output_path
+
     def pdf_to_json(
-        self, pdf_path: Path, lazy_load: bool = False
+        self,
+        pdf_path: Path,
+        lazy_load: bool = False,
+        workers: int | None = None,
+        engine: str | None = None,
     ) -> Dict[str, Any]:
-        """Extract PDF to JSON using pdfplumber.
+        """Extract PDF to JSON using pdfplumber or PyMuPDF.
 
         Args:
             pdf_path: Path to input PDF
             lazy_load: Not used in local implementation
+            workers: Extraction processes (default: the client's
+                extraction_workers). With more than one, page ranges are
+                extracted in a process pool and reassembled in page order;
+                the output is identical to serial extraction.
+            engine: "pdfplumber" or "pymupdf" (default: the client's
+                extraction_engine). Both emit the same JSON schema; PyMuPDF
+                is much faster.
 
         Returns:
             JSON structure with text, lines, rectangles, and curves
 
         Raises:
-            StirlingAPIError: If extraction fails
+            StirlingAPIError: If extraction fails or the engine is unknown
         """
-        logger.info(f"Extracting PDF to JSON: {pdf_path.name}")
+        if workers is None:
+            workers = self.extraction_workers
+        if engine is None:
+            engine = self.extraction_engine
+        if engine not in EXTRACTION_ENGINES:
+            raise StirlingAPIError(
+                f"Unknown extraction engine '{engine}' (expected one of {EXTRACTION_ENGINES})"
+            )
+
+        logger.info(f"Extracting PDF to JSON: {pdf_path.name} (engine: {engine})")
 
         try:
-            pages_data = []
-
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    page_width = page.width
-                    page_height = page.height
-
-                    # Extract text elements
-                    text_elements = []
-                    words = page.extract_words(
-                        keep_blank_chars=True,
-                        extra_attrs=['fontname', 'size']
-                    )
-
-                    for word in words:
-                        text = word.get("text", "")
-                        
-                        # Filter out CID codes (e.g., "(cid:13)", "(cid:136)")
-                        # These are placeholder codes for embedded font glyphs
-                        import re
-                        text = re.sub(r'\(cid:\d+\)', '', text).strip()
-                        
-                        # Skip if text is empty after filtering
-                        if not text:
-                            continue
-                        
-                        text_elem = {
-                            "text": text,
-                            "x": float(word.get("x0", 0)),
-                            "y": float(word.get("top", 0)),
-                            "width": float(word.get("x1", 0) - word.get("x0", 0)),
-                            "height": float(word.get("bottom", 0) - word.get("top", 0)),
-                            "fontSize": float(word.get("size", 12)) if word.get("size") else 12.0,
-                            "fontName": word.get("fontname", "Helvetica"),
-                        }
-                        text_elements.append(text_elem)
-
-                    # Extract lines
-                    line_elements = []
-                    for line in page.lines:
-                        line_elem = {
-                            "x0": float(line.get("x0", 0)),
-                            "y0": float(line.get("top", 0)),
-                            "x1": float(line.get("x1", 0)),
-                            "y1": float(line.get("bottom", 0)),
-                            "lineWidth": float(line.get("linewidth", 1) or 1),
-                            "strokeColor": self._extract_color(line.get("stroking_color")),
-                        }
-                        line_elements.append(line_elem)
-
-                    # Extract rectangles
-                    rect_elements = []
-                    for rect in page.rects:
-                        rect_elem = {
-                            "x0": float(rect.get("x0", 0)),
-                            "y0": float(rect.get("top", 0)),
-                            "x1": float(rect.get("x1", 0)),
-                            "y1": float(rect.get("bottom", 0)),
-                            "lineWidth": float(rect.get("linewidth", 1) or 1),
-                            "strokeColor": self._extract_color(rect.get("stroking_color")),
-                            "fillColor": self._extract_color(rect.get("non_stroking_color")),
-                        }
-                        rect_elements.append(rect_elem)
-
-                    # Extract curves
-                    curve_elements = []
-                    for curve in page.curves:
-                        # Curves have a 'pts' attribute with list of points
-                        pts = curve.get("pts", [])
-                        if pts:
-                            curve_elem = {
-                                "points": [(float(p[0]), float(p[1])) for p in pts],
-                                "lineWidth": float(curve.get("linewidth", 1) or 1),
-                                "strokeColor": self._extract_color(curve.get("stroking_color")),
-                                "fillColor": self._extract_color(curve.get("non_stroking_color")),
-                            }
-                            curve_elements.append(curve_elem)
-
-                    page_data = {
-                        "pageNumber": page_num,
-                        "width": float(page_width),
-                        "height": float(page_height),
-                        "textElements": text_elements,
-                        "lineElements": line_elements,
-                        "rectElements": rect_elements,
-                        "curveElements": curve_elements,
-                    }
-                    pages_data.append(page_data)
+            parallel = False
+            if workers > 1:
+                import fitz
+
+                with fitz.open(pdf_path) as doc:
+                    page_count = len(doc)
+                parallel = page_count >= PARALLEL_EXTRACTION_MIN_PAGES
+
+            if parallel:
+                pages_data = self._extract_parallel(pdf_path, page_count, workers, engine)
+            else:
+                pages_data = _extract_page_range(pdf_path, 0, None, engine)
 
             pdf_json = {"pages": pages_data}
+            PAGES_EXTRACTED.inc(len(pages_data), engine=engine)
 
             total_text = sum(len(p["textElements"]) for p in pages_data)
             total_lines = sum(len(p["lineElements"]) for p in pages_data)
@@ -300,7 +403,281 @@ class LocalStirlingClient:
             logger.error(f"PDF to JSON extraction failed: {e}")
             raise StirlingAPIError(f"PDF to JSON extraction failed: {e}") from e
 
-    def _extract_color(self, color) -> list | None:
+    def iter_pages_json(
+        self, pdf_path: Path, engine: str | None = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Extract PDF to JSON one page at a time.
+
+        Yields the same page dicts as pdf_to_json()["pages"], but only one page
+        (and its parser state) is held in memory at a time, and the first page
+        is available before the rest are parsed. The pages can be consumed by
+        classification (as {"pages": iterator}) and by pages_to_pdf().
+
+        Args:
+            pdf_path: Path to input PDF
+            engine: "pdfplumber" or "pymupdf" (default: the client's extraction_engine)
+
+        Yields:
+            Page dicts with textElements, lineElements, rectElements, curveElements
+
+        Raises:
+            StirlingAPIError: If extraction fails or the engine is unknown
+        """
+        if engine is None:
+            engine = self.extraction_engine
+        if engine not in EXTRACTION_ENGINES:
+            raise StirlingAPIError(
+                f"Unknown extraction engine '{engine}' (expected one of {EXTRACTION_ENGINES})"
+            )
+
+        logger.info(f"Streaming PDF to JSON: {pdf_path.name} (engine: {engine})")
+
+        try:
+            for page in _iter_page_range(pdf_path, engine=engine):
+                PAGES_EXTRACTED.inc(engine=engine)
+                yield page
+        except Exception as e:
+            logger.error(f"PDF to JSON extraction failed: {e}")
+            raise StirlingAPIError(f"PDF to JSON extraction failed: {e}") from e
+
+    @staticmethod
+    def _extract_parallel(pdf_path: Path, page_count: int, workers: int, engine: str) -> list:
+        """Extract page ranges in a process pool and reassemble them in order.
+
+        Args:
+            pdf_path: Path to input PDF
+            page_count: Number of pages in the PDF
+            workers: Number of processes
+            engine: Extraction engine
+
+        Returns:
+            List of page dicts, in page order
+        """
+        # Several ranges per worker so uneven pages balance out
+        chunk = max(1, -(-page_count // (workers * 4)))
+        ranges = [(start, min(start + chunk, page_count)) for start in range(0, page_count, chunk)]
+        logger.info(
+            f"Extracting {page_count} pages in {len(ranges)} ranges with {workers} processes"
+        )
+
+        pages_data = []
+        # Not forked directly: callers (batch runs, the job server) have other threads running
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(ranges)),
+            mp_context=pool_context(_extract_page_range.__module__),
+        ) as executor:
+            for pages in executor.map(
+                _extract_page_range,
+                [pdf_path] * len(ranges),
+                [start for start, _ in ranges],
+                [end for _, end in ranges],
+                [engine] * len(ranges),
+            ):
+                pages_data.extend(pages)
+        return pages_data
+
+    @staticmethod
+    def _fitz_page_to_json(page: "fitz.Page", page_num: int) -> Dict[str, Any]:
+        """Extract one PyMuPDF page to the same JSON schema as _page_to_json.
+
+        Text elements are text spans, with y/height derived from the baseline
+        and font size the way pdfplumber computes word boxes. Drawings are
+        classified like pdfplumber does: single straight segments become
+        lines, rectangles become rects and every other subpath becomes a
+        curve through its on-curve points.
+
+        Args:
+            page: PyMuPDF page
+            page_num: 1-indexed page number
+
+        Returns:
+            Page dict with textElements, lineElements, rectElements, curveElements
+        """
+        # Extract text elements
+        text_elements = []
+        import fitz
+
+        text_dict = page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)
+        for block in text_dict.get("blocks", []):
+            for line in block.get("lines", []):
+                for span in line.get("spans", []):
+                    text = _CID_PATTERN.sub('', span.get("text", "")).strip()
+                    if not text:
+                        continue
+
+                    size = float(span.get("size", 12)) or 12.0
+                    x0, _, x1, _ = span["bbox"]
+                    bottom = span["origin"][1] - span.get("descender", -0.2) * size
+                    text_elements.append({
+                        "text": text,
+                        "x": float(x0),
+                        "y": float(bottom - size),
+                        "width": float(x1 - x0),
+                        "height": size,
+                        "fontSize": size,
+                        "fontName": span.get("font") or "Helvetica",
+                    })
+
+        line_elements = []
+        rect_elements = []
+        curve_elements = []
+
+        for drawing in page.get_drawings():
+            line_width = float(drawing.get("width") or 1)
+            stroke_color = list(drawing["color"][:3]) if drawing.get("color") else None
+            fill_color = list(drawing["fill"][:3]) if drawing.get("fill") else None
+
+            # Split the path into subpaths of connected segments
+            subpaths = []
+            for item in drawing.get("items", []):
+                kind = item[0]
+                if kind in ("re", "qu"):
+                    rect = item[1] if kind == "re" else item[1].rect
+                    rect_elements.append({
+                        "x0": float(rect.x0),
+                        "y0": float(rect.y0),
+                        "x1": float(rect.x1),
+                        "y1": float(rect.y1),
+                        "lineWidth": line_width,
+                        "strokeColor": stroke_color,
+                        "fillColor": fill_color,
+                    })
+                    continue
+
+                # "l" is (kind, p1, p2); "c" is (kind, p1, c1, c2, p2)
+                start_point = (float(item[1].x), float(item[1].y))
+                end_point = (float(item[-1].x), float(item[-1].y))
+                if not subpaths or subpaths[-1]["points"][-1] != start_point:
+                    subpaths.append({"points": [start_point], "curved": False})
+                subpaths[-1]["points"].append(end_point)
+                subpaths[-1]["curved"] |= kind != "l"
+
+            for subpath in subpaths:
+                points = subpath["points"]
+                if len(points) == 2 and not subpath["curved"]:
+                    # Same bounding-box convention as pdfplumber lines
+                    (ax, ay), (bx, by) = points
+                    line_elements.append({
+                        "x0": min(ax, bx),
+                        "y0": min(ay, by),
+                        "x1": max(ax, bx),
+                        "y1": max(ay, by),
+                        "lineWidth": line_width,
+                        "strokeColor": stroke_color,
+                    })
+                else:
+                    curve_elements.append({
+                        "points": points,
+                        "lineWidth": line_width,
+                        "strokeColor": stroke_color,
+                        "fillColor": fill_color,
+                    })
+
+        return {
+            "pageNumber": page_num,
+            "width": float(page.rect.width),
+            "height": float(page.rect.height),
+            "textElements": text_elements,
+            "lineElements": line_elements,
+            "rectElements": rect_elements,
+            "curveElements": curve_elements,
+        }
+
+    @staticmethod
+    def _page_to_json(page: Any, page_num: int) -> Dict[str, Any]:
+        """Extract one pdfplumber page to its JSON representation.
+
+        Args:
+            page: pdfplumber page
+            page_num: 1-indexed page number
+
+        Returns:
+            Page dict with textElements, lineElements, rectElements, curveElements
+        """
+        extract_color = LocalStirlingClient._extract_color
+
+        # Extract text elements
+        text_elements = []
+        words = page.extract_words(
+            keep_blank_chars=True,
+            extra_attrs=['fontname', 'size']
+        )
+
+        for word in words:
+            text = word.get("text", "")
+
+            # Filter out CID codes (e.g., "(cid:13)", "(cid:136)")
+            # These are placeholder codes for embedded font glyphs
+            text = _CID_PATTERN.sub('', text).strip()
+
+            # Skip if text is empty after filtering
+            if not text:
+                continue
+
+            text_elem = {
+                "text": text,
+                "x": float(word.get("x0", 0)),
+                "y": float(word.get("top", 0)),
+                "width": float(word.get("x1", 0) - word.get("x0", 0)),
+                "height": float(word.get("bottom", 0) - word.get("top", 0)),
+                "fontSize": float(word.get("size", 12)) if word.get("size") else 12.0,
+                "fontName": word.get("fontname", "Helvetica"),
+            }
+            text_elements.append(text_elem)
+
+        # Extract lines
+        line_elements = []
+        for line in page.lines:
+            line_elem = {
+                "x0": float(line.get("x0", 0)),
+                "y0": float(line.get("top", 0)),
+                "x1": float(line.get("x1", 0)),
+                "y1": float(line.get("bottom", 0)),
+                "lineWidth": float(line.get("linewidth", 1) or 1),
+                "strokeColor": extract_color(line.get("stroking_color")),
+            }
+            line_elements.append(line_elem)
+
+        # Extract rectangles
+        rect_elements = []
+        for rect in page.rects:
+            rect_elem = {
+                "x0": float(rect.get("x0", 0)),
+                "y0": float(rect.get("top", 0)),
+                "x1": float(rect.get("x1", 0)),
+                "y1": float(rect.get("bottom", 0)),
+                "lineWidth": float(rect.get("linewidth", 1) or 1),
+                "strokeColor": extract_color(rect.get("stroking_color")),
+                "fillColor": extract_color(rect.get("non_stroking_color")),
+            }
+            rect_elements.append(rect_elem)
+
+        # Extract curves
+        curve_elements = []
+        for curve in page.curves:
+            # Curves have a 'pts' attribute with list of points
+            pts = curve.get("pts", [])
+            if pts:
+                curve_elem = {
+                    "points": [(float(p[0]), float(p[1])) for p in pts],
+                    "lineWidth": float(curve.get("linewidth", 1) or 1),
+                    "strokeColor": extract_color(curve.get("stroking_color")),
+                    "fillColor": extract_color(curve.get("non_stroking_color")),
+                }
+                curve_elements.append(curve_elem)
+
+        return {
+            "pageNumber": page_num,
+            "width": float(page.width),
+            "height": float(page.height),
+            "textElements": text_elements,
+            "lineElements": line_elements,
+            "rectElements": rect_elements,
+            "curveElements": curve_elements,
+        }
+
+    @staticmethod
+    def _extract_color(color) -> list | None:
         """Extract color as RGB list from pdfplumber color value.
 
         Args:
@@ -332,6 +709,37 @@ class LocalStirlingClient:
         Returns:
             Path to generated PDF
 
+        Raises:
+            StirlingAPIError: If PDF generation fails
+        """
+        return self.pages_to_pdf(
+            json_data.get("pages", []),
+            output_path,
+            resolve_collisions=resolve_collisions,
+            add_word_spacing=add_word_spacing,
+        )
+
+    def pages_to_pdf(
+        self,
+        pages: Iterable[Dict[str, Any]],
+        output_path: Path,
+        resolve_collisions: bool = False,
+        add_word_spacing: bool = False,
+    ) -> Path:
+        """Rebuild PDF from page dicts using reportlab, one page at a time.
+
+        Accepts any iterable of page dicts (e.g. iter_pages_json()), so pages
+        are drawn as they arrive and need not all be held in memory.
+
+        Args:
+            pages: Page dicts with textElements, lineElements, rectElements, curveElements
+            output_path: Path to save output PDF
+            resolve_collisions: If True, detect and resolve overlapping text by cascading shifts
+            add_word_spacing: If True, add minimum spacing between adjacent words (can be aggressive)
+
+        Returns:
+            Path to generated PDF
+
         Raises:
             StirlingAPIError: If PDF generation fails
         """
@@ -340,135 +748,27 @@ class LocalStirlingClient:
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            pages = json_data.get("pages", [])
-            if not pages:
+            pages = iter(pages)
+            first_page = next(pages, None)
+            if first_page is None:
                 raise StirlingAPIError("No pages found in JSON data")
 
             # Get first page dimensions for default page size
-            first_page = pages[0]
             page_width = first_page.get("width", 612)  # Default letter width
             page_height = first_page.get("height", 792)  # Default letter height
 
+            from reportlab.pdfgen import canvas
+
             c = canvas.Canvas(str(output_path), pagesize=(page_width, page_height))
 
-            for page_data in pages:
+            for page_data in itertools.chain([first_page], pages):
                 page_w = page_data.get("width", page_width)
                 page_h = page_data.get("height", page_height)
                 c.setPageSize((page_w, page_h))
 
-                # 1. Draw rectangles first (background)
-                for rect in page_data.get("rectElements", []):
-                    x0 = rect.get("x0", 0)
-                    y0_top = rect.get("y0", 0)
-                    x1 = rect.get("x1", 0)
-                    y1_top = rect.get("y1", 0)
-                    
-                    # Convert from top-left to bottom-left coordinates
-                    y0 = page_h - y1_top
-                    y1 = page_h - y0_top
-                    
-                    line_width = rect.get("lineWidth", 1)
-                    stroke_color = rect.get("strokeColor")
-                    fill_color = rect.get("fillColor")
-                    
-                    c.setLineWidth(line_width)
-                    
-                    if stroke_color:
-                        c.setStrokeColorRGB(*stroke_color[:3])
-                    else:
-                        c.setStrokeColorRGB(0, 0, 0)
-                    
-                    if fill_color:
-                        c.setFillColorRGB(*fill_color[:3])
-                        c.rect(x0, y0, x1 - x0, y1 - y0, stroke=1, fill=1)
-                    else:
-                        c.rect(x0, y0, x1 - x0, y1 - y0, stroke=1, fill=0)
-
-                # 2. Draw lines
-                for line in page_data.get("lineElements", []):
-                    x0 = line.get("x0", 0)
-                    y0_top = line.get("y0", 0)
-                    x1 = line.get("x1", 0)
-                    y1_top = line.get("y1", 0)
-                    
-                    # Convert from top-left to bottom-left coordinates
-                    y0 = page_h - y0_top
-                    y1 = page_h - y1_top
-                    
-                    line_width = line.get("lineWidth", 1)
-                    stroke_color = line.get("strokeColor")
-                    
-                    c.setLineWidth(line_width)
-                    
-                    if stroke_color:
-                        c.setStrokeColorRGB(*stroke_color[:3])
-                    else:
-                        c.setStrokeColorRGB(0, 0, 0)
-                    
-                    c.line(x0, y0, x1, y1)
-
-                # 3. Draw curves (as connected lines)
-                for curve in page_data.get("curveElements", []):
-                    points = curve.get("points", [])
-                    if len(points) < 2:
-                        continue
-                    
-                    line_width = curve.get("lineWidth", 1)
-                    stroke_color = curve.get("strokeColor")
-                    
-                    c.setLineWidth(line_width)
-                    
-                    if stroke_color:
-                        c.setStrokeColorRGB(*stroke_color[:3])
-                    else:
-                        c.setStrokeColorRGB(0, 0, 0)
-                    
-                    # Create path
-                    path = c.beginPath()
-                    first_point = points[0]
-                    path.moveTo(first_point[0], page_h - first_point[1])
-                    
-                    for point in points[1:]:
-                        path.lineTo(point[0], page_h - point[1])
-                    
-                    c.drawPath(path, stroke=1, fill=0)
-
-                # 4. Draw text elements on top
-                c.setFillColorRGB(0, 0, 0)  # Reset fill color for text
-                
-                text_elements = page_data.get("textElements", [])
-                
-                # Apply collision resolution if enabled
-                if resolve_collisions and text_elements:
-                    text_elements = self._resolve_text_collisions(text_elements, page_w, page_h)
-                
-                # Apply word spacing if enabled (separate from collision resolution)
-                if add_word_spacing and text_elements:
-                    text_elements = self._add_word_spacing(text_elements, page_w)
-                
-                for elem in text_elements:
-                    text = elem.get("text", "")
-                    if not text:
-                        continue
-
-                    x = elem.get("x", 0)
-                    # PDF coordinates are from bottom-left, pdfplumber gives top-left
-                    y_from_top = elem.get("y", 0)
-                    elem_height = elem.get("height", 12)
-                    y = page_h - y_from_top - elem_height
-
-                    font_size = elem.get("fontSize", 12)
-                    font_name = elem.get("fontName", "Helvetica")
-
-                    # Use standard fonts to avoid font not found errors
-                    safe_font = self._get_safe_font(font_name)
-
-                    try:
-                        c.setFont(safe_font, font_size)
-                    except Exception:
-                        c.setFont("Helvetica", font_size)
-
-                    c.drawString(x, y, text)
+                self._draw_page(
+                    c, page_data, page_w, page_h, resolve_collisions, add_word_spacing
+                )
 
                 c.showPage()
 
@@ -481,6 +781,139 @@ class LocalStirlingClient:
             logger.error(f"JSON to PDF generation failed: {e}")
             raise StirlingAPIError(f"JSON to PDF generation failed: {e}") from e
 
+    def _draw_page(
+        self,
+        c: "canvas.Canvas",
+        page_data: Dict[str, Any],
+        page_w: float,
+        page_h: float,
+        resolve_collisions: bool,
+        add_word_spacing: bool,
+    ) -> None:
+        """Draw one page's rects, lines, curves and text onto the canvas.
+
+        Args:
+            c: reportlab canvas positioned on the page
+            page_data: Page dict
+            page_w: Page width
+            page_h: Page height
+            resolve_collisions: If True, resolve overlapping text
+            add_word_spacing: If True, add spacing between adjacent words
+        """
+        # 1. Draw rectangles first (background)
+        for rect in page_data.get("rectElements", []):
+            x0 = rect.get("x0", 0)
+            y0_top = rect.get("y0", 0)
+            x1 = rect.get("x1", 0)
+            y1_top = rect.get("y1", 0)
+            
+            # Convert from top-left to bottom-left coordinates
+            y0 = page_h - y1_top
+            y1 = page_h - y0_top
+            
+            line_width = rect.get("lineWidth", 1)
+            stroke_color = rect.get("strokeColor")
+            fill_color = rect.get("fillColor")
+            
+            c.setLineWidth(line_width)
+            
+            if stroke_color:
+                c.setStrokeColorRGB(*stroke_color[:3])
+            else:
+                c.setStrokeColorRGB(0, 0, 0)
+            
+            if fill_color:
+                c.setFillColorRGB(*fill_color[:3])
+                c.rect(x0, y0, x1 - x0, y1 - y0, stroke=1, fill=1)
+            else:
+                c.rect(x0, y0, x1 - x0, y1 - y0, stroke=1, fill=0)
+
+        # 2. Draw lines
+        for line in page_data.get("lineElements", []):
+            x0 = line.get("x0", 0)
+            y0_top = line.get("y0", 0)
+            x1 = line.get("x1", 0)
+            y1_top = line.get("y1", 0)
+            
+            # Convert from top-left to bottom-left coordinates
+            y0 = page_h - y0_top
+            y1 = page_h - y1_top
+            
+            line_width = line.get("lineWidth", 1)
+            stroke_color = line.get("strokeColor")
+            
+            c.setLineWidth(line_width)
+            
+            if stroke_color:
+                c.setStrokeColorRGB(*stroke_color[:3])
+            else:
+                c.setStrokeColorRGB(0, 0, 0)
+            
+            c.line(x0, y0, x1, y1)
+
+        # 3. Draw curves (as connected lines)
+        for curve in page_data.get("curveElements", []):
+            points = curve.get("points", [])
+            if len(points) < 2:
+                continue
+            
+            line_width = curve.get("lineWidth", 1)
+            stroke_color = curve.get("strokeColor")
+            
+            c.setLineWidth(line_width)
+            
+            if stroke_color:
+                c.setStrokeColorRGB(*stroke_color[:3])
+            else:
+                c.setStrokeColorRGB(0, 0, 0)
+            
+            # Create path
+            path = c.beginPath()
+            first_point = points[0]
+            path.moveTo(first_point[0], page_h - first_point[1])
+            
+            for point in points[1:]:
+                path.lineTo(point[0], page_h - point[1])
+            
+            c.drawPath(path, stroke=1, fill=0)
+
+        # 4. Draw text elements on top
+        c.setFillColorRGB(0, 0, 0)  # Reset fill color for text
+        
+        text_elements = page_data.get("textElements", [])
+        
+        # Apply collision resolution if enabled
+        if resolve_collisions and text_elements:
+            text_elements = self._resolve_text_collisions(text_elements, page_w, page_h)
+        
+        # Apply word spacing if enabled (separate from collision resolution)
+        if add_word_spacing and text_elements:
+            text_elements = self._add_word_spacing(text_elements, page_w)
+        
+        for elem in text_elements:
+            text = elem.get("text", "")
+            if not text:
+                continue
+
+            x = elem.get("x", 0)
+            # PDF coordinates are from bottom-left, pdfplumber gives top-left
+            y_from_top = elem.get("y", 0)
+            elem_height = elem.get("height", 12)
+            y = page_h - y_from_top - elem_height
+
+            font_size = elem.get("fontSize", 12)
+            font_name = elem.get("fontName", "Helvetica")
+
+            # Use standard fonts to avoid font not found errors
+            safe_font = self._get_safe_font(font_name)
+
+            try:
+                c.setFont(safe_font, font_size)
+            except Exception:
+                c.setFont("Helvetica", font_size)
+
+            c.drawString(x, y, text)
+
     def _get_safe_font(self, font_name: str) -> str:
         """Map font name to a safe reportlab font.
 
@@ -538,6 +971,12 @@ class LocalStirlingClient:
     ) -> list:
         """Resolve overlapping text elements by cascading shifts.
 
+        Placed elements are kept in a uniform grid, so each element is only
+        compared with neighbours that can be within its collision margin. A
+        downward shift applies to the shifted element and every element after
+        it; instead of rewriting that tail, the shifts are accumulated in a
+        _ShiftChain and applied to each element when it is reached.
+
         Args:
             elements: List of text element dicts with x, y, width, height, fontSize
             page_width: Page width for boundary checking
@@ -549,44 +988,47 @@ class LocalStirlingClient:
         if not elements:
             return elements
 
-        # Deep copy to avoid modifying original
-        import copy
-        resolved = copy.deepcopy(elements)
+        # Copy the (flat) element dicts; only x and y are rewritten
+        resolved = [dict(elem) for elem in elements]
 
         # Sort by y (top to bottom), then x (left to right)
         resolved.sort(key=lambda e: (e.get("y", 0), e.get("x", 0)))
 
-        # Track occupied regions: (x, y, w, h, font_size)
-        occupied = []
+        # Occupied regions: (x, y, w, h, font_size)
+        occupied = _SpatialGrid()
+        shifts = _ShiftChain(page_height)
+        max_font_size = 0
 
-        for i, elem in enumerate(resolved):
+        for elem in resolved:
             x = elem.get("x", 0)
-            y = elem.get("y", 0)
             w = elem.get("width", 50)
             h = elem.get("height", 12)
             font_size = elem.get("fontSize", 12)
-            
+            y = shifts.apply(elem.get("y", 0), h)
+
             # Margin based on font size (larger fonts need more space)
             base_margin = max(font_size * 0.3, 2)
 
-            # Check collision with all occupied regions
+            # Largest margin any occupied region can need with this element
+            reach = max(max(font_size, max_font_size) * 0.3, 3)
+
+            # Check collision with nearby occupied regions
             shift_y = 0
             shift_x = 0
-            
-            for ox, oy, ow, oh, o_font_size in occupied:
+
+            for ox, oy, ow, oh, o_font_size in occupied.query(x, y, w, h, reach):
                 # Use the larger font size for margin calculation
                 margin = max(font_size, o_font_size) * 0.3
                 margin = max(margin, 3)  # Minimum 3 units
-                
+
                 # Check if boxes overlap (with margin)
                 x_overlap = (x < ox + ow + margin) and (x + w + margin > ox)
                 y_overlap = (y < oy + oh + margin) and (y + h + margin > oy)
-                
+
                 if x_overlap and y_overlap:
                     # Calculate if it's more of a vertical or horizontal overlap
-                    x_overlap_amount = min(x + w, ox + ow) - max(x, ox)
                     y_overlap_amount = min(y + h, oy + oh) - max(y, oy)
-                    
+
                     if y_overlap_amount <= h * 0.5:
                         # Partial vertical overlap - shift down
                         needed_shift_y = (oy + oh + margin) - y
@@ -603,23 +1045,20 @@ class LocalStirlingClient:
                 # Clamp to page bounds
                 new_x = min(new_x, page_width - w - base_margin)
                 new_x = max(new_x, 0)
-                resolved[i]["x"] = new_x
+                elem["x"] = new_x
+                x = new_x
 
             # Apply vertical shift to this and all subsequent elements
             if shift_y > 0:
-                for j in range(i, len(resolved)):
-                    old_y = resolved[j].get("y", 0)
-                    new_y = old_y + shift_y
-                    # Clamp to page bounds
-                    elem_h = resolved[j].get("height", 12)
-                    new_y = min(new_y, page_height - elem_h - base_margin)
-                    new_y = max(new_y, 0)
-                    resolved[j]["y"] = new_y
+                shifts.push(shift_y, base_margin)
+                y = shifts.apply_last(y, h)
+
+            if shifts:
+                elem["y"] = y
 
             # Add this element to occupied regions (with updated position)
-            final_x = resolved[i].get("x", 0)
-            final_y = resolved[i].get("y", 0)
-            occupied.append((final_x, final_y, w, h, font_size))
+            occupied.add((x, y, w, h, font_size))
+            max_font_size = max(max_font_size, font_size)
 
         logger.debug(f"Collision resolution applied to {len(resolved)} elements")
         return resolved
@@ -632,77 +1071,87 @@ class LocalStirlingClient:
             page_width: Page width for bounds checking
             
         Returns:
-            Elements with adjusted horizontal spacing
+            New list of elements with adjusted horizontal spacing; shifted
+            elements are copies, the input is not modified
         """
         if len(elements) < 2:
             return elements
         
-        # Group elements by approximate Y position (same line = within 5 units)
+        # Group elements by approximate Y position (same line = within 5 units).
+        # An element joins the earliest created line whose key is within the
+        # tolerance, otherwise it starts a new line. Keys are therefore at
+        # least the tolerance apart, so only the two keys around y in sorted
+        # order can match.
         line_tolerance = 5
         lines = {}
-        
+        sorted_keys = []
+        line_order = {}
+
         for i, elem in enumerate(elements):
             y = elem.get("y", 0)
-            # Find or create line group
+            pos = bisect.bisect_left(sorted_keys, y)
             line_key = None
-            for key in lines:
-                if abs(key - y) < line_tolerance:
+            for key in sorted_keys[max(pos - 1, 0):pos + 1]:
+                if abs(key - y) < line_tolerance and (
+                    line_key is None or line_order[key] < line_order[line_key]
+                ):
                     line_key = key
-                    break
             if line_key is None:
                 line_key = y
+                line_order[line_key] = len(line_order)
+                sorted_keys.insert(pos, line_key)
                 lines[line_key] = []
             lines[line_key].append(i)
-        
+
+        spaced = list(elements)
+
         # For each line, sort by X and ensure minimum spacing
         for line_y, indices in lines.items():
             if len(indices) < 2:
                 continue
-            
+
             # Sort indices by X position
             indices.sort(key=lambda i: elements[i].get("x", 0))
-            
-            # Calculate cumulative shift needed
+
+            # Total shift applied to the words placed so far; every shift also
+            # moves all later words on the line, so it is added to each word
+            # as it is reached
             cumulative_shift = 0
-            
+
             for j in range(1, len(indices)):
-                prev_idx = indices[j - 1]
-                curr_idx = indices[j]
-                
-                prev_elem = elements[prev_idx]
-                curr_elem = elements[curr_idx]
-                
+                prev_elem = spaced[indices[j - 1]]
+                curr_elem = spaced[indices[j]]
+
                 prev_x = prev_elem.get("x", 0) + cumulative_shift
                 prev_w = prev_elem.get("width", 50)
                 prev_font = prev_elem.get("fontSize", 12)
-                
+
                 curr_x = curr_elem.get("x", 0)
+                curr_w = curr_elem.get("width", 50)
                 curr_font = curr_elem.get("fontSize", 12)
-                
+                # Clamp to page bounds
+                max_x = page_width - curr_w - 2
+                if cumulative_shift:
+                    curr_x = min(curr_x + cumulative_shift, max_x)
+
                 # Minimum space between words (based on average font size)
                 avg_font = (prev_font + curr_font) / 2
                 min_space = avg_font * 0.4  # ~40% of font size as word gap
                 min_space = max(min_space, 4)  # At least 4 units
-                
+
                 # Current gap between words
                 current_gap = curr_x - (prev_x + prev_w)
-                
+
                 # If gap is too small, shift this and all subsequent words on this line
                 if current_gap < min_space:
                     shift_needed = min_space - current_gap
                     cumulative_shift += shift_needed
-                    
-                    # Apply shift to current and all subsequent elements on this line
-                    for k in range(j, len(indices)):
-                        idx = indices[k]
-                        old_x = elements[idx].get("x", 0)
-                        new_x = old_x + shift_needed
-                        # Clamp to page bounds
-                        elem_w = elements[idx].get("width", 50)
-                        new_x = min(new_x, page_width - elem_w - 2)
-                        elements[idx]["x"] = new_x
-        
-        return elements
+                    curr_x = min(curr_x + shift_needed, max_x)
+
+                if cumulative_shift:
+                    spaced[indices[j]] = {**curr_elem, "x": curr_x}
+
+        return spaced
 
     def get_page_json(self, job_id: str, page_number: int) -> Dict[str, Any]:
         """Get single page JSON - not implemented for local client.
@@ -714,3 +1163,57 @@ class LocalStirlingClient:
             "Lazy loading not supported in local client. "
             "Use pdf_to_json with lazy_load=False instead."
         )
+
+
+def _iter_page_range(
+    pdf_path: Path, start: int = 0, end: int | None = None, engine: str = "pdfplumber"
+) -> Iterator[Dict[str, Any]]:
+    """Yield page dicts for pages [start, end) of a PDF, one at a time.
+
+    Each page's parser caches are released once its dict has been built, so
+    memory stays flat regardless of page count.
+
+    Args:
+        pdf_path: Path to input PDF
+        start: First page index (0-based, inclusive)
+        end: Last page index (0-based, exclusive); None for all remaining pages
+        engine: "pdfplumber" or "pymupdf"
+
+    Yields:
+        Page dicts
+    """
+    if engine == "pymupdf":
+        import fitz
+
+        with fitz.open(pdf_path) as doc:
+            stop = len(doc) if end is None else end
+            for index in range(start, stop):
+                yield LocalStirlingClient._fitz_page_to_json(doc[index], index + 1)
+        return
+
+    import pdfplumber
+
+    with pdfplumber.open(pdf_path) as pdf:
+        stop = len(pdf.pages) if end is None else end
+        for index in range(start, stop):
+            page = pdf.pages[index]
+            page_json = LocalStirlingClient._page_to_json(page, index + 1)
+            page.close()
+            yield page_json
+
+
+def _extract_page_range(
+    pdf_path: Path, start: int, end: int | None, engine: str = "pdfplumber"
+) -> list:
+    """Process pool task: extract pages [start, end) of a PDF.
+
+    Args:
+        pdf_path: Path to input PDF
+        start: First page index (0-based, inclusive)
+        end: Last page index (0-based, exclusive); None for all remaining pages
+        engine: "pdfplumber" or "pymupdf"
+
+    Returns:
+        List of page dicts
+    """
+    return list(_iter_page_range(pdf_path, start, end, engine))
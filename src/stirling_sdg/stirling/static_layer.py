@@ -0,0 +1,154 @@
+"""Static-layer rendering for JSON reconstruction.
+
+Most of a reconstructed page never changes between variations: rects, lines,
+curves and all non-variable text. A StaticLayer renders that content once into
+a base PDF and records where each variable text element goes. Rendering a
+variation then opens the base PDF from memory and overlays only the variable
+text, so per-variation cost scales with the number of variable fields rather
+than with page complexity.
+
+The overlay is drawn at the same baseline, font and size json_to_pdf() would
+use, so the output matches json_to_pdf() without collision resolution or word
+spacing (which depend on every element and cannot be split into layers).
+"""
+
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+import fitz  # pymupdf
+
+from ..json_editor.editor import JSONEditor
+from ..utils.exceptions import StirlingAPIError
+from ..utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# reportlab standard font name -> PyMuPDF base-14 font code
+BASE14_FONTS = {
+    "Helvetica": "helv",
+    "Helvetica-Bold": "hebo",
+    "Helvetica-Oblique": "heit",
+    "Helvetica-BoldOblique": "hebi",
+    "Times-Roman": "tiro",
+    "Times-Bold": "tibo",
+    "Times-Italic": "tiit",
+    "Times-BoldItalic": "tibi",
+    "Courier": "cour",
+    "Courier-Bold": "cobo",
+    "Courier-Oblique": "coit",
+    "Courier-BoldOblique": "cobi",
+    "Symbol": "symb",
+    "ZapfDingbats": "zadb",
+}
+
+
+class StaticLayer:
+    """Pre-rendered static content of a document plus its variable text slots."""
+
+    def __init__(self, base_pdf: bytes, slots: List[Dict[str, Any]]):
+        """Initialize static layer.
+
+        Args:
+            base_pdf: PDF bytes with everything except the variable text
+            slots: Variable text positions (see build())
+        """
+        self.base_pdf = base_pdf
+        self.slots = slots
+
+    @classmethod
+    def build(
+        cls, client: Any, pdf_json: Dict[str, Any], template: Dict[str, Any]
+    ) -> "StaticLayer":
+        """Render the static content of pdf_json once.
+
+        Args:
+            client: LocalStirlingClient used to render the base PDF
+            pdf_json: Original PDF JSON
+            template: reconstruction template with variable_fields
+
+        Returns:
+            StaticLayer for rendering variations of this document
+        """
+        pages = pdf_json.get("pages", [])
+        located = JSONEditor.locate_fields(pdf_json, template)
+        variable = {(page_index, elem_index) for page_index, elem_index, _ in located}
+
+        slots = []
+        for page_index, elem_index, field in located:
+            elem = pages[page_index]["textElements"][elem_index]
+            slots.append({
+                "page": page_index,
+                "field_type": field.get("fieldType"),
+                "text": elem.get("text", ""),
+                # json_to_pdf draws at reportlab y = page_h - y - height;
+                # in top-left coordinates that baseline is y + height
+                "point": [elem.get("x", 0), elem.get("y", 0) + elem.get("height", 12)],
+                "size": elem.get("fontSize", 12),
+                "font": BASE14_FONTS.get(
+                    client._get_safe_font(elem.get("fontName", "Helvetica")), "helv"
+                ),
+            })
+
+        base_json = {
+            **pdf_json,
+            "pages": [
+                {
+                    **page,
+                    "textElements": [
+                        elem
+                        for elem_index, elem in enumerate(page.get("textElements", []))
+                        if (page_index, elem_index) not in variable
+                    ],
+                }
+                for page_index, page in enumerate(pages)
+            ],
+        }
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            base_path = client.json_to_pdf(base_json, Path(tmp_dir) / "static_layer.pdf")
+            base_pdf = base_path.read_bytes()
+
+        logger.info(
+            f"Static layer built: {len(pages)} pages, {len(slots)} variable text slots"
+        )
+        return cls(base_pdf, slots)
+
+    def render(self, synthetic_data: Dict[str, Any], output_path: Path) -> Path:
+        """Render one variation by overlaying variable text on the static layer.
+
+        Args:
+            synthetic_data: Dict mapping field_type to synthetic value
+            output_path: Path for output PDF
+
+        Returns:
+            Path to generated PDF
+
+        Raises:
+            StirlingAPIError: If rendering fails
+        """
+        try:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            with fitz.open(stream=self.base_pdf, filetype="pdf") as doc:
+                for slot in self.slots:
+                    value = synthetic_data.get(slot["field_type"])
+                    # Like replace_text: fields without a value keep their text
+                    text = slot["text"] if value is None else str(value)
+                    if not text:
+                        continue
+
+                    doc[slot["page"]].insert_text(
+                        fitz.Point(slot["point"]),
+                        text,
+                        fontsize=slot["size"],
+                        fontname=slot["font"],
+                    )
+
+                doc.save(str(output_path), garbage=1, deflate=True)
+
+            return output_path
+
+        except Exception as e:
+            logger.error(f"Static layer rendering failed: {e}")
+            raise StirlingAPIError(f"Static layer rendering failed: {e}") from e
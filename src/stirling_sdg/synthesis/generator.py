@@ -1,13 +1,17 @@
 """Synthetic data generator."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List
 
-from ..config.settings import Settings
+from ..config.settings import Settings, get_settings
 from .github_models_client import GitHubModelsClient
+from ..utils.exceptions import SynthesisError
 from ..utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Give up on batched generation after this many requests in a row yield nothing
+MAX_CONSECUTIVE_FAILURES = 3
+
 
 class SyntheticDataGenerator:
     """Generates coherent synthetic data for variable fields."""
@@ -19,7 +23,7 @@ class SyntheticDataGenerator:
             settings: Application settings (loads from env if not provided)
         """
         if settings is None:
-            settings = Settings()
+            settings = get_settings()
 
         self.settings = settings
         self.github_client = GitHubModelsClient(settings)
@@ -57,3 +61,64 @@ class SyntheticDataGenerator:
         )
 
         return synthetic_data
+
+    def iter_generate(self, template: Dict[str, Any], count: int) -> Iterator[Dict[str, Any]]:
+        """Yield synthetic datasets for a batch, several per LLM request.
+
+        Records are requested in chunks sized by
+        GitHubModelsClient.records_per_request, so N variations need roughly
+        N / K round trips instead of N.
+
+        Args:
+            template: Classification result with variable_fields
+            count: Number of datasets to produce
+
+        Yields:
+            Dicts mapping field_type to synthetic value
+
+        Raises:
+            SynthesisError: If MAX_CONSECUTIVE_FAILURES requests in a row fail
+                or return no valid records
+        """
+        field_types = set(field["fieldType"] for field in template.get("variable_fields", []))
+        per_request = self.github_client.records_per_request(len(field_types))
+        logger.info(
+            f"Generating {count} synthetic datasets, {per_request} per request "
+            f"({len(field_types)} field types)"
+        )
+
+        produced = 0
+        failures = 0
+        while produced < count:
+            requested = min(per_request, count - produced)
+            try:
+                records = self.github_client.generate_synthetic_data_batch(template, requested)
+            except SynthesisError as e:
+                logger.error(f"Batched synthesis request failed: {e}")
+                records = []
+
+            if not records:
+                failures += 1
+                if failures >= MAX_CONSECUTIVE_FAILURES:
+                    raise SynthesisError(
+                        f"Batched synthesis failed {failures} times in a row "
+                        f"after {produced}/{count} datasets"
+                    )
+                continue
+
+            failures = 0
+            for record in records[: count - produced]:
+                produced += 1
+                yield record
+
+    def generate_batch(self, template: Dict[str, Any], count: int) -> List[Dict[str, Any]]:
+        """Generate synthetic data for count variations of a template.
+
+        Args:
+            template: Classification result with variable_fields
+            count: Number of datasets to produce
+
+        Returns:
+            List of dicts mapping field_type to synthetic value
+        """
+        return list(self.iter_generate(template, count))
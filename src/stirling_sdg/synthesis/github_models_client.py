@@ -1,24 +1,61 @@
 """GitHub Models LLM client with token-efficient classification."""
 
+import asyncio
 import json
 import os
+import threading
 import time
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, TypeVar
 
-from openai import OpenAI, RateLimitError
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI, RateLimitError
 
-from ..config.settings import Settings
+from ..config.settings import Settings, get_settings
+from .response_cache import ResponseCache
 from ..utils.exceptions import LLMError, ClassificationError, SynthesisError
 from ..utils.logging_utils import get_logger
+from ..utils.metrics import (
+    LLM_CACHE_HITS,
+    LLM_RATE_LIMITED,
+    LLM_REQUEST_SECONDS,
+    LLM_REQUESTS,
+    LLM_RETRIES,
+    LLM_TOKENS,
+    RATE_LIMIT_SLEEP_SECONDS,
+)
+from ..utils.timing import record_tokens
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 # Header detection threshold
 HEADER_THRESHOLD = 18  # fontSize above this is considered a header
 
+# Batched synthesis sizing: rough completion tokens per generated field value
+# (key, value and JSON punctuation) and per response for the wrapper object
+SYNTHESIS_TOKENS_PER_FIELD = 20
+SYNTHESIS_RESPONSE_OVERHEAD_TOKENS = 20
+MAX_RECORDS_PER_REQUEST = 25
+
+SYNTHESIS_SYSTEM_PROMPT = """You are an expert at generating realistic synthetic data for forms and documents.
+
+Generate diverse, realistic data that:
+- Is internally consistent (age matches date_of_birth, etc.)
+- Uses diverse names, ethnicities, and demographics
+- Follows proper formats (phone: (XXX) XXX-XXXX, dates: MM/DD/YYYY)
+- Is HIPAA-compliant and realistic
+- Maintains logical relationships between fields
+
+Return ONLY valid JSON with no additional text."""
+
 
 class RateLimiter:
-    """Simple rate limiter for API calls."""
+    """Simple rate limiter for API calls (safe to share between threads).
+
+    A caller reserves the next free slot in the sliding window under the lock
+    and sleeps until it after releasing the lock, so waiting callers do not
+    hold up each other's bookkeeping.
+    """
 
     def __init__(self, max_calls: int = 50, period: int = 60):
         """Initialize rate limiter.
@@ -30,26 +67,72 @@ class RateLimiter:
         self.max_calls = max_calls
         self.period = period
         self.calls: List[float] = []
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Claim the next call slot.
+
+        Returns:
+            Seconds to wait before making the call
+        """
+        with self._lock:
+            now = time.time()
+
+            # Remove old calls outside the period (reserved slots may lie ahead)
+            self.calls = [t for t in self.calls if now - t < self.period]
+
+            start = now
+            if len(self.calls) >= self.max_calls:
+                # Free once the max_calls-th most recent call leaves the window
+                start = max(now, self.calls[-self.max_calls] + self.period, self.calls[-1])
+
+            # Record this call
+            self.calls.append(start)
+            return start - now
 
     def wait_if_needed(self):
         """Wait if rate limit would be exceeded."""
-        now = time.time()
+        sleep_time = self.reserve()
+        if sleep_time > 0:
+            logger.info(f"Rate limit reached, waiting {sleep_time:.1f}s")
+            time.sleep(sleep_time)
+            RATE_LIMIT_SLEEP_SECONDS.inc(sleep_time)
+
+
+class AsyncRateLimiter(RateLimiter):
+    """Rate limiter for API calls made from asyncio tasks.
+
+    Same sliding window as RateLimiter, but waits with asyncio.sleep, so
+    concurrent tasks share one budget without blocking the event loop.
+    """
+
+    async def wait_if_needed(self):
+        """Wait if rate limit would be exceeded."""
+        sleep_time = self.reserve()
+        if sleep_time > 0:
+            logger.info(f"Rate limit reached, waiting {sleep_time:.1f}s")
+            await asyncio.sleep(sleep_time)
+            RATE_LIMIT_SLEEP_SECONDS.inc(sleep_time)
 
-        # Remove old calls outside the period
-        self.calls = [t for t in self.calls if now - t < self.period]
 
-        if len(self.calls) >= self.max_calls:
-            # Calculate wait time
-            oldest_call = self.calls[0]
-            sleep_time = self.period - (now - oldest_call)
-            if sleep_time > 0:
-                logger.info(f"Rate limit reached, waiting {sleep_time:.1f}s")
-                time.sleep(sleep_time)
-                # Remove the oldest call after waiting
-                self.calls.pop(0)
+def _count_http_request(request) -> None:
+    """httpx request hook: count retries made inside the OpenAI SDK."""
+    if request.headers.get("x-stainless-retry-count", "0") != "0":
+        LLM_RETRIES.inc(reason="sdk")
 
-        # Record this call
-        self.calls.append(time.time())
+
+def _count_http_response(response) -> None:
+    """httpx response hook: count 429s, including ones the OpenAI SDK retries itself."""
+    if response.status_code == 429:
+        LLM_RATE_LIMITED.inc()
+
+
+async def _acount_http_request(request) -> None:
+    _count_http_request(request)
+
+
+async def _acount_http_response(response) -> None:
+    _count_http_response(response)
 
 
 class GitHubModelsClient:
@@ -62,14 +145,83 @@ class GitHubModelsClient:
             settings: Application settings (loads from env if not provided)
         """
         if settings is None:
-            settings = Settings()
+            settings = get_settings()
 
         self.settings = settings
         self.client = OpenAI(
-            base_url="https://models.github.ai/inference",
+            base_url=settings.llm_base_url,
             api_key=settings.github_token,
+            http_client=DefaultHttpxClient(
+                event_hooks={"request": [_count_http_request], "response": [_count_http_response]}
+            ),
+        )
+        self.rate_limiter = RateLimiter(
+            max_calls=settings.llm_rate_limit_calls,
+            period=settings.llm_rate_limit_period,
+        )
+        self.response_cache = ResponseCache(
+            settings.cache_dir / "llm_responses",
+            max_bytes=settings.llm_cache_max_mb * 1024 * 1024,
+            enabled=settings.llm_cache_enabled,
         )
-        self.rate_limiter = RateLimiter(max_calls=50, period=60)
+
+        # Async client state per event loop; see _async_state(). Loops are held
+        # until swept, so finished loops' clients get closed rather than dropped
+        self._async_states: Dict[asyncio.AbstractEventLoop, tuple] = {}
+        self._async_states_lock = threading.Lock()
+
+    async def _async_state(self) -> tuple[AsyncOpenAI, asyncio.Semaphore, AsyncRateLimiter]:
+        """Get the async client, concurrency semaphore and limiter for the running loop.
+
+        asyncio primitives and the async HTTP connection pool belong to the
+        loop that created them, so every event loop gets its own (e.g. each
+        asyncio.run(), or loops running in several threads at once). Clients
+        of loops that have finished are closed when a new loop's state is
+        created; a client in use by a running loop is never touched.
+        """
+        loop = asyncio.get_running_loop()
+        finished = []
+        with self._async_states_lock:
+            state = self._async_states.get(loop)
+            if state is None:
+                for other, other_state in list(self._async_states.items()):
+                    if other.is_closed():
+                        del self._async_states[other]
+                        finished.append(other_state[0])
+
+                client = AsyncOpenAI(
+                    base_url=self.settings.llm_base_url,
+                    api_key=self.settings.github_token,
+                    http_client=DefaultAsyncHttpxClient(
+                        event_hooks={
+                            "request": [_acount_http_request],
+                            "response": [_acount_http_response],
+                        }
+                    ),
+                )
+                state = (
+                    client,
+                    asyncio.Semaphore(self.settings.llm_max_concurrency),
+                    AsyncRateLimiter(
+                        max_calls=self.settings.llm_rate_limit_calls,
+                        period=self.settings.llm_rate_limit_period,
+                    ),
+                )
+                self._async_states[loop] = state
+
+        for client in finished:
+            await self._close_async_client(client)
+        return state
+
+    @staticmethod
+    async def _close_async_client(client: AsyncOpenAI) -> None:
+        """Close the async client of an event loop that has finished."""
+        try:
+            await client.close()
+        except Exception as e:
+            # Connections of a closed loop cannot always be shut down cleanly;
+            # the pool is released either way
+            logger.debug(f"Closing previous async LLM client: {e}")
 
     def chat_completion(
         self,
@@ -81,6 +233,8 @@ class GitHubModelsClient:
     ) -> str:
         """Make a chat completion request with rate limiting and retries.
 
+        Responses are not cached here; see _cached_completion().
+
         Args:
             messages: List of message dicts with 'role' and 'content'
             temperature: Sampling temperature (0-2)
@@ -107,54 +261,238 @@ class GitHubModelsClient:
                 self.rate_limiter.wait_if_needed()
 
                 # Make request
-                kwargs = {
-                    "model": self.settings.github_model,
-                    "messages": messages,
-                    "temperature": temperature,
-                    "max_tokens": max_tokens,
-                }
-
-                if response_format:
-                    kwargs["response_format"] = response_format
+                kwargs = self._request_kwargs(messages, temperature, max_tokens, response_format)
 
                 logger.debug(f"Sending request to GitHub Models API (attempt {attempt + 1}/{max_retries})")
+                started = time.perf_counter()
                 response = self.client.chat.completions.create(**kwargs)
+                LLM_REQUEST_SECONDS.observe(time.perf_counter() - started, mode="sync")
+                LLM_REQUESTS.inc(mode="sync", outcome="ok")
 
-                content = response.choices[0].message.content
+                return self._response_content(response)
 
-                # Log token usage if available
-                if hasattr(response, 'usage') and response.usage:
-                    logger.info(
-                        f"LLM request complete - Tokens: {response.usage.total_tokens} total "
-                        f"({response.usage.prompt_tokens} prompt + {response.usage.completion_tokens} completion), "
-                        f"Response: {len(content)} chars"
+            except RateLimitError:
+                LLM_REQUESTS.inc(mode="sync", outcome="rate_limited")
+                # Exponential backoff: 10s, 20s, 40s with the default base delay
+                wait_time = 2 ** attempt * self.settings.llm_retry_base_delay
+                logger.warning(
+                    f"Rate limit hit (attempt {attempt + 1}/{max_retries}), "
+                    f"waiting {wait_time}s"
+                )
+                if attempt < max_retries - 1:
+                    LLM_RETRIES.inc(reason="rate_limited")
+                    time.sleep(wait_time)
+                    continue
+                raise LLMError("Rate limit exceeded after retries")
+
+            except Exception as e:
+                LLM_REQUESTS.inc(mode="sync", outcome="error")
+                logger.error(f"LLM error (attempt {attempt + 1}/{max_retries}): {e}")
+                if attempt < max_retries - 1:
+                    LLM_RETRIES.inc(reason="error")
+                    time.sleep(2**attempt)
+                    continue
+                raise LLMError(f"LLM request failed: {e}") from e
+
+        raise LLMError("Max retries exceeded")
+
+    async def achat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+        response_format: Dict[str, str] | None = None,
+        max_retries: int = 3,
+    ) -> str:
+        """Async chat completion with bounded concurrency, rate limiting and retries.
+
+        At most settings.llm_max_concurrency requests are in flight at once;
+        the concurrency slot is released while backing off. Responses are not
+        cached here; see _acached_completion().
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Sampling temperature (0-2)
+            max_tokens: Maximum tokens in response
+            response_format: Optional response format (e.g., {"type": "json_object"})
+            max_retries: Maximum retry attempts
+
+        Returns:
+            Response content as string
+
+        Raises:
+            LLMError: If request fails after retries
+        """
+        client, semaphore, rate_limiter = await self._async_state()
+        kwargs = self._request_kwargs(messages, temperature, max_tokens, response_format)
+
+        for attempt in range(max_retries):
+            try:
+                async with semaphore:
+                    await rate_limiter.wait_if_needed()
+                    logger.debug(
+                        f"Sending async request to GitHub Models API "
+                        f"(attempt {attempt + 1}/{max_retries})"
                     )
-                else:
-                    logger.info(f"LLM request complete - Response: {len(content)} chars")
+                    started = time.perf_counter()
+                    response = await client.chat.completions.create(**kwargs)
+                    LLM_REQUEST_SECONDS.observe(time.perf_counter() - started, mode="async")
+                    LLM_REQUESTS.inc(mode="async", outcome="ok")
 
-                logger.debug(f"LLM response preview: {content[:100]}...")
-                return content
+                return self._response_content(response)
 
             except RateLimitError:
-                wait_time = 2 ** attempt * 10  # Exponential backoff: 10s, 20s, 40s
+                LLM_REQUESTS.inc(mode="async", outcome="rate_limited")
+                # Exponential backoff: 10s, 20s, 40s with the default base delay
+                wait_time = 2 ** attempt * self.settings.llm_retry_base_delay
                 logger.warning(
                     f"Rate limit hit (attempt {attempt + 1}/{max_retries}), "
                     f"waiting {wait_time}s"
                 )
                 if attempt < max_retries - 1:
-                    time.sleep(wait_time)
+                    LLM_RETRIES.inc(reason="rate_limited")
+                    await asyncio.sleep(wait_time)
                     continue
                 raise LLMError("Rate limit exceeded after retries")
 
             except Exception as e:
+                LLM_REQUESTS.inc(mode="async", outcome="error")
                 logger.error(f"LLM error (attempt {attempt + 1}/{max_retries}): {e}")
                 if attempt < max_retries - 1:
-                    time.sleep(2**attempt)
+                    LLM_RETRIES.inc(reason="error")
+                    await asyncio.sleep(2**attempt)
                     continue
                 raise LLMError(f"LLM request failed: {e}") from e
 
         raise LLMError("Max retries exceeded")
 
+    def _cache_key(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        response_format: Dict[str, str] | None,
+    ) -> str:
+        """Compute the response cache key for a request."""
+        return ResponseCache.make_key(
+            self.settings.github_model,
+            messages,
+            temperature,
+            response_format,
+            base_url=self.settings.llm_base_url,
+            max_tokens=max_tokens,
+        )
+
+    def _cached_completion(
+        self,
+        parse: Callable[[str], T],
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        response_format: Dict[str, str] | None,
+        max_retries: int,
+    ) -> T:
+        """Chat completion served from the response cache, parsed by the caller.
+
+        A fresh response is stored only after parse() accepted it, so a
+        truncated or malformed response is not served to later runs.
+
+        Args:
+            parse: Turns response content into the caller's result; raises if
+                the content is unusable
+            messages, temperature, max_tokens, response_format, max_retries:
+                As for chat_completion()
+
+        Returns:
+            parse(content)
+        """
+        cache_key = self._cache_key(messages, temperature, max_tokens, response_format)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"LLM response served from cache ({len(cached)} chars)")
+            LLM_CACHE_HITS.inc()
+            return parse(cached)
+
+        content = self.chat_completion(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            response_format=response_format,
+            max_retries=max_retries,
+        )
+        result = parse(content)
+        self.response_cache.put(cache_key, content)
+        return result
+
+    async def _acached_completion(
+        self,
+        parse: Callable[[str], T],
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        response_format: Dict[str, str] | None,
+        max_retries: int,
+    ) -> T:
+        """Async version of _cached_completion (cache I/O runs off the event loop)."""
+        cache_key = self._cache_key(messages, temperature, max_tokens, response_format)
+        cached = await asyncio.to_thread(self.response_cache.get, cache_key)
+        if cached is not None:
+            logger.info(f"LLM response served from cache ({len(cached)} chars)")
+            LLM_CACHE_HITS.inc()
+            return parse(cached)
+
+        content = await self.achat_completion(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            response_format=response_format,
+            max_retries=max_retries,
+        )
+        result = parse(content)
+        await asyncio.to_thread(self.response_cache.put, cache_key, content)
+        return result
+
+    def _request_kwargs(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        response_format: Dict[str, str] | None,
+    ) -> Dict[str, Any]:
+        """Build chat completion request arguments."""
+        kwargs = {
+            "model": self.settings.github_model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+
+        if response_format:
+            kwargs["response_format"] = response_format
+
+        return kwargs
+
+    def _response_content(self, response: Any) -> str:
+        """Extract content from a chat completion response and log token usage."""
+        content = response.choices[0].message.content
+
+        # Log token usage if available
+        if hasattr(response, 'usage') and response.usage:
+            # Attribute tokens to the active pipeline span (see utils.timing)
+            record_tokens(response.usage.prompt_tokens, response.usage.completion_tokens)
+            LLM_TOKENS.inc(response.usage.prompt_tokens or 0, kind="prompt")
+            LLM_TOKENS.inc(response.usage.completion_tokens or 0, kind="completion")
+            logger.info(
+                f"LLM request complete - Tokens: {response.usage.total_tokens} total "
+                f"({response.usage.prompt_tokens} prompt + {response.usage.completion_tokens} completion), "
+                f"Response: {len(content)} chars"
+            )
+        else:
+            logger.info(f"LLM request complete - Response: {len(content)} chars")
+
+        logger.debug(f"LLM response preview: {content[:100]}...")
+        return content
+
     def classify_content(
         self, pdf_json: Dict[str, Any], max_retries: int = 3
     ) -> Dict[str, Any]:
@@ -171,7 +509,253 @@ class GitHubModelsClient:
             ClassificationError: If classification fails
         """
         logger.info("Starting PDF content classification (text-only, token-efficient)...")
+        messages, simplified_json, headers_excluded = self._build_classification_messages(
+            pdf_json
+        )
+
+        def parse(content: str) -> Dict[str, Any]:
+            return self._parse_classification_response(
+                content, simplified_json, headers_excluded
+            )
+
+        try:
+            return self._cached_completion(
+                parse,
+                messages=messages,
+                temperature=self.settings.classification_temperature,
+                max_tokens=self.settings.max_tokens_classification,
+                response_format={"type": "json_object"},
+                max_retries=max_retries,
+            )
+        except ClassificationError:
+            raise
+        except LLMError as e:
+            raise ClassificationError(f"Classification failed: {e}") from e
+
+    def generate_synthetic_data(
+        self, template: Dict[str, Any], max_retries: int = 3
+    ) -> Dict[str, Any]:
+        """Generate synthetic data for all variable fields.
+
+        Args:
+            template: Classification result with variable_fields
+            max_retries: Maximum retry attempts
+
+        Returns:
+            Dict mapping field_type to synthetic value
+
+        Raises:
+            SynthesisError: If generation fails
+        """
+        messages = self._build_synthesis_messages(template)
+        if messages is None:
+            logger.warning("No variable fields to generate data for")
+            return {}
+
+        try:
+            response_content = self.chat_completion(
+                messages=messages,
+                temperature=self.settings.synthesis_temperature,
+                max_tokens=self.settings.max_tokens_synthesis,
+                response_format={"type": "json_object"},
+                max_retries=max_retries,
+            )
+        except LLMError as e:
+            raise SynthesisError(f"Synthesis failed: {e}") from e
+
+        return self._parse_synthesis_response(response_content)
+
+    def records_per_request(self, num_field_types: int) -> int:
+        """Number of records to request per batched synthesis call.
+
+        Sized so that K records of num_field_types values fit in
+        max_tokens_synthesis completion tokens.
+
+        Args:
+            num_field_types: Number of unique field types per record
+
+        Returns:
+            Records per request (at least 1, at most MAX_RECORDS_PER_REQUEST)
+        """
+        budget = self.settings.max_tokens_synthesis - SYNTHESIS_RESPONSE_OVERHEAD_TOKENS
+        per_record = max(num_field_types, 1) * SYNTHESIS_TOKENS_PER_FIELD
+        return max(1, min(MAX_RECORDS_PER_REQUEST, budget // per_record))
+
+    def generate_synthetic_data_batch(
+        self, template: Dict[str, Any], count: int, max_retries: int = 3
+    ) -> List[Dict[str, Any]]:
+        """Generate several independent synthetic records in one LLM request.
+
+        Args:
+            template: Classification result with variable_fields
+            count: Number of records to request
+            max_retries: Maximum retry attempts
+
+        Returns:
+            List of valid records, each mapping field_type to synthetic value.
+            Records missing field types are dropped, so the list may be shorter
+            than count.
+
+        Raises:
+            SynthesisError: If generation fails
+        """
+        built = self._build_synthesis_batch_messages(template, count)
+        if built is None:
+            logger.warning("No variable fields to generate data for")
+            return [{} for _ in range(count)]
+        messages, field_types = built
+
+        try:
+            response_content = self.chat_completion(
+                messages=messages,
+                temperature=self.settings.synthesis_temperature,
+                max_tokens=self.settings.max_tokens_synthesis,
+                response_format={"type": "json_object"},
+                max_retries=max_retries,
+            )
+        except LLMError as e:
+            raise SynthesisError(f"Batched synthesis failed: {e}") from e
+
+        return self._parse_synthesis_batch_response(response_content, field_types, count)
+
+    async def aclassify_content(
+        self, pdf_json: Dict[str, Any], max_retries: int = 3
+    ) -> Dict[str, Any]:
+        """Async version of classify_content.
+
+        Args:
+            pdf_json: JSON structure from Stirling PDF
+            max_retries: Maximum retry attempts
+
+        Returns:
+            Classification result with variable_fields list
+
+        Raises:
+            ClassificationError: If classification fails
+        """
+        logger.info("Starting async PDF content classification...")
+        messages, simplified_json, headers_excluded = self._build_classification_messages(
+            pdf_json
+        )
+
+        def parse(content: str) -> Dict[str, Any]:
+            return self._parse_classification_response(
+                content, simplified_json, headers_excluded
+            )
+
+        try:
+            return await self._acached_completion(
+                parse,
+                messages=messages,
+                temperature=self.settings.classification_temperature,
+                max_tokens=self.settings.max_tokens_classification,
+                response_format={"type": "json_object"},
+                max_retries=max_retries,
+            )
+        except ClassificationError:
+            raise
+        except LLMError as e:
+            raise ClassificationError(f"Classification failed: {e}") from e
+
+    async def agenerate_synthetic_data(
+        self, template: Dict[str, Any], max_retries: int = 3
+    ) -> Dict[str, Any]:
+        """Async version of generate_synthetic_data.
 
+        Args:
+            template: Classification result with variable_fields
+            max_retries: Maximum retry attempts
+
+        Returns:
+            Dict mapping field_type to synthetic value
+
+        Raises:
+            SynthesisError: If generation fails
+        """
+        messages = self._build_synthesis_messages(template)
+        if messages is None:
+            logger.warning("No variable fields to generate data for")
+            return {}
+
+        try:
+            response_content = await self.achat_completion(
+                messages=messages,
+                temperature=self.settings.synthesis_temperature,
+                max_tokens=self.settings.max_tokens_synthesis,
+                response_format={"type": "json_object"},
+                max_retries=max_retries,
+            )
+        except LLMError as e:
+            raise SynthesisError(f"Synthesis failed: {e}") from e
+
+        return self._parse_synthesis_response(response_content)
+
+    async def agenerate_synthetic_data_batch(
+        self, template: Dict[str, Any], count: int, max_retries: int = 3
+    ) -> List[Dict[str, Any]]:
+        """Async version of generate_synthetic_data_batch.
+
+        Args:
+            template: Classification result with variable_fields
+            count: Number of records to request
+            max_retries: Maximum retry attempts
+
+        Returns:
+            List of valid records (may be shorter than count)
+
+        Raises:
+            SynthesisError: If generation fails
+        """
+        built = self._build_synthesis_batch_messages(template, count)
+        if built is None:
+            logger.warning("No variable fields to generate data for")
+            return [{} for _ in range(count)]
+        messages, field_types = built
+
+        try:
+            response_content = await self.achat_completion(
+                messages=messages,
+                temperature=self.settings.synthesis_temperature,
+                max_tokens=self.settings.max_tokens_synthesis,
+                response_format={"type": "json_object"},
+                max_retries=max_retries,
+            )
+        except LLMError as e:
+            raise SynthesisError(f"Batched synthesis failed: {e}") from e
+
+        return self._parse_synthesis_batch_response(response_content, field_types, count)
+
+    def _is_valid_record(self, record: Any, field_types: List[str]) -> bool:
+        """Check that a synthetic record has a usable value for every field type.
+
+        Args:
+            record: One record from a batched synthesis response
+            field_types: Field types the record must cover
+
+        Returns:
+            True if the record can be fed to the render loop
+        """
+        if not isinstance(record, dict):
+            return False
+
+        for field_type in field_types:
+            value = record.get(field_type)
+            if value is None or value == "" or isinstance(value, list):
+                logger.debug(f"Synthetic record missing field type '{field_type}'")
+                return False
+        return True
+
+    def _build_classification_messages(
+        self, pdf_json: Dict[str, Any]
+    ) -> tuple[List[Dict[str, str]], Dict[str, Any], int]:
+        """Build the classification prompt for a PDF JSON.
+
+        Args:
+            pdf_json: JSON structure from Stirling PDF
+
+        Returns:
+            Tuple of (messages, simplified JSON, count of headers excluded)
+        """
         # Prepare simplified JSON for LLM (text-only, no coordinates)
         logger.debug("Simplifying PDF JSON for classification")
         simplified_json, headers_excluded = self._simplify_json_for_classification(
@@ -233,68 +817,69 @@ CRITICAL: The pageNumber field is REQUIRED and must be copied from the input - n
             {"role": "user", "content": user_prompt},
         ]
 
-        try:
-            response_content = self.chat_completion(
-                messages=messages,
-                temperature=self.settings.classification_temperature,
-                max_tokens=self.settings.max_tokens_classification,
-                response_format={"type": "json_object"},
-                max_retries=max_retries,
-            )
+        return messages, simplified_json, headers_excluded
 
-            # Parse JSON response
-            logger.debug("Parsing classification response from LLM")
-            try:
-                # Sanitize response content to remove invalid escape sequences
-                logger.debug("Sanitizing JSON response")
-                response_content = self._sanitize_json_response(response_content)
-                result = json.loads(response_content)
-                variable_fields = result.get("variable_fields", [])
-
-                # Post-process: fill in missing pageNumbers by matching text
-                logger.debug("Post-processing: filling missing pageNumbers")
-                result["variable_fields"] = self._fill_missing_page_numbers(
-                    variable_fields, simplified_json
-                )
+    def _parse_classification_response(
+        self, response_content: str, simplified_json: Dict[str, Any], headers_excluded: int
+    ) -> Dict[str, Any]:
+        """Parse and post-process a classification response.
 
-                # Add headers_excluded to metadata
-                result["headers_excluded"] = headers_excluded
+        Args:
+            response_content: Raw LLM response
+            simplified_json: Simplified JSON that was sent to the LLM
+            headers_excluded: Count of headers excluded from the prompt
 
-                # Log classification result for debugging
-                logger.debug(f"Classification result (after post-processing): {json.dumps(result, indent=2)}")
+        Returns:
+            Classification result with variable_fields list
 
-                logger.info(
-                    f"Classification complete: {len(variable_fields)} variable fields found, "
-                    f"{headers_excluded} headers excluded"
-                )
-                return result
+        Raises:
+            ClassificationError: If the response is not valid JSON
+        """
+        # Parse JSON response
+        logger.debug("Parsing classification response from LLM")
+        try:
+            # Sanitize response content to remove invalid escape sequences
+            logger.debug("Sanitizing JSON response")
+            response_content = self._sanitize_json_response(response_content)
+            result = json.loads(response_content)
+            variable_fields = result.get("variable_fields", [])
+
+            # Post-process: fill in missing pageNumbers by matching text
+            logger.debug("Post-processing: filling missing pageNumbers")
+            result["variable_fields"] = self._fill_missing_page_numbers(
+                variable_fields, simplified_json
+            )
 
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON from LLM: {response_content[:200]}")
-                raise ClassificationError(f"Invalid JSON response: {e}") from e
+            # Add headers_excluded to metadata
+            result["headers_excluded"] = headers_excluded
 
-        except LLMError as e:
-            raise ClassificationError(f"Classification failed: {e}") from e
+            # Log classification result for debugging
+            logger.debug(f"Classification result (after post-processing): {json.dumps(result, indent=2)}")
 
-    def generate_synthetic_data(
-        self, template: Dict[str, Any], max_retries: int = 3
-    ) -> Dict[str, Any]:
-        """Generate synthetic data for all variable fields.
+            logger.info(
+                f"Classification complete: {len(variable_fields)} variable fields found, "
+                f"{headers_excluded} headers excluded"
+            )
+            return result
+
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON from LLM: {response_content[:200]}")
+            raise ClassificationError(f"Invalid JSON response: {e}") from e
+
+    def _build_synthesis_messages(
+        self, template: Dict[str, Any]
+    ) -> List[Dict[str, str]] | None:
+        """Build the single-record synthesis prompt for a template.
 
         Args:
             template: Classification result with variable_fields
-            max_retries: Maximum retry attempts
 
         Returns:
-            Dict mapping field_type to synthetic value
-
-        Raises:
-            SynthesisError: If generation fails
+            Messages for the LLM, or None if the template has no variable fields
         """
         variable_fields = template.get("variable_fields", [])
         if not variable_fields:
-            logger.warning("No variable fields to generate data for")
-            return {}
+            return None
 
         logger.info(f"Starting synthetic data generation for {len(variable_fields)} fields")
 
@@ -309,16 +894,7 @@ CRITICAL: The pageNumber field is REQUIRED and must be copied from the input - n
             logger.debug(f"Applying constraints: {constraint_rules}")
 
         # Construct prompt
-        system_prompt = """You are an expert at generating realistic synthetic data for forms and documents.
-
-Generate diverse, realistic data that:
-- Is internally consistent (age matches date_of_birth, etc.)
-- Uses diverse names, ethnicities, and demographics
-- Follows proper formats (phone: (XXX) XXX-XXXX, dates: MM/DD/YYYY)
-- Is HIPAA-compliant and realistic
-- Maintains logical relationships between fields
-
-Return ONLY valid JSON with no additional text."""
+        system_prompt = SYNTHESIS_SYSTEM_PROMPT
 
         user_prompt = f"""Generate realistic synthetic data for these field types:
 {json.dumps(field_types, indent=2)}
@@ -352,31 +928,128 @@ Return JSON mapping field_type to value:
             {"role": "user", "content": user_prompt},
         ]
 
+        return messages
+
+    def _parse_synthesis_response(self, response_content: str) -> Dict[str, Any]:
+        """Parse a single-record synthesis response.
+
+        Args:
+            response_content: Raw LLM response
+
+        Returns:
+            Dict mapping field_type to synthetic value
+
+        Raises:
+            SynthesisError: If the response is not valid JSON
+        """
+        # Parse JSON response
+        logger.debug("Parsing synthetic data response from LLM")
         try:
-            response_content = self.chat_completion(
-                messages=messages,
-                temperature=self.settings.synthesis_temperature,
-                max_tokens=self.settings.max_tokens_synthesis,
-                response_format={"type": "json_object"},
-                max_retries=max_retries,
+            synthetic_data = json.loads(response_content)
+            logger.info(
+                f"Synthetic data generation complete: {len(synthetic_data)} field types generated"
             )
+            logger.debug(f"Generated data preview: {list(synthetic_data.items())[:5]}")
+            return synthetic_data
 
-            # Parse JSON response
-            logger.debug("Parsing synthetic data response from LLM")
-            try:
-                synthetic_data = json.loads(response_content)
-                logger.info(
-                    f"Synthetic data generation complete: {len(synthetic_data)} field types generated"
-                )
-                logger.debug(f"Generated data preview: {list(synthetic_data.items())[:5]}")
-                return synthetic_data
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON from LLM: {response_content[:200]}")
+            raise SynthesisError(f"Invalid JSON response: {e}") from e
 
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON from LLM: {response_content[:200]}")
-                raise SynthesisError(f"Invalid JSON response: {e}") from e
+    def _build_synthesis_batch_messages(
+        self, template: Dict[str, Any], count: int
+    ) -> tuple[List[Dict[str, str]], List[str]] | None:
+        """Build the batched synthesis prompt for a template.
 
-        except LLMError as e:
-            raise SynthesisError(f"Synthesis failed: {e}") from e
+        Args:
+            template: Classification result with variable_fields
+            count: Number of records to request
+
+        Returns:
+            Tuple of (messages, sorted field types), or None if the template
+            has no variable fields
+        """
+        variable_fields = template.get("variable_fields", [])
+        if not variable_fields:
+            return None
+
+        field_types = sorted(set(field["fieldType"] for field in variable_fields))
+        logger.info(
+            f"Starting batched synthetic data generation: {count} records x "
+            f"{len(field_types)} field types"
+        )
+
+        constraint_rules = self._build_constraint_rules(field_types)
+
+        user_prompt = f"""Generate {count} independent records of realistic synthetic data.
+Each record must contain a value for every one of these field types:
+{json.dumps(field_types, indent=2)}
+
+RELATIONSHIP CONSTRAINTS (apply within each record):
+{constraint_rules}
+
+Additional constraints:
+- Records must be different people with different dates, numbers and addresses
+- If date_of_birth exists, calculate age correctly
+- Phone numbers should be valid format: (XXX) XXX-XXXX
+- Dates should be MM/DD/YYYY format
+- Names should be diverse (various ethnicities, genders)
+- Medical record numbers (mrn): use format MRN followed by 8-10 digits
+- Addresses should be complete and realistic
+- SSN format: XXX-XX-XXXX
+
+Return JSON with a "records" array of exactly {count} objects mapping field_type to value:
+{{
+  "records": [
+    {{"patient_name": "María García", "date_of_birth": "07/15/1975", "age": "49"}},
+    {{"patient_name": "Kwame Mensah", "date_of_birth": "11/02/1988", "age": "36"}}
+  ]
+}}"""
+
+        messages = [
+            {"role": "system", "content": SYNTHESIS_SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt},
+        ]
+
+        return messages, field_types
+
+    def _parse_synthesis_batch_response(
+        self, response_content: str, field_types: List[str], count: int
+    ) -> List[Dict[str, Any]]:
+        """Parse and validate a batched synthesis response.
+
+        Args:
+            response_content: Raw LLM response
+            field_types: Field types every record must cover
+            count: Number of records that were requested
+
+        Returns:
+            List of valid records (at most count)
+
+        Raises:
+            SynthesisError: If the response is not valid JSON or has no records array
+        """
+        logger.debug("Parsing batched synthetic data response from LLM")
+        try:
+            result = json.loads(response_content)
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON from LLM: {response_content[:200]}")
+            raise SynthesisError(f"Invalid JSON response: {e}") from e
+
+        records = result.get("records", []) if isinstance(result, dict) else result
+        if not isinstance(records, list):
+            raise SynthesisError("Batched synthesis response has no 'records' array")
+
+        valid = [r for r in records if self._is_valid_record(r, field_types)]
+        if len(valid) < len(records):
+            logger.warning(
+                f"Dropped {len(records) - len(valid)} incomplete synthetic records"
+            )
+
+        logger.info(
+            f"Batched synthetic data generation complete: {len(valid)}/{count} valid records"
+        )
+        return valid[:count]
 
     def _simplify_json_for_classification(
         self, pdf_json: Dict[str, Any]
@@ -384,7 +1057,8 @@ Return JSON mapping field_type to value:
         """Simplify PDF JSON for classification (text-only, no coordinates).
 
         Args:
-            pdf_json: Full PDF JSON from Stirling
+            pdf_json: Full PDF JSON from Stirling ("pages" may be any iterable
+                of page dicts; it is consumed once, page by page)
 
         Returns:
             Tuple of (simplified JSON with only text and fontSize, count of headers excluded)
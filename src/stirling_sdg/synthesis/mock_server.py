@@ -0,0 +1,407 @@
+"""Local OpenAI-compatible mock of the chat completions API.
+
+Stands in for GitHub Models in tests and load tests. It recognizes the
+classification and synthesis prompts built by GitHubModelsClient and answers
+with JSON in the shape the client parses: variable fields picked from the
+document text in the prompt, and synthetic values derived from the requested
+field types. Latency is drawn from a configurable distribution, 429 responses
+can be injected at random or by enforcing a requests-per-minute quota, and
+every response carries token usage.
+
+Point the client at it with LLM_BASE_URL=http://127.0.0.1:<port>.
+"""
+
+import json
+import math
+import random
+import re
+import string
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Tuple
+
+from ..utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+MAX_CLASSIFIED_FIELDS = 50
+
+FIRST_NAMES = ["María", "Kwame", "Aiko", "John", "Priya", "Liam", "Fatima", "Chen", "Olga", "Diego"]
+LAST_NAMES = ["García", "Mensah", "Tanaka", "Smith", "Patel", "Murphy", "Hassan", "Wei", "Ivanova", "Lopez"]
+CITIES = [("Austin", "TX", "78701"), ("Denver", "CO", "80202"), ("Seattle", "WA", "98101")]
+WORDS = ["alpha", "bravo", "delta", "echo", "harbor", "summit", "cedar", "orbit", "maple", "vista"]
+
+DATE_PATTERN = re.compile(r"\b\d{1,2}/\d{1,2}/\d{2,4}\b")
+PHONE_PATTERN = re.compile(r"\(\d{3}\)\s*\d{3}-\d{4}")
+SSN_PATTERN = re.compile(r"\b\d{3}-\d{2}-\d{4}\b")
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+\.[\w.]+")
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """Parse a latency distribution spec.
+
+    Args:
+        spec: One of "<seconds>", "fixed:<s>", "uniform:<low>,<high>",
+            "normal:<mean>,<stdev>", "lognormal:<median>,<sigma>" or
+            "exponential:<mean>"
+
+    Returns:
+        Function drawing a latency in seconds (never negative) from an RNG
+
+    Raises:
+        ValueError: If the spec is malformed
+    """
+    kind, _, args = spec.partition(":")
+    if not args:
+        kind, args = "fixed", kind
+    try:
+        params = [float(value) for value in args.split(",")]
+    except ValueError:
+        raise ValueError(f"Invalid latency spec: {spec!r}") from None
+
+    samplers = {
+        "fixed": (1, lambda rng, s: s),
+        "uniform": (2, lambda rng, low, high: rng.uniform(low, high)),
+        "normal": (2, lambda rng, mean, stdev: rng.gauss(mean, stdev)),
+        "lognormal": (2, lambda rng, median, sigma: rng.lognormvariate(math.log(median), sigma)),
+        "exponential": (1, lambda rng, mean: rng.expovariate(1 / mean) if mean > 0 else 0.0),
+    }
+    if kind not in samplers or len(params) != samplers[kind][0]:
+        raise ValueError(
+            f"Invalid latency spec: {spec!r} (expected fixed:<s>, uniform:<low>,<high>, "
+            f"normal:<mean>,<stdev>, lognormal:<median>,<sigma> or exponential:<mean>)"
+        )
+
+    sample = samplers[kind][1]
+    return lambda rng: max(0.0, sample(rng, *params))
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about 4 characters per token)."""
+    return max(1, math.ceil(len(text) / 4)) if text else 0
+
+
+class MockLLM:
+    """Chat completions behavior of the mock server (thread-safe)."""
+
+    def __init__(
+        self,
+        latency: str = "0",
+        token_latency: float = 0.0,
+        rate_limit_probability: float = 0.0,
+        rate_limit_rpm: int = 0,
+        seed: int | None = None,
+    ):
+        """Initialize mock.
+
+        Args:
+            latency: Per-request latency distribution (see parse_latency())
+            token_latency: Extra seconds per completion token
+            rate_limit_probability: Chance of answering any request with 429
+            rate_limit_rpm: Requests per minute before answering 429
+                (0 = no quota)
+            seed: Random seed for latencies, 429 injection and generated values
+        """
+        self.sample_latency = parse_latency(latency)
+        self.token_latency = token_latency
+        self.rate_limit_probability = rate_limit_probability
+        self.rate_limit_rpm = rate_limit_rpm
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window: deque = deque()
+        self.stats: Dict[str, Any] = {
+            "requests": 0,
+            "completed": 0,
+            "rate_limited": 0,
+            "errors": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "by_kind": {},
+        }
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[key] += amount
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a copy of the request counters."""
+        with self._lock:
+            return {**self.stats, "by_kind": dict(self.stats["by_kind"])}
+
+    def _rate_limited(self) -> float | None:
+        """Decide whether to reject a request; returns Retry-After seconds if so."""
+        with self._lock:
+            if self.rate_limit_probability and self._rng.random() < self.rate_limit_probability:
+                return 1.0
+
+            if self.rate_limit_rpm:
+                now = time.monotonic()
+                while self._window and now - self._window[0] >= 60:
+                    self._window.popleft()
+                if len(self._window) >= self.rate_limit_rpm:
+                    return max(0.0, 60 - (now - self._window[0]))
+                self._window.append(now)
+        return None
+
+    def complete(self, request: Dict[str, Any]) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        """Answer a chat completions request.
+
+        Args:
+            request: Decoded request body (model, messages, ...)
+
+        Returns:
+            Tuple of (HTTP status, response body, extra headers)
+        """
+        self._count("requests")
+
+        messages = request.get("messages")
+        if not isinstance(messages, list) or not messages:
+            self._count("errors")
+            return 400, _error("messages must be a non-empty list", "invalid_request_error"), {}
+
+        retry_after = self._rate_limited()
+        if retry_after is not None:
+            self._count("rate_limited")
+            return (
+                429,
+                _error("Rate limit exceeded (mock)", "rate_limit_exceeded"),
+                {"Retry-After": f"{math.ceil(retry_after)}"},
+            )
+
+        prompt = "\n".join(str(m.get("content", "")) for m in messages if isinstance(m, dict))
+        with self._lock:
+            rng = random.Random(self._rng.random())
+            latency = self.sample_latency(self._rng)
+        kind, content = self._respond(prompt, rng)
+
+        prompt_tokens = estimate_tokens(prompt)
+        completion_tokens = estimate_tokens(content)
+        time.sleep(latency + completion_tokens * self.token_latency)
+
+        with self._lock:
+            self.stats["completed"] += 1
+            self.stats["prompt_tokens"] += prompt_tokens
+            self.stats["completion_tokens"] += completion_tokens
+            self.stats["by_kind"][kind] = self.stats["by_kind"].get(kind, 0) + 1
+
+        body = {
+            "id": f"chatcmpl-mock-{rng.getrandbits(48):012x}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "mock"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+        return 200, body, {}
+
+    def _respond(self, prompt: str, rng: random.Random) -> Tuple[str, str]:
+        """Build the completion text for a prompt; returns (kind, content)."""
+        document = re.search(r"text-only\):\n([^\n]+)", prompt)
+        if document:
+            try:
+                return "classification", json.dumps(classify(json.loads(document.group(1))))
+            except ValueError:
+                pass
+
+        field_types = _field_types(prompt)
+        if field_types is not None:
+            count = re.search(r"Generate (\d+) independent records", prompt)
+            if count:
+                records = [synthesize(field_types, rng) for _ in range(int(count.group(1)))]
+                return "synthesis_batch", json.dumps({"records": records})
+            return "synthesis", json.dumps(synthesize(field_types, rng))
+
+        return "other", json.dumps({"response": "mock"})
+
+
+def _error(message: str, code: str) -> Dict[str, Any]:
+    return {"error": {"message": message, "type": code, "code": code}}
+
+
+def _field_types(prompt: str) -> List[str] | None:
+    """Extract the JSON list of field types from a synthesis prompt."""
+    match = re.search(r"field types:\s*(\[.*?\])", prompt, re.S)
+    if not match:
+        return None
+    try:
+        field_types = json.loads(match.group(1))
+    except ValueError:
+        return None
+    return [str(field_type) for field_type in field_types]
+
+
+def classify(simplified_json: Dict[str, Any]) -> Dict[str, Any]:
+    """Pick variable fields from simplified document text.
+
+    Text with digits or an email address is treated as variable; labels
+    (ending with ":") are static.
+
+    Args:
+        simplified_json: Pages of textElements as sent in the classification prompt
+
+    Returns:
+        Classification result with variable_fields
+    """
+    fields = []
+    seen: Dict[str, int] = {}
+    for page in simplified_json.get("pages", []):
+        for elem in page.get("textElements", []):
+            text = elem.get("text", "")
+            if text.endswith(":") or not (any(c.isdigit() for c in text) or "@" in text):
+                continue
+
+            if DATE_PATTERN.search(text):
+                field_type, data_type = "date", "date"
+            elif PHONE_PATTERN.search(text):
+                field_type, data_type = "phone_number", "string"
+            elif SSN_PATTERN.search(text):
+                field_type, data_type = "ssn", "string"
+            elif EMAIL_PATTERN.search(text):
+                field_type, data_type = "email", "string"
+            elif text.replace(",", "").replace(".", "").isdigit():
+                field_type, data_type = "number", "number"
+            else:
+                field_type, data_type = "identifier", "string"
+
+            seen[field_type] = seen.get(field_type, 0) + 1
+            if seen[field_type] > 1:
+                field_type = f"{field_type}_{seen[field_type]}"
+
+            fields.append({
+                "text": text,
+                "fieldType": field_type,
+                "dataType": data_type,
+                "pageNumber": elem.get("pageNumber", page.get("number", 1)),
+            })
+            if len(fields) >= MAX_CLASSIFIED_FIELDS:
+                return {"variable_fields": fields}
+
+    return {"variable_fields": fields}
+
+
+def synthesize(field_types: List[str], rng: random.Random) -> Dict[str, str]:
+    """Generate one record with a plausible value for every field type.
+
+    Args:
+        field_types: Field type names (values are chosen by keywords in the name)
+        rng: Random source
+
+    Returns:
+        Dict mapping field type to value
+    """
+    city, state, zip_code = rng.choice(CITIES)
+    year, month, day = rng.randint(1940, 2005), rng.randint(1, 12), rng.randint(1, 28)
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+
+    record = {}
+    for field_type in field_types:
+        name = field_type.lower()
+        if name == "age" or name.endswith("_age"):
+            value = str(time.localtime().tm_year - year)
+        elif "date" in name or "dob" in name:
+            value = f"{month:02d}/{day:02d}/{year}"
+        elif "phone" in name or "fax" in name:
+            value = f"({rng.randint(200, 999)}) 555-{rng.randint(0, 9999):04d}"
+        elif "ssn" in name:
+            value = f"{rng.randint(100, 899)}-{rng.randint(10, 99)}-{rng.randint(1000, 9999)}"
+        elif "mrn" in name:
+            value = f"MRN{rng.randint(10**7, 10**9 - 1)}"
+        elif "email" in name:
+            value = f"{first.lower()}.{last.lower()}@example.com"
+        elif "zip" in name:
+            value = zip_code
+        elif "state" in name:
+            value = state
+        elif "city" in name:
+            value = city
+        elif "address" in name or "street" in name:
+            value = f"{rng.randint(10, 9999)} {rng.choice(WORDS).title()} St"
+        elif "name" in name:
+            value = f"{first} {last}"
+        elif any(key in name for key in ("amount", "total", "price", "balance", "cost")):
+            value = f"${rng.uniform(5, 5000):,.2f}"
+        elif any(key in name for key in ("number", "id", "code", "identifier")):
+            value = "".join(rng.choices(string.digits, k=8))
+        else:
+            value = " ".join(rng.sample(WORDS, 2)).title()
+        record[field_type] = value
+    return record
+
+
+class MockLLMRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler for the mock (MockLLM instance is set on the server)."""
+
+    server_version = "stirling-sdg-mock-llm"
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def _send_json(self, status: int, payload: Any, headers: Dict[str, str] | None = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, _error(f"Unknown endpoint {self.path}", "not_found"))
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(request, dict):
+                raise ValueError("Request body must be a JSON object")
+        except ValueError as e:
+            self._send_json(400, _error(str(e), "invalid_request_error"))
+            return
+
+        status, body, headers = self.server.mock.complete(request)
+        self._send_json(status, body, headers)
+
+    def do_GET(self):
+        path = self.path.rstrip("/")
+        if path.endswith("/health"):
+            self._send_json(200, {"status": "ok"})
+        elif path.endswith("/stats"):
+            self._send_json(200, self.server.mock.snapshot())
+        elif path.endswith("/models"):
+            self._send_json(200, {"object": "list", "data": [{"id": "mock", "object": "model"}]})
+        else:
+            self._send_json(404, _error(f"Unknown endpoint {self.path}", "not_found"))
+
+
+def create_mock_server(
+    host: str = "127.0.0.1", port: int = 8766, **options: Any
+) -> ThreadingHTTPServer:
+    """Create a mock server (call serve_forever() to run it).
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+        **options: MockLLM options (latency, token_latency,
+            rate_limit_probability, rate_limit_rpm, seed)
+
+    Returns:
+        Server with its MockLLM as the mock attribute
+    """
+    server = ThreadingHTTPServer((host, port), MockLLMRequestHandler)
+    server.daemon_threads = True
+    server.mock = MockLLM(**options)
+    return server
@@ -0,0 +1,82 @@
+"""Disk-backed cache for LLM chat completion responses.
+
+Responses are stored one file per request under the cache directory, keyed by
+a hash of everything that determines the response: endpoint, model, messages,
+temperature, max_tokens and response_format. Storage, atomic writes and LRU eviction are
+handled by DiskCache.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List
+
+from ..utils.disk_cache import DiskCache
+
+
+class ResponseCache(DiskCache):
+    """Size-bounded LRU cache of LLM responses on disk."""
+
+    def __init__(self, cache_dir: Path, max_bytes: int = 256 * 1024 * 1024, enabled: bool = True):
+        """Initialize response cache.
+
+        Args:
+            cache_dir: Directory for cache entries (created if missing)
+            max_bytes: Maximum total size of cache entries
+            enabled: If False, get() always misses and put() is a no-op
+        """
+        super().__init__(cache_dir, max_bytes=max_bytes, enabled=enabled, suffix=".json")
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        response_format: Dict[str, str] | None,
+        base_url: str | None = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        """Compute the cache key for a chat completion request.
+
+        Args:
+            model: Model name
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Sampling temperature
+            response_format: Optional response format
+            base_url: API endpoint (responses of a mock server or another
+                provider are not served to real runs)
+            max_tokens: Response token limit (a response cut short by a small
+                limit is not reused for a larger one)
+
+        Returns:
+            Hex digest identifying the request
+        """
+        return DiskCache.make_key(
+            {
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "response_format": response_format,
+                "base_url": base_url,
+                "max_tokens": max_tokens,
+            }
+        )
+
+    def get(self, key: str) -> str | None:
+        """Look up a cached response.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached response content, or None on a miss
+        """
+        return super().get(key, decode=lambda data: json.loads(data)["content"])
+
+    def put(self, key: str, content: str) -> None:
+        """Store a response and evict old entries if over the size limit.
+
+        Args:
+            key: Key from make_key()
+            content: Response content
+        """
+        super().put(key, json.dumps({"content": content}, ensure_ascii=False).encode("utf-8"))
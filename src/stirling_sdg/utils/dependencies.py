@@ -0,0 +1,138 @@
+"""Memoized probes for external command-line dependencies.
+
+Probing a binary (e.g. running `tesseract --version`) costs a subprocess per
+call. Results are memoized per process and persisted in the cache directory
+(dependencies.json), keyed by the resolved binary path, its mtime and size,
+so a probe only runs again after the binary is installed, upgraded or removed.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+PROBES_FILENAME = "dependencies.json"
+
+# Registered dependencies: name -> command used to probe it
+DEPENDENCY_PROBES: Dict[str, List[str]] = {
+    "tesseract": ["tesseract", "--version"],
+}
+
+_memo: Dict[tuple, Dict[str, Any]] = {}
+_lock = threading.Lock()
+
+
+def register_dependency(name: str, command: List[str]) -> None:
+    """Register a dependency probe.
+
+    Args:
+        name: Dependency name
+        command: Command whose first element is the binary and whose exit
+            status/first output line report availability and version
+    """
+    DEPENDENCY_PROBES[name] = list(command)
+
+
+def _binary_signature(binary: str) -> Dict[str, Any] | None:
+    """Resolve a binary on PATH to (path, mtime, size), or None if missing."""
+    path = shutil.which(binary)
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return {"path": path, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def _run_probe(command: List[str]) -> Dict[str, Any]:
+    """Run a probe command and summarize the result."""
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, timeout=10)
+    except FileNotFoundError:
+        return {"available": False, "version": None, "error": "not found"}
+    except Exception as e:
+        return {"available": False, "version": None, "error": str(e)}
+
+    output = (result.stdout or result.stderr).strip()
+    return {
+        "available": result.returncode == 0,
+        "version": output.split("\n")[0] if output else None,
+        "error": None if result.returncode == 0 else f"exit status {result.returncode}",
+    }
+
+
+def _load(cache_file: Path) -> Dict[str, Any]:
+    try:
+        with open(cache_file, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _store(cache_file: Path, name: str, entry: Dict[str, Any]) -> None:
+    """Merge one probe result into the on-disk cache (atomic replace)."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        entries = _load(cache_file)
+        entries[name] = entry
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(entries, f)
+        os.replace(tmp_name, cache_file)
+    except OSError as e:
+        logger.debug(f"Could not write dependency probe cache {cache_file}: {e}")
+
+
+def probe_dependency(name: str, cache_dir: Path | None = None) -> Dict[str, Any]:
+    """Check whether a registered dependency is available.
+
+    Args:
+        name: Registered dependency name (see DEPENDENCY_PROBES)
+        cache_dir: Directory for the persistent probe cache (memoized
+            in-process only if None)
+
+    Returns:
+        Dict with available (bool), version (first output line or None),
+        error (reason if unavailable) and path (resolved binary or None)
+
+    Raises:
+        KeyError: If name is not registered
+    """
+    command = DEPENDENCY_PROBES[name]
+    signature = _binary_signature(command[0])
+    if signature is None:
+        return {"available": False, "version": None, "error": "not found", "path": None}
+
+    memo_key = (name, signature["path"], signature["mtime_ns"], signature["size"])
+    with _lock:
+        cached = _memo.get(memo_key)
+    if cached is not None:
+        # Callers get their own copy; the memoized dict stays intact
+        return dict(cached)
+
+    cache_file = Path(cache_dir) / PROBES_FILENAME if cache_dir is not None else None
+    entry = _load(cache_file).get(name) if cache_file is not None else None
+    if entry is None or entry.get("signature") != signature:
+        logger.debug(f"Probing dependency '{name}': {' '.join(command)}")
+        entry = {"signature": signature, **_run_probe([signature["path"], *command[1:]])}
+        if cache_file is not None:
+            _store(cache_file, name, entry)
+
+    result = {
+        "available": entry["available"],
+        "version": entry["version"],
+        "error": entry["error"],
+        "path": signature["path"],
+    }
+    with _lock:
+        _memo[memo_key] = result
+    return dict(result)
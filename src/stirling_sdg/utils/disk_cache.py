@@ -0,0 +1,236 @@
+"""Size-bounded, content-addressed file cache on disk.
+
+Entries are stored one file per key under the cache directory. Keys are
+hashes of everything that determines an entry (see make_key()). Writes go to
+a temporary file in the same directory and are renamed into place, so
+concurrent readers (threads or worker processes sharing the directory) never
+see a partial entry; two writers racing on the same key both produce a
+complete entry and the last rename wins. When a write pushes the cache over
+its size limit, the least recently used entries (oldest mtime; hits refresh
+the mtime) are evicted first.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+from .logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+def file_digest(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Compute the SHA-256 hex digest of a file's contents.
+
+    Args:
+        path: File to hash
+        chunk_size: Read size in bytes
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """Size-bounded LRU cache of files on disk."""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_bytes: int,
+        enabled: bool = True,
+        suffix: str = ".bin",
+    ):
+        """Initialize disk cache.
+
+        Args:
+            cache_dir: Directory for cache entries (created if missing)
+            max_bytes: Maximum total size of cache entries
+            enabled: If False, lookups always miss and stores are not kept
+            suffix: File suffix of cache entries
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.suffix = suffix
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if self.enabled:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(parts: Dict[str, Any]) -> str:
+        """Compute a cache key from everything that determines an entry.
+
+        Args:
+            parts: JSON-serializable dict (e.g. content digest and options)
+
+        Returns:
+            Hex digest identifying the entry
+        """
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def entry_path(self, key: str) -> Path:
+        """Get the file path of an entry (whether or not it exists)."""
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get_path(self, key: str) -> Path | None:
+        """Look up an entry by key.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Path of the cached file, or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        path = self.entry_path(key)
+        try:
+            # Refresh recency for LRU eviction (fails if the entry is missing)
+            os.utime(path)
+        except OSError:
+            self._count(hit=False)
+            return None
+
+        self._count(hit=True)
+        logger.debug(f"Cache hit in {self.cache_dir.name}: {key[:12]}")
+        return path
+
+    def get(self, key: str, decode: Callable[[bytes], Any] | None = None) -> Any | None:
+        """Read an entry by key.
+
+        Args:
+            key: Key from make_key()
+            decode: Optional function applied to the entry bytes; an entry that
+                fails to decode (ValueError/KeyError) counts as a miss
+
+        Returns:
+            Entry bytes (or decoded value), or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        path = self.entry_path(key)
+        try:
+            data = path.read_bytes()
+            value = decode(data) if decode is not None else data
+            os.utime(path)
+        except (OSError, ValueError, KeyError):
+            self._count(hit=False)
+            return None
+
+        self._count(hit=True)
+        logger.debug(f"Cache hit in {self.cache_dir.name}: {key[:12]}")
+        return value
+
+    def put_file(self, key: str, write: Callable[[Path], None]) -> Path | None:
+        """Create an entry by writing it to a temporary path first.
+
+        Args:
+            key: Key from make_key()
+            write: Function that writes the entry contents to the given path
+
+        Returns:
+            Path of the stored entry, or None if the cache is disabled or the
+            entry could not be stored (errors raised by write propagate)
+        """
+        if not self.enabled:
+            return None
+
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            write(Path(tmp_name))
+            os.replace(tmp_name, self.entry_path(key))
+        except OSError as e:
+            logger.warning(f"Could not write cache entry in {self.cache_dir}: {e}")
+            Path(tmp_name).unlink(missing_ok=True)
+            return None
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        self._evict()
+        return self.entry_path(key)
+
+    def put(self, key: str, data: bytes) -> Path | None:
+        """Store entry bytes.
+
+        Args:
+            key: Key from make_key()
+            data: Entry contents
+
+        Returns:
+            Path of the stored entry, or None if not stored
+        """
+        return self.put_file(key, lambda path: path.write_bytes(data))
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits max_bytes."""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        entries.sort()
+        evicted = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            evicted += 1
+
+        logger.debug(
+            f"Cache {self.cache_dir.name} evicted {evicted} entries ({total} bytes remain)"
+        )
+
+    def clear(self) -> None:
+        """Remove all cache entries."""
+        for path in self.cache_dir.glob(f"*{self.suffix}"):
+            path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters.
+
+        Returns:
+            Dict with hits, misses and hit_rate
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
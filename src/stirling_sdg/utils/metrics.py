@@ -0,0 +1,395 @@
+"""Prometheus-format metrics (counters and histograms) for production runs.
+
+A small stdlib-only registry: metrics are module-level objects that the LLM
+client, rate limiter, PDF client and pipeline update as they work. The
+registry renders the Prometheus text exposition format, which can be
+
+- written to a file for the node_exporter textfile collector
+  (write_textfile(), or the METRICS_TEXTFILE setting, which the orchestrator
+  refreshes after every run), or
+- served on a local /metrics endpoint (serve mode exposes it on the job API;
+  start_metrics_server() serves it on its own port).
+
+    LLM_REQUESTS.inc(mode="sync", outcome="ok")
+    OCR_SECONDS.observe(12.3)
+    print(REGISTRY.render())
+
+Metrics are per process: render workers in child processes report their
+results to the parent, which does the counting.
+"""
+
+import math
+import os
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value (integers without a trailing .0)."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format a label set like {mode="sync",outcome="ok"} (empty if no labels)."""
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    """Base class: a named metric with a fixed set of label names (thread-safe)."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """Initialize metric.
+
+        Args:
+            name: Metric name (e.g. "stirling_sdg_llm_requests_total")
+            documentation: HELP text
+            labelnames: Names of the labels every sample must provide
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        """Get the label values for a label dict, in labelnames order."""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(sorted(labels))}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        """Get (sample name, formatted labels, value) for every sample."""
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        """Drop all samples."""
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """Render the metric in the Prometheus text format."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        for sample_name, labels, value in self.samples():
+            lines.append(f"{sample_name}{labels} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the counter.
+
+        Args:
+            amount: Non-negative increment
+            **labels: Value for every label name
+
+        Raises:
+            ValueError: If amount is negative or labels do not match
+        """
+        if amount < 0:
+            raise ValueError(f"{self.name}: counters can only increase (got {amount})")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Get the current value for a label set (0 if never incremented)."""
+        key = self._key(labels)
+        with self._lock:
+            return self._values.get(key, 0.0)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        with self._lock:
+            items = sorted(self._values.items())
+        if not items and not self.labelnames:
+            items = [((), 0.0)]
+        return [(self.name, _format_labels(self.labelnames, key), value) for key, value in items]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        """Initialize histogram.
+
+        Args:
+            name: Metric name
+            documentation: HELP text
+            labelnames: Names of the labels every observation must provide
+            buckets: Upper bounds of the buckets (+Inf is always added)
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(b) for b in buckets if not math.isinf(b)))
+        # label values -> [per-bucket counts (non-cumulative, last is +Inf), sum]
+        self._values: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation.
+
+        Args:
+            value: Observed value (e.g. seconds)
+            **labels: Value for every label name
+        """
+        key = self._key(labels)
+        position = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                position = i
+                break
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][position] += 1
+            entry[1] += value
+
+    def count(self, **labels: str) -> int:
+        """Get the number of observations for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            entry = self._values.get(key)
+            return sum(entry[0]) if entry else 0
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        with self._lock:
+            items = sorted((key, (list(counts), total)) for key, (counts, total) in self._values.items())
+
+        samples = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                labels = _format_labels(
+                    self.labelnames + ("le",), key + (_format_value(bound),)
+                )
+                samples.append((f"{self.name}_bucket", labels, cumulative))
+            labels = _format_labels(self.labelnames, key)
+            samples.append((f"{self.name}_sum", labels, total))
+            samples.append((f"{self.name}_count", labels, cumulative))
+        return samples
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Add a metric.
+
+        Raises:
+            ValueError: If a metric with the same name is already registered
+        """
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Create and register a counter."""
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "".join(metric.render() for metric in metrics)
+
+    def reset(self) -> None:
+        """Drop all samples (metrics stay registered)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+
+REGISTRY = MetricsRegistry()
+
+# LLM client
+LLM_REQUESTS = REGISTRY.counter(
+    "stirling_sdg_llm_requests_total",
+    "LLM chat completion attempts, by mode (sync/async) and outcome (ok/rate_limited/error)",
+    ["mode", "outcome"],
+)
+LLM_REQUEST_SECONDS = REGISTRY.histogram(
+    "stirling_sdg_llm_request_duration_seconds",
+    "Duration of successful LLM requests (excluding rate-limiter waits)",
+    ["mode"],
+)
+LLM_TOKENS = REGISTRY.counter(
+    "stirling_sdg_llm_tokens_total",
+    "LLM tokens used, by kind (prompt/completion)",
+    ["kind"],
+)
+LLM_RATE_LIMITED = REGISTRY.counter(
+    "stirling_sdg_llm_rate_limited_total",
+    "HTTP 429 responses from the LLM API (including ones the OpenAI SDK retried itself)",
+)
+LLM_RETRIES = REGISTRY.counter(
+    "stirling_sdg_llm_retries_total",
+    "LLM request retries, by reason (rate_limited/error, or sdk for the OpenAI SDK's own retries)",
+    ["reason"],
+)
+LLM_CACHE_HITS = REGISTRY.counter(
+    "stirling_sdg_llm_cache_hits_total",
+    "LLM responses served from the response cache",
+)
+RATE_LIMIT_SLEEP_SECONDS = REGISTRY.counter(
+    "stirling_sdg_rate_limiter_sleep_seconds_total",
+    "Seconds spent waiting in the client-side LLM rate limiter",
+)
+
+# PDF processing
+OCR_SECONDS = REGISTRY.histogram(
+    "stirling_sdg_ocr_duration_seconds",
+    "Duration of OCR runs (cache hits excluded)",
+    buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0),
+)
+OCR_CACHE_HITS = REGISTRY.counter(
+    "stirling_sdg_ocr_cache_hits_total",
+    "OCR results served from the OCR cache",
+)
+PAGES_EXTRACTED = REGISTRY.counter(
+    "stirling_sdg_pages_extracted_total",
+    "PDF pages extracted to JSON, by engine",
+    ["engine"],
+)
+
+# Pipeline output
+VARIATIONS = REGISTRY.counter(
+    "stirling_sdg_variations_total",
+    "Generated documents, by run mode (single/batch) and outcome (rendered/failed)",
+    ["mode", "outcome"],
+)
+OUTPUT_BYTES = REGISTRY.counter(
+    "stirling_sdg_output_bytes_total",
+    "Bytes of generated output documents",
+)
+
+
+def write_textfile(path: Path, registry: MetricsRegistry = REGISTRY) -> Path:
+    """Write metrics for the node_exporter textfile collector.
+
+    The file is replaced atomically, so the collector never reads a partial
+    file. Point the collector's --collector.textfile.directory at its parent
+    directory (the file name must end in .prom).
+
+    Args:
+        path: Output file
+        registry: Registry to render
+
+    Returns:
+        Path written
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(registry.render())
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return path
+
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    """Serves GET /metrics from the server's registry."""
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0].rstrip("/") != "/metrics":
+            self.send_error(404)
+            return
+        body = self.server.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_metrics_server(
+    host: str = "127.0.0.1", port: int = 9464, registry: MetricsRegistry = REGISTRY
+) -> ThreadingHTTPServer:
+    """Serve /metrics on a local port from a daemon thread.
+
+    Args:
+        host: Interface to bind
+        port: Port to listen on (0 picks a free port)
+        registry: Registry to serve
+
+    Returns:
+        The running server (call shutdown() to stop it)
+    """
+    server = ThreadingHTTPServer((host, port), MetricsRequestHandler)
+    server.daemon_threads = True
+    server.registry = registry
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
@@ -0,0 +1,38 @@
+"""Multiprocessing context for the pipeline's process pools.
+
+Process pools (render workers, parallel extraction) are created while other
+threads are running: synthesis producers, HTTP client pools, the job server.
+A child forked directly from a multi-threaded process can deadlock on a lock
+another thread held at fork time, so pool workers are started from a
+forkserver instead (spawn where forkserver is unavailable). The forkserver is
+started once per process and preloads the modules registered here, so workers
+forked from it start without re-importing them.
+"""
+
+import multiprocessing
+import threading
+from typing import Set
+
+_preload: Set[str] = set()
+_preload_lock = threading.Lock()
+
+
+def pool_context(*preload_modules: str) -> multiprocessing.context.BaseContext:
+    """Get the multiprocessing context for a process pool.
+
+    Args:
+        preload_modules: Modules the pool's workers run; imported by the
+            forkserver if it has not started yet (later registrations are
+            imported by each worker instead)
+
+    Returns:
+        Forkserver context, or spawn where forkserver is unavailable
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+
+    context = multiprocessing.get_context("forkserver")
+    with _preload_lock:
+        _preload.update(preload_modules)
+        context.set_forkserver_preload(sorted(_preload))
+    return context
@@ -0,0 +1,367 @@
+"""Lightweight timing spans and per-run performance reports.
+
+A span measures one pipeline step (wall time, CPU time of the calling thread,
+bytes in/out and LLM tokens). Spans are collected by the RunReport that is
+active in the current context; with no active report, span() only costs two
+clock reads, so instrumented code needs no checks.
+
+    report = RunReport("single", input_path)
+    with report.activate():
+        with span("extraction", bytes_in=file_size(path)) as s:
+            ...
+    report.save(path)
+
+LLM clients call record_tokens() after each request; the tokens are added to
+the innermost active span (context variables follow the current thread and
+asyncio task, so concurrent producers attribute tokens to their own spans).
+
+CPU time is thread CPU time (time.thread_time()): work done in child processes
+(e.g. OCR engines) is not included. Render workers measure their own phases
+and send them back with each result (see record_phases()).
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+# (wall seconds, CPU seconds) per phase name
+PhaseTimings = Dict[str, Tuple[float, float]]
+
+_current_report: ContextVar["RunReport | None"] = ContextVar("run_report", default=None)
+_active_span: ContextVar["Span | None"] = ContextVar("active_span", default=None)
+
+PERCENTILES = (50, 95, 99)
+
+
+class Span:
+    """Measurements of one pipeline step."""
+
+    __slots__ = (
+        "name",
+        "document",
+        "wall",
+        "cpu",
+        "bytes_in",
+        "bytes_out",
+        "prompt_tokens",
+        "completion_tokens",
+        "attrs",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        document: str | None = None,
+        wall: float = 0.0,
+        cpu: float = 0.0,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+        **attrs: Any,
+    ):
+        """Initialize span.
+
+        Args:
+            name: Step name (e.g. "extraction")
+            document: Document the step worked on
+            wall: Wall time in seconds
+            cpu: CPU time in seconds
+            bytes_in: Bytes read
+            bytes_out: Bytes written
+            **attrs: Extra JSON-serializable attributes
+        """
+        self.name = name
+        self.document = document
+        self.wall = wall
+        self.cpu = cpu
+        self.bytes_in = bytes_in
+        self.bytes_out = bytes_out
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.attrs = attrs
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "document": self.document,
+            "wall": self.wall,
+            "cpu": self.cpu,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            **self.attrs,
+        }
+
+
+@contextmanager
+def span(name: str, report: "RunReport | None" = None, **fields: Any) -> Iterator[Span]:
+    """Measure a block as a span.
+
+    Args:
+        name: Step name
+        report: Report to add the span to (default: the active report)
+        **fields: Span fields (document, bytes_in, bytes_out, extra attributes);
+            the yielded span can also be updated inside the block
+
+    Yields:
+        The span being measured
+    """
+    if report is None:
+        report = _current_report.get()
+    if report is not None and "document" not in fields:
+        fields["document"] = report.document
+
+    current = Span(name, **fields)
+    token = _active_span.set(current)
+    wall_start, cpu_start = time.perf_counter(), time.thread_time()
+    try:
+        yield current
+    finally:
+        current.wall = time.perf_counter() - wall_start
+        current.cpu = time.thread_time() - cpu_start
+        _active_span.reset(token)
+        if report is not None:
+            report.add(current)
+
+
+@contextmanager
+def phase(timings: PhaseTimings | None, name: str) -> Iterator[None]:
+    """Measure a block into a phase dict (no-op if timings is None).
+
+    Used where spans cannot be reported directly, e.g. in worker processes.
+    """
+    if timings is None:
+        yield
+        return
+    wall_start, cpu_start = time.perf_counter(), time.thread_time()
+    try:
+        yield
+    finally:
+        wall, cpu = timings.get(name, (0.0, 0.0))
+        timings[name] = (
+            wall + time.perf_counter() - wall_start,
+            cpu + time.thread_time() - cpu_start,
+        )
+
+
+def record_tokens(prompt_tokens: int, completion_tokens: int) -> None:
+    """Add LLM token usage to the innermost active span (if any)."""
+    current = _active_span.get()
+    if current is not None:
+        current.prompt_tokens += prompt_tokens or 0
+        current.completion_tokens += completion_tokens or 0
+
+
+def file_size(path: Path | None) -> int:
+    """Get a file's size in bytes (0 if it does not exist)."""
+    try:
+        return os.path.getsize(path) if path is not None else 0
+    except OSError:
+        return 0
+
+
+def percentiles(values: Iterable[float], points: Iterable[int] = PERCENTILES) -> Dict[str, float]:
+    """Compute percentiles with linear interpolation.
+
+    Args:
+        values: Samples
+        points: Percentiles to compute (0-100)
+
+    Returns:
+        Dict like {"p50": ..., "p95": ..., "p99": ..., "mean": ..., "max": ...}
+        (empty if there are no samples)
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return {}
+
+    result = {}
+    for point in points:
+        rank = (len(ordered) - 1) * point / 100
+        low = int(rank)
+        high = min(low + 1, len(ordered) - 1)
+        result[f"p{point}"] = ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+    result["mean"] = sum(ordered) / len(ordered)
+    result["max"] = ordered[-1]
+    return result
+
+
+def _totals(spans: Iterable[Span]) -> Dict[str, Dict[str, Any]]:
+    """Aggregate spans by name."""
+    totals: Dict[str, Dict[str, Any]] = {}
+    for s in spans:
+        entry = totals.setdefault(s.name, {
+            "count": 0,
+            "wall": 0.0,
+            "cpu": 0.0,
+            "bytes_in": 0,
+            "bytes_out": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+        })
+        entry["count"] += 1
+        entry["wall"] += s.wall
+        entry["cpu"] += s.cpu
+        entry["bytes_in"] += s.bytes_in
+        entry["bytes_out"] += s.bytes_out
+        entry["prompt_tokens"] += s.prompt_tokens
+        entry["completion_tokens"] += s.completion_tokens
+    return totals
+
+
+class RunReport:
+    """Collects spans and per-variation results of one pipeline run (thread-safe)."""
+
+    def __init__(self, run_type: str, input_path: Path, **metadata: Any):
+        """Initialize report.
+
+        Args:
+            run_type: "single" or "batch"
+            input_path: Input document of the run
+            **metadata: Extra JSON-serializable run parameters
+        """
+        self.run_type = run_type
+        self.document = Path(input_path).name
+        self.input_path = str(input_path)
+        self.metadata = metadata
+        self.started_at = datetime.now(timezone.utc).isoformat()
+        self.spans: List[Span] = []
+        self.variations: List[Dict[str, Any]] = []
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        self.wall: float | None = None
+        self.cpu: float | None = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def activate(self) -> Iterator["RunReport"]:
+        """Make this the report that span() records into (current context)."""
+        token = _current_report.set(self)
+        try:
+            yield self
+        finally:
+            _current_report.reset(token)
+
+    def add(self, s: Span) -> None:
+        """Add a finished span."""
+        with self._lock:
+            self.spans.append(s)
+
+    def record_phases(
+        self,
+        phases: PhaseTimings,
+        document: str | None = None,
+        bytes_out: int = 0,
+        **attrs: Any,
+    ) -> None:
+        """Add spans for phases measured elsewhere (e.g. in a worker process).
+
+        Args:
+            phases: Phase name -> (wall, cpu), in execution order
+            document: Document the phases belong to (default: the run's input)
+            bytes_out: Output size, attributed to the last phase (the one
+                that wrote the output)
+            **attrs: Attributes for every span (e.g. variation index)
+        """
+        last = len(phases) - 1
+        for position, (name, (wall, cpu)) in enumerate(phases.items()):
+            self.add(Span(
+                name,
+                document=document or self.document,
+                wall=wall,
+                cpu=cpu,
+                bytes_out=bytes_out if position == last else 0,
+                **attrs,
+            ))
+
+    def add_variation(
+        self,
+        index: int,
+        latency: float,
+        ok: bool,
+        render_wall: float = 0.0,
+        bytes_out: int = 0,
+    ) -> None:
+        """Record the outcome of one batch variation.
+
+        Args:
+            index: 0-based variation index
+            latency: Seconds from the start of its synthesis request to the
+                published output (includes queueing)
+            ok: Whether the variation was written
+            render_wall: Seconds spent rendering it
+            bytes_out: Size of the output file
+        """
+        with self._lock:
+            self.variations.append({
+                "index": index + 1,
+                "ok": ok,
+                "latency": latency,
+                "render": render_wall,
+                "bytes_out": bytes_out,
+            })
+
+    def finish(self) -> None:
+        """Stop the run clocks."""
+        self.wall = time.perf_counter() - self._wall_start
+        self.cpu = time.process_time() - self._cpu_start
+
+    def variation_latency(self) -> Dict[str, float]:
+        """Get p50/p95/p99 (plus mean and max) of successful variation latencies."""
+        with self._lock:
+            return percentiles(v["latency"] for v in self.variations if v["ok"])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Build the machine-readable report."""
+        with self._lock:
+            spans = list(self.spans)
+            variations = sorted(self.variations, key=lambda v: v["index"])
+
+        documents: Dict[str, List[Span]] = {}
+        for s in spans:
+            documents.setdefault(s.document or self.document, []).append(s)
+
+        report = {
+            "run": self.run_type,
+            "input": self.input_path,
+            "started_at": self.started_at,
+            "wall": self.wall,
+            "cpu": self.cpu,
+            "parameters": self.metadata,
+            "stages": _totals(spans),
+            "documents": {name: {"stages": _totals(items)} for name, items in documents.items()},
+            # Per-variation spans are summarized by stage/document above
+            "spans": [s.to_dict() for s in spans if "variation" not in s.attrs],
+        }
+        if self.run_type == "batch":
+            ok = [v for v in variations if v["ok"]]
+            report["variations"] = {
+                "count": len(variations),
+                "succeeded": len(ok),
+                "failed": len(variations) - len(ok),
+                "latency": percentiles(v["latency"] for v in ok),
+                "render": percentiles(v["render"] for v in ok),
+                "items": variations,
+            }
+        return report
+
+    def save(self, path: Path) -> Path:
+        """Write the report as JSON.
+
+        Args:
+            path: Output file
+
+        Returns:
+            Path written
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
@@ -0,0 +1,104 @@
+"""Compiled replacement plans against per-field replacement."""
+
+import json
+
+import fitz
+import pytest
+
+from stirling_sdg.stirling.direct_edit_client import DirectEditClient
+
+TEMPLATE = {
+    "variable_fields": [
+        {"text": "John Smith", "fieldType": "patient_name", "dataType": "string"},
+        # Overlaps "John Smith"; the earlier field wins
+        {"text": "Smith", "fieldType": "last_name", "dataType": "string"},
+        {"text": "js@a.io", "fieldType": "email", "dataType": "string"},
+        {"text": "555-0100", "fieldType": "phone", "dataType": "string"},
+        # Not in the document
+        {"text": "Nowhere", "fieldType": "city", "dataType": "string"},
+    ],
+}
+
+DATA = {
+    "patient_name": "Jane Roe",
+    "last_name": "Roe",
+    "email": "x@example.org",
+    "phone": {"area": "555", "number": "0199"},
+    "city": "Springfield",
+}
+
+
+@pytest.fixture
+def source_pdf(tmp_path):
+    path = tmp_path / "form.pdf"
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 100), "Name: John Smith", fontsize=11)
+    page.insert_text((72, 130), "Email: js@a.io   Phone: 555-0100", fontsize=9, color=(0, 0, 1))
+    page.draw_rect(fitz.Rect(60, 85, 300, 140))
+    page = doc.new_page()
+    page.insert_text((72, 100), "Referring doctor: Dr. Smith", fontsize=11)
+    page.insert_text((72, 130), "Patient: John Smith (js@a.io)", fontsize=11)
+    page = doc.new_page()
+    page.insert_text((72, 100), "No personal data on this page", fontsize=11)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def render(source_pdf, output_path, edit):
+    with DirectEditClient.from_bytes(source_pdf.read_bytes(), source_pdf) as client:
+        count = edit(client)
+        client.save(output_path)
+    return count
+
+
+def page_texts(path):
+    with fitz.open(path) as doc:
+        return [page.get_text() for page in doc]
+
+
+def drawing_count(path):
+    with fitz.open(path) as doc:
+        return [len(page.get_drawings()) for page in doc]
+
+
+def test_plan_matches_per_field_replacement(tmp_path, source_pdf):
+    per_field = render(
+        source_pdf,
+        tmp_path / "per_field.pdf",
+        lambda client: client.apply_template(TEMPLATE, DATA, batched=False),
+    )
+
+    with DirectEditClient(source_pdf) as client:
+        # Plans are persisted in template JSON
+        plan = json.loads(json.dumps(client.compile_plan(TEMPLATE)))
+    planned = render(
+        source_pdf, tmp_path / "plan.pdf", lambda client: client.apply_plan(plan, DATA)
+    )
+
+    assert planned == per_field == 6
+    assert sorted(plan["pages"]) == ["0", "1"]
+    assert page_texts(tmp_path / "plan.pdf") == page_texts(tmp_path / "per_field.pdf")
+    assert drawing_count(tmp_path / "plan.pdf") == drawing_count(source_pdf)
+
+    first, second, third = page_texts(tmp_path / "plan.pdf")
+    assert "Jane Roe" in first and "x@example.org" in first and "555 0199" in first
+    assert "John Smith" not in first + second and "js@a.io" not in first + second
+    # "Smith" alone (no overlap with "John Smith") gets the last_name value
+    assert "Smith" not in second and "\nRoe\n" in second
+    assert third == page_texts(source_pdf)[2]
+
+
+def test_plan_skips_fields_without_data(tmp_path, source_pdf):
+    with DirectEditClient(source_pdf) as client:
+        plan = client.compile_plan(TEMPLATE)
+
+    data = {"patient_name": "Jane Roe"}
+    count = render(
+        source_pdf, tmp_path / "partial.pdf", lambda client: client.apply_plan(plan, data)
+    )
+
+    text = "".join(page_texts(tmp_path / "partial.pdf"))
+    assert count == 2
+    assert "js@a.io" in text and "Dr. Smith" in text
@@ -0,0 +1,51 @@
+"""Parallel PDF extraction."""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import fitz
+import pytest
+
+from stirling_sdg.stirling.local_client import (
+    PARALLEL_EXTRACTION_MIN_PAGES,
+    LocalStirlingClient,
+)
+
+
+@pytest.fixture
+def multi_page_pdf(tmp_path):
+    path = tmp_path / "pages.pdf"
+    doc = fitz.open()
+    for n in range(PARALLEL_EXTRACTION_MIN_PAGES + 2):
+        page = doc.new_page()
+        page.insert_text((72, 100), f"Page {n + 1}: Patient John Smith", fontsize=11)
+        page.draw_rect(fitz.Rect(72, 120, 300, 140))
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.mark.parametrize("engine", ["pymupdf", "pdfplumber"])
+def test_parallel_extraction_matches_serial(tmp_path, multi_page_pdf, engine, monkeypatch):
+    contexts = []
+
+    class RecordingPool(ProcessPoolExecutor):
+        def __init__(self, *args, mp_context=None, **kwargs):
+            contexts.append(mp_context)
+            super().__init__(*args, mp_context=mp_context, **kwargs)
+
+    monkeypatch.setattr("stirling_sdg.stirling.local_client.ProcessPoolExecutor", RecordingPool)
+    client = LocalStirlingClient(cache_dir=tmp_path / "cache")
+
+    serial = client.pdf_to_json(multi_page_pdf, workers=1, engine=engine)
+    parallel = client.pdf_to_json(multi_page_pdf, workers=3, engine=engine)
+
+    assert parallel == serial
+    assert [page["pageNumber"] for page in parallel["pages"]] == list(
+        range(1, PARALLEL_EXTRACTION_MIN_PAGES + 3)
+    )
+    # Workers are never forked straight from the (multi-threaded) caller
+    assert len(contexts) == 1
+    assert contexts[0].get_start_method() == (
+        "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    )
@@ -0,0 +1,171 @@
+"""Layout fingerprints and re-binding matched templates to new documents."""
+
+import fitz
+import pytest
+
+from stirling_sdg.config.settings import Settings
+from stirling_sdg.detection.fingerprint import compute_fingerprint, fingerprint_pdf, similarity
+from stirling_sdg.pipeline.template_index import (
+    MIN_REBOUND_FRACTION,
+    POSITION_TOLERANCE,
+    TemplateIndex,
+    rebind_direct_edit_template,
+    rebind_reconstruction_template,
+)
+
+# Five fields, one per row
+ROWS = [(72, 100 + 30 * n) for n in range(5)]
+
+
+def direct_edit_template():
+    return {
+        "type": "direct_edit",
+        "variable_fields": [
+            {
+                "text": f"old value {n}",
+                "fieldType": f"field_{n}",
+                "page": 0,
+                "rect": [x, y, x + 60, y + 12],
+            }
+            for n, (x, y) in enumerate(ROWS)
+        ],
+        "replacement_plan": {"pages": {}},
+    }
+
+
+def text_element(n, x, y, width=80):
+    return {
+        "text": f"new value {n}",
+        "page": 0,
+        "rect": [x, y, x + width, y + 12],
+        "font": "helv",
+        "size": 11,
+        "color": 0,
+    }
+
+
+def test_rebind_direct_edit_takes_new_values():
+    elements = [text_element(n, x + 2, y - 1) for n, (x, y) in enumerate(ROWS)]
+    rebound = rebind_direct_edit_template(direct_edit_template(), elements)
+
+    assert [f["text"] for f in rebound["variable_fields"]] == [f"new value {n}" for n in range(5)]
+    assert [f["fieldType"] for f in rebound["variable_fields"]] == [f"field_{n}" for n in range(5)]
+    # Rects (and widths) come from the new document; the stale plan is dropped
+    assert rebound["variable_fields"][0]["rect"] == [74, 99, 154, 111]
+    assert "replacement_plan" not in rebound
+
+
+@pytest.mark.parametrize("located, reused", [(5, True), (4, True), (3, False), (0, False)])
+def test_rebind_requires_min_fraction_of_fields(located, reused):
+    assert MIN_REBOUND_FRACTION == 0.8
+    elements = [text_element(n, x, y) for n, (x, y) in enumerate(ROWS[:located])]
+    # Unrelated text elsewhere on the page does not count
+    elements.append(text_element(9, 300, 500))
+
+    rebound = rebind_direct_edit_template(direct_edit_template(), elements)
+
+    assert (rebound is not None) == reused
+    if reused:
+        assert len(rebound["variable_fields"]) == located
+
+
+@pytest.mark.parametrize(
+    "offset, located",
+    [(POSITION_TOLERANCE, True), (POSITION_TOLERANCE + 0.5, False)],
+)
+def test_rebind_position_tolerance(offset, located):
+    template = direct_edit_template()
+    template["variable_fields"] = template["variable_fields"][:1]
+    x, y = ROWS[0]
+
+    assert (
+        rebind_direct_edit_template(template, [text_element(0, x + offset, y)]) is not None
+    ) == located
+    assert (
+        rebind_direct_edit_template(template, [text_element(0, x, y + offset)]) is not None
+    ) == located
+
+
+def test_rebind_ignores_other_pages():
+    template = direct_edit_template()
+    elements = [{**text_element(n, x, y), "page": 1} for n, (x, y) in enumerate(ROWS)]
+
+    assert rebind_direct_edit_template(template, elements) is None
+
+
+def test_rebind_reconstruction_template():
+    template = {
+        "type": "reconstruction",
+        "variable_fields": [
+            {
+                "text": "John Smith",
+                "fieldType": "patient_name",
+                "pageNumber": 1,
+                "bbox": [72, 100, 140, 112],
+            },
+            {"text": "js@a.io", "fieldType": "email", "pageNumber": 1, "bbox": [72, 130, 120, 142]},
+        ],
+    }
+    pdf_json = {
+        "pages": [
+            {
+                "pageNumber": 1,
+                "textElements": [
+                    {"text": "Jane Roe", "x": 73, "y": 101, "width": 50, "height": 12},
+                    {"text": "jr@b.io", "x": 72, "y": 130, "width": 45, "height": 12},
+                ],
+            }
+        ]
+    }
+
+    rebound = rebind_reconstruction_template(template, pdf_json)
+    assert [f["text"] for f in rebound["variable_fields"]] == ["Jane Roe", "jr@b.io"]
+    assert rebound["variable_fields"][0]["bbox"] == [73, 101, 123, 113]
+
+    # Only one of two fields (50%) located
+    pdf_json["pages"][0]["textElements"].pop()
+    assert rebind_reconstruction_template(template, pdf_json) is None
+
+
+def make_form(path, name, email, size=fitz.paper_rect("letter")):
+    doc = fitz.open()
+    page = doc.new_page(width=size.width, height=size.height)
+    page.insert_text((72, 60), "Outpatient Intake Form - please print clearly", fontsize=14)
+    page.insert_text((72, 100), "Patient name:", fontsize=11)
+    page.insert_text((180, 100), name, fontsize=11)
+    page.insert_text((72, 130), "Contact email:", fontsize=11)
+    page.insert_text((180, 130), email, fontsize=11)
+    page.draw_rect(fitz.Rect(60, 85, 400, 140))
+    page.insert_text((72, 170), "Signature of patient or guardian", fontsize=9)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def test_same_form_matches_other_forms_do_not(tmp_path):
+    stored = fingerprint_pdf(
+        make_form(tmp_path / "a.pdf", "John Smith", "js@a.io"),
+        exclude_texts=["John Smith", "js@a.io"],
+    )
+    same_form = fingerprint_pdf(make_form(tmp_path / "b.pdf", "Jane Roe", "jr@b.io"))
+    other_size = fingerprint_pdf(
+        make_form(tmp_path / "c.pdf", "Jane Roe", "jr@b.io", size=fitz.paper_rect("a4"))
+    )
+
+    # Recall-weighted: the new document's own field values barely count
+    assert (
+        similarity(stored, same_form) >= Settings.model_fields["template_match_threshold"].default
+    )
+    assert similarity(stored, other_size) == 0.0
+    assert (
+        similarity(stored, compute_fingerprint({"pages": [{"width": 612, "height": 792}]})) == 0.0
+    )
+
+    index = TemplateIndex(tmp_path / "templates")
+    index.add("intake", stored, "digital_pdf")
+    (tmp_path / "templates" / "intake_template.json").write_text("{}")
+
+    name, doc_type, score = index.match(same_form, threshold=0.9)
+    assert (name, doc_type) == ("intake", "digital_pdf")
+    assert index.match(same_form, threshold=score + 0.01) is None
+    assert index.match(other_size, threshold=0.1) is None
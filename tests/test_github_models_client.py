@@ -0,0 +1,90 @@
+"""GitHub Models client: rate limiting and per-event-loop async state."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from stirling_sdg.config.settings import Settings
+from stirling_sdg.synthesis.github_models_client import (
+    AsyncRateLimiter,
+    GitHubModelsClient,
+    RateLimiter,
+)
+
+
+@pytest.fixture
+def client(tmp_path):
+    settings = Settings(
+        groq_api_key="test",
+        github_token="test",
+        cache_dir=tmp_path / "cache",
+        log_file=tmp_path / "test.log",
+    )
+    return GitHubModelsClient(settings)
+
+
+def test_rate_limiter_reserves_slots_in_window_order():
+    limiter = RateLimiter(max_calls=2, period=10)
+    waits = [limiter.reserve() for _ in range(5)]
+
+    assert waits[:2] == [0, 0]
+    assert waits[2] == pytest.approx(10, abs=0.1)
+    assert waits[3] == pytest.approx(10, abs=0.1)
+    assert waits[4] == pytest.approx(20, abs=0.1)
+
+
+def test_rate_limiter_does_not_sleep_under_lock():
+    limiter = RateLimiter(max_calls=1, period=0.5)
+    limiter.wait_if_needed()
+    sleeper = threading.Thread(target=limiter.wait_if_needed)
+    sleeper.start()
+    time.sleep(0.05)
+
+    # The first waiter is asleep; the next one still gets its slot at once
+    started = time.perf_counter()
+    wait = limiter.reserve()
+    assert time.perf_counter() - started < 0.1
+    assert wait == pytest.approx(0.95, abs=0.1)
+    sleeper.join()
+
+
+def test_async_rate_limiter_shares_budget_between_tasks():
+    limiter = AsyncRateLimiter(max_calls=2, period=0.3)
+
+    async def run():
+        started = time.perf_counter()
+        await asyncio.gather(*(limiter.wait_if_needed() for _ in range(4)))
+        return time.perf_counter() - started
+
+    assert 0.25 < asyncio.run(run()) < 0.6
+
+
+def test_async_state_is_per_loop(client):
+    states = {}
+    ready = threading.Barrier(2)
+
+    def run_loop(name):
+        async def use_client():
+            states[name] = await client._async_state()
+            # Both loops are running here; neither may close the other's client
+            ready.wait(timeout=5)
+            assert await client._async_state() is states[name]
+            assert not states[name][0].is_closed()
+
+        asyncio.run(use_client())
+
+    threads = [threading.Thread(target=run_loop, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert states["a"][0] is not states["b"][0]
+    assert not states["a"][0].is_closed() and not states["b"][0].is_closed()
+
+    # A later loop closes the clients of the finished ones
+    later = asyncio.run(client._async_state())
+    assert states["a"][0].is_closed() and states["b"][0].is_closed()
+    assert not later[0].is_closed()
@@ -0,0 +1,101 @@
+"""Mock LLM server: rate limiting and Retry-After."""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from stirling_sdg.config.settings import Settings
+from stirling_sdg.synthesis.github_models_client import GitHubModelsClient
+from stirling_sdg.synthesis.mock_server import create_mock_server
+from stirling_sdg.utils.metrics import LLM_RATE_LIMITED
+
+MESSAGES = [{"role": "user", "content": "Generate realistic values for: patient_name"}]
+
+
+@pytest.fixture
+def mock_server():
+    servers = []
+
+    def start(**options):
+        server = create_mock_server(port=0, **options)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def post(base_url, body):
+    request = urllib.request.Request(
+        f"{base_url}/chat/completions",
+        data=json.dumps(body).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, dict(response.headers), json.load(response)
+    except urllib.error.HTTPError as e:
+        return e.code, dict(e.headers), json.load(e)
+
+
+def test_rpm_quota_answers_429_with_retry_after(mock_server):
+    server, base_url = mock_server(rate_limit_rpm=2)
+
+    statuses = [post(base_url, {"messages": MESSAGES})[0] for _ in range(2)]
+    status, headers, body = post(base_url, {"messages": MESSAGES})
+
+    assert statuses == [200, 200]
+    assert status == 429
+    assert body["error"]["code"] == "rate_limit_exceeded"
+    # Seconds until the oldest request leaves the one-minute window
+    assert 58 <= int(headers["Retry-After"]) <= 60
+    stats = server.mock.snapshot()
+    assert (stats["requests"], stats["completed"], stats["rate_limited"]) == (3, 2, 1)
+
+
+def test_injected_429_retry_after(mock_server):
+    server, base_url = mock_server(rate_limit_probability=1.0)
+
+    status, headers, _ = post(base_url, {"messages": MESSAGES})
+
+    assert status == 429
+    assert headers["Retry-After"] == "1"
+    assert server.mock.snapshot()["completed"] == 0
+
+
+def test_invalid_request_is_not_rate_limited(mock_server):
+    server, base_url = mock_server(rate_limit_probability=1.0)
+
+    status, _, body = post(base_url, {"messages": []})
+
+    assert status == 400
+    assert body["error"]["code"] == "invalid_request_error"
+    assert server.mock.snapshot()["rate_limited"] == 0
+
+
+def test_client_retries_after_429(tmp_path, mock_server):
+    # Seed 1: the first request is rejected, the retry is answered
+    server, base_url = mock_server(rate_limit_probability=0.5, seed=1)
+    settings = Settings(
+        groq_api_key="test",
+        github_token="test",
+        llm_base_url=base_url,
+        cache_dir=tmp_path / "cache",
+        log_file=tmp_path / "test.log",
+    )
+    client = GitHubModelsClient(settings)
+    rate_limited = LLM_RATE_LIMITED.value()
+
+    content = client.chat_completion(MESSAGES, max_tokens=256)
+
+    assert content
+    stats = server.mock.snapshot()
+    assert (stats["requests"], stats["completed"], stats["rate_limited"]) == (2, 1, 1)
+    assert LLM_RATE_LIMITED.value() == rate_limited + 1
@@ -0,0 +1,128 @@
+"""LLM response caching: keys, eviction and unusable responses."""
+
+import asyncio
+import os
+
+import pytest
+
+from stirling_sdg.config.settings import Settings
+from stirling_sdg.synthesis.github_models_client import GitHubModelsClient
+from stirling_sdg.synthesis.response_cache import ResponseCache
+from stirling_sdg.utils.disk_cache import DiskCache
+from stirling_sdg.utils.exceptions import ClassificationError
+
+MESSAGES = [{"role": "user", "content": "classify"}]
+PDF_JSON = {"pages": [{"pageNumber": 1}], "textElements": []}
+
+
+def make_key(**overrides):
+    args = {
+        "model": "gpt-4o",
+        "messages": MESSAGES,
+        "temperature": 0.1,
+        "response_format": {"type": "json_object"},
+        "base_url": "https://models.example/v1",
+        "max_tokens": 4096,
+    }
+    args.update(overrides)
+    return ResponseCache.make_key(**args)
+
+
+def test_key_covers_everything_that_determines_the_response():
+    key = make_key()
+    assert make_key() == key
+    assert make_key(model="gpt-4o-mini") != key
+    assert make_key(messages=[{"role": "user", "content": "other"}]) != key
+    assert make_key(temperature=0.7) != key
+    assert make_key(response_format=None) != key
+    assert make_key(base_url="http://127.0.0.1:8799/v1") != key
+    assert make_key(max_tokens=256) != key
+
+
+def test_round_trip_and_disabled_cache(tmp_path):
+    cache = ResponseCache(tmp_path / "on", max_bytes=1024 * 1024)
+    cache.put("k", '{"variable_fields": []}')
+    assert cache.get("k") == '{"variable_fields": []}'
+    assert cache.get("missing") is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    disabled = ResponseCache(tmp_path / "off", max_bytes=1024 * 1024, enabled=False)
+    disabled.put("k", "x")
+    assert disabled.get("k") is None
+    assert not (tmp_path / "off").exists()
+
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    cache = DiskCache(tmp_path, max_bytes=250)
+    for i, key in enumerate(["a", "b"]):
+        cache.put(key, b"x" * 100)
+        os.utime(cache.entry_path(key), (1000 + i, 1000 + i))
+
+    # A hit makes "a" the most recently used entry
+    assert cache.get("a") == b"x" * 100
+    cache.put("c", b"x" * 100)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+@pytest.fixture
+def client(tmp_path):
+    settings = Settings(
+        groq_api_key="test",
+        github_token="test",
+        cache_dir=tmp_path / "cache",
+        log_file=tmp_path / "test.log",
+    )
+    return GitHubModelsClient(settings)
+
+
+def stub_responses(client, monkeypatch, responses):
+    calls = []
+
+    def chat_completion(**kwargs):
+        calls.append(kwargs)
+        return responses[len(calls) - 1]
+
+    monkeypatch.setattr(client, "chat_completion", chat_completion)
+    return calls
+
+
+def test_unparseable_classification_is_not_cached(client, monkeypatch):
+    calls = stub_responses(client, monkeypatch, ["not json", '{"variable_fields": []}'])
+
+    with pytest.raises(ClassificationError):
+        client.classify_content(PDF_JSON)
+    assert not list(client.response_cache.cache_dir.glob("*.json"))
+
+    result = client.classify_content(PDF_JSON)
+    assert result["variable_fields"] == []
+    assert len(calls) == 2
+
+
+def test_parsed_classification_is_served_from_cache(client, monkeypatch):
+    calls = stub_responses(client, monkeypatch, ['{"variable_fields": []}'])
+
+    first = client.classify_content(PDF_JSON)
+    second = client.classify_content(PDF_JSON)
+
+    assert first == second
+    assert len(calls) == 1
+
+
+def test_unparseable_async_classification_is_not_cached(client, monkeypatch):
+    responses = ["{truncated", '{"variable_fields": []}']
+    calls = []
+
+    async def achat_completion(**kwargs):
+        calls.append(kwargs)
+        return responses[len(calls) - 1]
+
+    monkeypatch.setattr(client, "achat_completion", achat_completion)
+
+    with pytest.raises(ClassificationError):
+        asyncio.run(client.aclassify_content(PDF_JSON))
+    assert asyncio.run(client.aclassify_content(PDF_JSON))["variable_fields"] == []
+    assert asyncio.run(client.aclassify_content(PDF_JSON))["variable_fields"] == []
+    assert len(calls) == 2
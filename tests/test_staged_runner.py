@@ -0,0 +1,195 @@
+"""Staged batch execution: shared render pool and failure handling."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import fitz
+import pytest
+
+from stirling_sdg.pipeline.stages import RenderPool, StagedBatchRunner
+from stirling_sdg.stirling.direct_edit_client import DirectEditClient
+from stirling_sdg.utils.exceptions import SynthesisError
+
+TEMPLATE = {
+    "type": "direct_edit",
+    "variable_fields": [
+        {"text": "John Smith", "fieldType": "patient_name", "dataType": "string"},
+    ],
+}
+
+
+class StubGithubClient:
+    def records_per_request(self, field_count):
+        return 2
+
+
+class StubGenerator:
+    """Returns numbered names; optionally fails on the given call."""
+
+    def __init__(self, fail_on=None, error=None):
+        self.github_client = StubGithubClient()
+        self.calls = 0
+        self.fail_on = fail_on
+        self.error = error
+
+    def generate_batch(self, template, count):
+        self.calls += 1
+        if self.calls == self.fail_on:
+            raise self.error
+        return [{"patient_name": f"Jane Roe {self.calls}"} for _ in range(count)]
+
+
+@pytest.fixture
+def source_pdf(tmp_path):
+    path = tmp_path / "form.pdf"
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 100), "Name: John Smith", fontsize=11)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.fixture
+def renderer_args(source_pdf):
+    template = dict(TEMPLATE)
+    with DirectEditClient(source_pdf) as client:
+        template["replacement_plan"] = client.compile_plan(template)
+    return (template, source_pdf, None, None, source_pdf.read_bytes(), None)
+
+
+def run_batch(renderer_args, output_dir, count, **kwargs):
+    output_dir.mkdir()
+    runner = StagedBatchRunner(
+        kwargs.pop("generator", StubGenerator()), renderer_args[0], renderer_args, **kwargs
+    )
+    return runner.run(output_dir, count)
+
+
+def test_render_pool_workers_persist_across_batches(tmp_path, renderer_args):
+    pool = RenderPool(2)
+    try:
+        first = run_batch(renderer_args, tmp_path / "a", 5, render_pool=pool)
+        workers = set(pool._executor._processes)
+        second = run_batch(renderer_args, tmp_path / "b", 3, render_pool=pool)
+
+        assert [path.name for path in first] == [f"variation_{i:04d}.pdf" for i in range(1, 6)]
+        assert len(second) == 3
+        assert set(pool._executor._processes) == workers
+        # Spooled renderer arguments are released with their batch
+        assert not list(pool._spool_dir.iterdir())
+        with fitz.open(second[0]) as doc:
+            assert "Jane Roe" in doc[0].get_text()
+    finally:
+        pool.shutdown()
+    assert not pool._spool_dir.exists()
+
+
+class BrokenExecutor:
+    """Executor whose pool dies after the first submit."""
+
+    def __init__(self):
+        self.inner = ThreadPoolExecutor(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, fn, *args):
+        self.submitted += 1
+        if self.submitted > 1:
+            raise BrokenProcessPool("worker died")
+        return self.inner.submit(fn, *args)
+
+    def shutdown(self, wait=True):
+        self.inner.shutdown(wait=wait)
+
+
+def run_in_thread(target, timeout=20):
+    """Run target; fail instead of hanging the test run if it does not finish."""
+    outcome = {}
+
+    def run():
+        try:
+            outcome["result"] = target()
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "batch did not finish"
+    return outcome
+
+
+def synthesis_threads():
+    return [t for t in threading.enumerate() if t.name.startswith("synthesis-")]
+
+
+def test_render_stage_failure_stops_producers(tmp_path, renderer_args, monkeypatch):
+    executor = BrokenExecutor()
+    monkeypatch.setattr(StagedBatchRunner, "_create_executor", lambda self: executor)
+    generator = StubGenerator()
+
+    outcome = run_in_thread(
+        lambda: run_batch(
+            renderer_args,
+            tmp_path / "out",
+            200,
+            generator=generator,
+            render_workers=2,
+            synthesis_workers=3,
+            queue_size=1,
+        )
+    )
+
+    assert isinstance(outcome.get("error"), BrokenProcessPool)
+    # Producers blocked on the full render queue gave up instead of leaking
+    deadline = time.monotonic() + 5
+    while synthesis_threads() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not synthesis_threads()
+    # ...and stopped asking the LLM for records nobody will render
+    assert generator.calls < 100
+
+
+def test_synthesis_error_finishes_with_partial_results(tmp_path, renderer_args):
+    generator = StubGenerator(fail_on=2, error=SynthesisError("quota exhausted"))
+
+    outcome = run_in_thread(
+        lambda: run_batch(
+            renderer_args, tmp_path / "out", 10, generator=generator, renderer=None, queue_size=1
+        )
+    )
+
+    # The first request's two records were rendered; nothing after the failure
+    assert [path.name for path in outcome["result"]] == ["variation_0001.pdf", "variation_0002.pdf"]
+    assert generator.calls == 2
+    assert not list((tmp_path / "out").glob("*.part"))
+
+
+def test_render_errors_are_reported_per_variation(tmp_path, renderer_args, monkeypatch):
+    from stirling_sdg.pipeline.workers import VariationRenderer
+
+    render_timed = VariationRenderer.render_timed
+
+    def flaky_render(self, synthetic_data, output_path):
+        if output_path.name.startswith("variation_0002"):
+            raise RuntimeError("font missing")
+        return render_timed(self, synthetic_data, output_path)
+
+    monkeypatch.setattr(VariationRenderer, "render_timed", flaky_render)
+    results = []
+
+    paths = run_batch(
+        renderer_args,
+        tmp_path / "out",
+        4,
+        on_result=lambda index, path, error: results.append((index, error)),
+    )
+
+    assert [path.name for path in paths] == [
+        "variation_0001.pdf",
+        "variation_0003.pdf",
+        "variation_0004.pdf",
+    ]
+    assert sorted(results) == [(0, None), (1, "font missing"), (2, None), (3, None)]
+    assert not list((tmp_path / "out").glob("*.part"))
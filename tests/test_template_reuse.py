@@ -0,0 +1,132 @@
+"""Applying a saved direct-edit template to a different document."""
+
+import json
+from pathlib import Path
+
+import fitz
+import pytest
+
+from stirling_sdg.config.settings import Settings
+from stirling_sdg.pipeline.orchestrator import PipelineOrchestrator
+from stirling_sdg.stirling.direct_edit_client import DirectEditClient
+from stirling_sdg.utils.disk_cache import file_digest
+
+
+def make_pdf(path: Path, lines: list) -> Path:
+    """Write a one-page PDF with (x, y, text) lines."""
+    doc = fitz.open()
+    page = doc.new_page()
+    for x, y, text in lines:
+        page.insert_text((x, y), text, fontsize=11)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def page_text(path: Path) -> str:
+    with fitz.open(path) as doc:
+        return doc[0].get_text()
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    settings = Settings(
+        groq_api_key="test",
+        github_token="test",
+        auto_template_match=False,
+        data_dir=tmp_path / "data",
+        input_dir=tmp_path / "input",
+        output_dir=tmp_path / "output",
+        cache_dir=tmp_path / "cache",
+        config_dir=tmp_path / "configs",
+        log_file=tmp_path / "test.log",
+    )
+    orchestrator = PipelineOrchestrator(settings)
+    orchestrator.generator.generate_batch = lambda template, count: [
+        {"patient_name": "Jane Roe", "email": "x@example.org"} for _ in range(count)
+    ]
+    return orchestrator
+
+
+def test_template_plan_recompiled_for_other_document(tmp_path, orchestrator):
+    a_pdf = make_pdf(tmp_path / "a.pdf", [
+        (72, 100, "Name: John Smith"),
+        (72, 130, "Email: js@a.io"),
+    ])
+    # Same field values as a.pdf, at other positions and with longer neighbours
+    b_pdf = make_pdf(tmp_path / "b.pdf", [
+        (72, 100, "Patient full name: John Smith"),
+        (72, 160, "Contact email: js@a.io"),
+    ])
+
+    template = {
+        "type": "direct_edit",
+        "variable_fields": [
+            {"text": "John Smith", "fieldType": "patient_name", "dataType": "string"},
+            {"text": "js@a.io", "fieldType": "email", "dataType": "string"},
+        ],
+    }
+    with DirectEditClient(a_pdf) as client:
+        template["replacement_plan"] = client.compile_plan(template)
+    template["source_file"] = str(a_pdf.resolve())
+    template["source_digest"] = file_digest(a_pdf)
+    template_path = tmp_path / "a_template.json"
+    template_path.write_text(json.dumps(template))
+
+    assert PipelineOrchestrator._plan_is_current(template, a_pdf)
+    assert not PipelineOrchestrator._plan_is_current(template, b_pdf)
+
+    results = orchestrator.process_batch(
+        b_pdf, tmp_path / "out", num_variations=1, template_path=template_path, workers=1
+    )
+
+    text = page_text(results[0])
+    assert "John Smith" not in text
+    assert "js@a.io" not in text
+    assert "Jane Roe" in text
+    assert "x@example.org" in text
+    assert "Patient full name:" in text
+    assert "Contact email:" in text
+
+
+def test_template_plan_without_digest_is_stale(tmp_path):
+    a_pdf = make_pdf(tmp_path / "a.pdf", [(72, 100, "Name: John Smith")])
+    template = {"type": "direct_edit", "replacement_plan": {"pages": {}}, "source_file": str(a_pdf)}
+
+    assert not PipelineOrchestrator._plan_is_current(template, a_pdf)
+
+
+def test_cached_template_is_not_mutated(tmp_path, orchestrator, monkeypatch):
+    # Enough text for the detector to treat the page as a digital PDF
+    filler = [(72, 130 + 20 * i, "Lorem ipsum dolor sit amet, consectetur " * 2) for i in range(30)]
+    make_pdf(tmp_path / "a.pdf", [(72, 100, "Name: John Smith")] + filler)
+    orchestrator.classifier.classify = lambda simplified: {
+        "variable_fields": [
+            {"text": "John Smith", "fieldType": "patient_name", "dataType": "string"},
+        ],
+    }
+    compiled = []
+    compile_plan = DirectEditClient.compile_plan
+
+    def counting_compile_plan(self, template):
+        compiled.append(template)
+        return compile_plan(self, template)
+
+    monkeypatch.setattr(DirectEditClient, "compile_plan", counting_compile_plan)
+    monkeypatch.chdir(tmp_path)
+    orchestrator.document_cache_size = 4
+
+    # The same file by relative and absolute path shares one cache entry
+    for input_path in (Path("a.pdf"), tmp_path / "a.pdf"):
+        orchestrator.process_batch(input_path, tmp_path / "out", num_variations=1, workers=1)
+
+    assert len(compiled) == 1
+    (template, _, _), = orchestrator._documents.values()
+    assert template["source_file"] == str((tmp_path / "a.pdf").resolve())
+    assert PipelineOrchestrator._plan_is_current(template, Path("a.pdf"))
+
+    # A stale plan is recompiled into a copy; the cached template is left alone
+    template["source_digest"] = "stale"
+    orchestrator.process_batch(Path("a.pdf"), tmp_path / "out", num_variations=1, workers=1)
+    assert len(compiled) == 2
+    assert template["source_digest"] == "stale"